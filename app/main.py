@@ -1,27 +1,90 @@
 from __future__ import annotations
 
-import csv
-import io
+import asyncio
+import hashlib
 import json
-from contextlib import asynccontextmanager
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import AsyncExitStack, asynccontextmanager
 from datetime import UTC, datetime
-from typing import Any
-from uuid import UUID
+from pathlib import Path
+from typing import Any, TypeVar
+from uuid import UUID, uuid4
 
-from fastapi import Depends, FastAPI, HTTPException, Query
-from fastapi.responses import JSONResponse, Response
+from fastapi import BackgroundTasks, Depends, FastAPI, Header, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from sqlalchemy import desc, func, select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, sessionmaker
 
+from sentinel.archive import (
+    ArchiveIntegrityError,
+    ArchiveView,
+    archive_view,
+    clear_archive_views,
+)
+from sentinel.async_db import (
+    AsyncSession,
+    async_db_available,
+    async_db_enabled,
+    async_session_factory,
+    dispose_async_engines,
+    run_write_async,
+)
 from sentinel.db import DB_PATH, get_db_session
-from sentinel.events import EventType
-from sentinel.hashing import canonical_json, submission_hash
-from sentinel.intelligence.evidence_analyzer import run_evidence_analysis
-from sentinel.models import Case, Contractor, Submission, SubmissionEvent
+from sentinel.events import STATUS_NEUTRAL_EVENT_TYPES, EventType
+from sentinel.exports import (
+    EXPORT_DIR,
+    EXPORT_MEDIA_TYPES,
+    acompress_chunks,
+    aiter_export_chunks,
+    available_compressions,
+    iter_export_chunks,
+    negotiate_compression,
+    parse_byte_range,
+    resolve_compression_level,
+)
+from sentinel.hashing import canonical_json, canonical_submission_payload, submission_hash
+from sentinel.intelligence.address_index import DbAddressIndex, page_addresses
+from sentinel.intelligence.enrichment import ENRICHMENT_DIR, shared_enricher
+from sentinel.intelligence.evidence_analyzer import (
+    ANALYSIS_DEADLINE_SECONDS,
+    fetch_evidence_async,
+    run_evidence_analysis,
+    shutdown_analysis_pool,
+)
+from sentinel.intelligence.evidence_store import (
+    EVIDENCE_DIR,
+    DeferredRuleMemo,
+    EvidenceStore,
+    attach_evidence,
+)
+from sentinel.intelligence.models import EvidenceAnalysisResult
+from sentinel.models import (
+    RELIABILITY_GLOBAL_SCOPE,
+    ArchivedSubmission,
+    Case,
+    CaseArchive,
+    Contractor,
+    ExportJob,
+    Submission,
+    SubmissionEvent,
+    SubmissionEvidence,
+    claim_address,
+    same_address_submissions,
+)
+from sentinel.reliability import contractor_reliability_map
 from sentinel.schemas import (
+    CaseEventFeed,
+    CaseEventResponse,
     CaseResponse,
+    CaseStatusEnum,
     ContractorResponse,
     CreateCaseRequest,
+    CreateExportJobRequest,
+    EvidenceAddressItem,
+    EvidencePageAddresses,
+    ExportJobResponse,
+    ExportJobStatusEnum,
     ExportRecord,
     ManagerActionRequest,
     SubmissionDetail,
@@ -37,13 +100,41 @@ from sentinel.scoring import (
     compute_contractor_reliability,
     compute_triage_priority,
 )
-from sentinel.validation import validate_submission
+from sentinel.sharding import (
+    ROUTE_KINDS,
+    add_route,
+    case_shard_ids,
+    dispose_shard_engines,
+    route_for,
+    shard_evidence_dir,
+    shard_for_case,
+    shard_session_factory,
+    sharding_enabled,
+)
+from sentinel.snapshots import case_states_as_of
+from sentinel.validation import normalize_address, normalize_chain, validate_submission
+from sentinel.write_pipeline import (
+    pipeline_enabled,
+    pipeline_for,
+    pipeline_stats,
+    run_write,
+    shutdown_write_pipelines,
+)
+
+T = TypeVar("T")
 
 
 @asynccontextmanager
 async def lifespan(_: FastAPI):
+    if async_db_enabled() and not async_db_available():
+        raise RuntimeError('SENTINEL_ASYNC_DB=1 requires: pip install ".[async]"')
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
     yield
+    await dispose_async_engines()
+    shutdown_write_pipelines()
+    dispose_shard_engines()
+    clear_archive_views()
+    shutdown_analysis_pool()
 
 
 app = FastAPI(title="Sentinel-Ops API", version="0.3.0", lifespan=lifespan)
@@ -56,6 +147,192 @@ ACTION_TO_EVENT = {
     "request_more_evidence": EventType.REQUEST_MORE_EVIDENCE.value,
 }
 
+EXPORT_PROGRESS_INTERVAL = 100
+EXPORT_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+CASE_EVENT_PAGE_SIZE = 500
+CASE_EVENT_PAGE_LIMIT = 5000
+
+
+class RequestDb:
+    """Database access for one request.
+
+    Handlers hand it sync functions of a :class:`Session`. With ``SENTINEL_ASYNC_DB=1`` they run
+    on an :class:`AsyncSession` (aiosqlite) through ``run_sync``, so a request waiting on the
+    database holds no threadpool thread; otherwise they run on the request's sync session in the
+    threadpool.
+
+    In sharded mode (``SENTINEL_SHARD_MODE``) the request's database is the shard its case,
+    submission or export job is routed to, and ``catalog`` is the main database (contractors and
+    routes). Unsharded, ``catalog`` is the request's database itself and ``shard_id`` is None.
+    """
+
+    archived = False
+
+    def __init__(
+        self,
+        session: Session,
+        async_session: AsyncSession | None = None,
+        *,
+        stack: AsyncExitStack | None = None,
+        catalog: RequestDb | None = None,
+        shard_id: str | None = None,
+    ) -> None:
+        self.session = session
+        self.async_session = async_session
+        self.stack = stack
+        self.catalog = catalog or self
+        self.shard_id = shard_id
+
+    @property
+    def is_async(self) -> bool:
+        return self.async_session is not None
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        if self.async_session is None:
+            return await run_in_threadpool(fn, self.session, *args)
+        return await self.async_session.run_sync(fn, *args)
+
+    async def get(self, model: type[T], ident: str) -> T | None:
+        return await self.run(lambda session: session.get(model, ident))
+
+    async def scalar(self, statement: Any) -> Any:
+        return await self.run(lambda session: session.scalar(statement))
+
+    async def scalars(self, statement: Any) -> list[Any]:
+        return await self.run(lambda session: list(session.scalars(statement)))
+
+    async def write(self, work: Callable[[Session], T]) -> T:
+        """:func:`run_write`; on the async path a queued write is awaited, not blocked on."""
+        if self.async_session is None:
+            return await self.run(run_write, work)
+        if pipeline_enabled():
+            return await asyncio.wrap_future(pipeline_for(self.session.get_bind()).enqueue(work))
+        return await run_write_async(self.async_session, work)
+
+    async def open_shard(self, shard_id: str) -> RequestDb:
+        """The shard ``shard_id``, open until the request ends."""
+        factory = await run_in_threadpool(shard_session_factory, shard_id)
+        session = self.stack.enter_context(factory())
+        return await _open_request_db(self.stack, session, catalog=self.catalog, shard_id=shard_id)
+
+    async def for_new_case(self, case_id: str) -> RequestDb:
+        """Where a new case is stored: its shard (routed in the catalog first), or ``self``."""
+        if not sharding_enabled():
+            return self
+        shard_id = shard_for_case(case_id)
+        await self.catalog.write(lambda session: add_route(session, "case", case_id, shard_id))
+        return await self.open_shard(shard_id)
+
+    async def add_route(self, kind: str, key: str) -> None:
+        """Route a new row of this shard (no-op unsharded); written before the row itself."""
+        if self.shard_id is not None:
+            shard_id = self.shard_id
+            await self.catalog.write(lambda session: add_route(session, kind, key, shard_id))
+
+    async def case_shards(self) -> list[RequestDb]:
+        """Every database holding cases, for queries that fan out across them."""
+        if not sharding_enabled():
+            return [self]
+        shard_ids = await self.catalog.run(case_shard_ids)
+        return [await self.open_shard(shard_id) for shard_id in shard_ids]
+
+    async def open_archive(self, archive: CaseArchive) -> ArchiveRequestDb:
+        """Read-only view of an archived case, loaded from its Parquet files."""
+        try:
+            view = await self.run(archive_view, archive)
+        except ArchiveIntegrityError as exc:
+            raise HTTPException(status_code=500, detail="case_archive_corrupt") from exc
+        except RuntimeError as exc:
+            raise HTTPException(status_code=503, detail="case_archive_unavailable") from exc
+        session = self.stack.enter_context(view.session_factory())
+        return ArchiveRequestDb(
+            view, session, stack=self.stack, catalog=self.catalog, shard_id=self.shard_id
+        )
+
+
+class ArchiveRequestDb(RequestDb):
+    """Database access for a request reading an archived case (see :mod:`sentinel.archive`).
+
+    Handlers run unchanged on the case's in-memory view; its single connection is shared, so
+    calls are serialized. Writes are refused with 409 ``case_archived``.
+    """
+
+    archived = True
+
+    def __init__(self, view: ArchiveView, session: Session, **kwargs: Any) -> None:
+        super().__init__(session, **kwargs)
+        self.view = view
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        def locked() -> T:
+            with self.view.lock:
+                return fn(self.session, *args)
+
+        return await run_in_threadpool(locked)
+
+    async def write(self, work: Callable[[Session], T]) -> T:
+        raise HTTPException(status_code=409, detail="case_archived")
+
+
+async def _open_request_db(stack: AsyncExitStack, session: Session, **kwargs: Any) -> RequestDb:
+    async_session = None
+    if async_db_enabled():
+        factory = async_session_factory(session.get_bind())
+        async_session = await stack.enter_async_context(factory())
+    return RequestDb(session, async_session, stack=stack, **kwargs)
+
+
+def _path_key(path_params: dict[str, str]) -> tuple[str, str] | None:
+    """``(kind, id)`` of the case, submission or export job a request addresses."""
+    for param, kind in ROUTE_KINDS.items():
+        if param in path_params:
+            try:
+                return kind, str(UUID(path_params[param]))
+            except ValueError:
+                return None
+    return None
+
+
+def _request_shard(catalog: Session, path_key: tuple[str, str]) -> str | None:
+    return route_for(catalog, *path_key)
+
+
+def _request_archive(db: Session, path_key: tuple[str, str]) -> CaseArchive | None:
+    kind, key = path_key
+    if kind == "submission":
+        key = db.scalar(
+            select(ArchivedSubmission.case_id).where(ArchivedSubmission.submission_id == key)
+        )
+    elif kind != "case":
+        return None
+    return db.get(CaseArchive, key) if key is not None else None
+
+
+async def get_request_db(
+    request: Request, db: Session = Depends(get_db_session)
+) -> AsyncIterator[RequestDb]:
+    """Wraps :func:`get_db_session` (and test overrides of it): the async session opens the
+    same database through its async driver. In sharded mode that database is the catalog, and a
+    request for a routed case, submission or export job gets its shard; an unrouted id stays on
+    the catalog, whose lookups then 404. Reads of an archived case are served from its archive;
+    any other request for it gets 409 ``case_archived``."""
+    async with AsyncExitStack() as stack:
+        request_db = await _open_request_db(stack, db)
+        path_key = _path_key(dict(request.path_params))
+        if path_key is None:
+            yield request_db
+            return
+        if sharding_enabled():
+            shard_id = await request_db.run(_request_shard, path_key)
+            if shard_id is not None:
+                request_db = await request_db.open_shard(shard_id)
+        archive = await request_db.run(_request_archive, path_key)
+        if archive is not None:
+            if request.method != "GET":
+                raise HTTPException(status_code=409, detail="case_archived")
+            request_db = await request_db.open_archive(archive)
+        yield request_db
+
 
 def _create_event(
     db: Session,
@@ -75,24 +352,61 @@ def _create_event(
     return event
 
 
-def _get_latest_event_type(db: Session, submission_id: str) -> str:
+def _as_of_criteria(as_of_seq: int | None) -> list[Any]:
+    return [] if as_of_seq is None else [SubmissionEvent.seq <= as_of_seq]
+
+
+def _resolve_as_of_seq(db: Session, as_of: str | None) -> int | None:
+    """Translate an ``as_of`` query value (ledger seq or ISO-8601 time) into a ledger seq."""
+    if as_of is None:
+        return None
+    if as_of.isdigit():
+        return int(as_of)
+    try:
+        moment = datetime.fromisoformat(as_of)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail="invalid_as_of") from exc
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=UTC)
+    seq = db.scalar(
+        select(func.max(SubmissionEvent.seq)).where(
+            SubmissionEvent.created_at <= moment.astimezone(UTC)
+        )
+    )
+    return seq or 0
+
+
+def _get_latest_event_type(
+    db: Session,
+    submission_id: str,
+    as_of_seq: int | None = None,
+) -> str:
     latest = db.scalar(
         select(SubmissionEvent.event_type)
-        .where(SubmissionEvent.submission_id == submission_id)
-        .order_by(desc(SubmissionEvent.created_at))
+        .where(
+            SubmissionEvent.submission_id == submission_id,
+            SubmissionEvent.event_type.not_in(STATUS_NEUTRAL_EVENT_TYPES),
+            *_as_of_criteria(as_of_seq),
+        )
+        .order_by(desc(SubmissionEvent.seq))
         .limit(1)
     )
     return latest or "INGESTED"
 
 
-def _latest_validated_payload(db: Session, submission_id: str) -> dict[str, Any]:
+def _latest_validated_payload(
+    db: Session,
+    submission_id: str,
+    as_of_seq: int | None = None,
+) -> dict[str, Any]:
     event = db.scalar(
         select(SubmissionEvent)
         .where(
             SubmissionEvent.submission_id == submission_id,
             SubmissionEvent.event_type == "VALIDATED",
+            *_as_of_criteria(as_of_seq),
         )
-        .order_by(desc(SubmissionEvent.created_at))
+        .order_by(desc(SubmissionEvent.seq))
         .limit(1)
     )
     if event is None:
@@ -104,8 +418,11 @@ def _latest_event_type_map_for_case(db: Session, case_id: str) -> dict[str, str]
     latest_events = db.execute(
         select(SubmissionEvent.submission_id, SubmissionEvent.event_type)
         .join(Submission, Submission.submission_id == SubmissionEvent.submission_id)
-        .where(Submission.case_id == case_id)
-        .order_by(SubmissionEvent.submission_id, desc(SubmissionEvent.created_at))
+        .where(
+            Submission.case_id == case_id,
+            SubmissionEvent.event_type.not_in(STATUS_NEUTRAL_EVENT_TYPES),
+        )
+        .order_by(SubmissionEvent.submission_id, desc(SubmissionEvent.seq))
     ).all()
 
     latest_by_submission: dict[str, str] = {}
@@ -115,7 +432,47 @@ def _latest_event_type_map_for_case(db: Session, case_id: str) -> dict[str, str]
     return latest_by_submission
 
 
-def _submission_with_scores(db: Session, submission: Submission) -> SubmissionListItem:
+def _lifetime_reliability(db: Session, contractor_id: str, as_of_seq: int | None) -> float:
+    contractor_accepted = db.scalar(
+        select(func.count())
+        .select_from(SubmissionEvent)
+        .join(Submission, Submission.submission_id == SubmissionEvent.submission_id)
+        .where(
+            Submission.contractor_id == contractor_id,
+            SubmissionEvent.event_type == "APPROVED",
+            *_as_of_criteria(as_of_seq),
+        )
+    )
+    contractor_rejected = db.scalar(
+        select(func.count())
+        .select_from(SubmissionEvent)
+        .join(Submission, Submission.submission_id == SubmissionEvent.submission_id)
+        .where(
+            Submission.contractor_id == contractor_id,
+            SubmissionEvent.event_type == "REJECTED",
+            *_as_of_criteria(as_of_seq),
+        )
+    )
+    return compute_contractor_reliability(contractor_accepted or 0, contractor_rejected or 0)
+
+
+def _submission_with_scores(
+    db: Session,
+    submission: Submission,
+    as_of_seq: int | None = None,
+    latest_event_type: str | None = None,
+    contractor_reliability: float | None = None,
+) -> SubmissionListItem:
+    existing: list[Any] = []
+    if as_of_seq is not None:
+        existing.append(
+            Submission.submission_id.in_(
+                select(SubmissionEvent.submission_id).where(
+                    SubmissionEvent.event_type == EventType.INGESTED.value,
+                    SubmissionEvent.seq <= as_of_seq,
+                )
+            )
+        )
     total_for_address = db.scalar(
         select(func.count())
         .select_from(Submission)
@@ -123,6 +480,7 @@ def _submission_with_scores(db: Session, submission: Submission) -> SubmissionLi
             Submission.case_id == submission.case_id,
             Submission.chain == submission.chain,
             Submission.address == submission.address,
+            *existing,
         )
     )
     matching_same_label = db.scalar(
@@ -133,36 +491,20 @@ def _submission_with_scores(db: Session, submission: Submission) -> SubmissionLi
             Submission.chain == submission.chain,
             Submission.address == submission.address,
             Submission.scam_type == submission.scam_type,
+            *existing,
         )
     )
 
-    contractor_accepted = db.scalar(
-        select(func.count())
-        .select_from(SubmissionEvent)
-        .join(Submission, Submission.submission_id == SubmissionEvent.submission_id)
-        .where(
-            Submission.contractor_id == submission.contractor_id,
-            SubmissionEvent.event_type == "APPROVED",
-        )
-    )
-    contractor_rejected = db.scalar(
-        select(func.count())
-        .select_from(SubmissionEvent)
-        .join(Submission, Submission.submission_id == SubmissionEvent.submission_id)
-        .where(
-            Submission.contractor_id == submission.contractor_id,
-            SubmissionEvent.event_type == "REJECTED",
-        )
-    )
+    if contractor_reliability is None:
+        contractor_reliability = _lifetime_reliability(db, submission.contractor_id, as_of_seq)
 
-    validation_payload = _latest_validated_payload(db, submission.submission_id)
+    validation_payload = _latest_validated_payload(db, submission.submission_id, as_of_seq)
     is_duplicate = bool(validation_payload.get("duplicate_of"))
     is_conflicted = bool(validation_payload.get("conflict_with"))
 
     consensus = compute_consensus_score(matching_same_label or 0, total_for_address or 0)
-    reliability = compute_contractor_reliability(contractor_accepted or 0, contractor_rejected or 0)
     triage_priority = compute_triage_priority(
-        contractor_reliability=reliability,
+        contractor_reliability=contractor_reliability,
         consensus_score=consensus,
         confidence_score=submission.confidence_score,
     )
@@ -178,7 +520,8 @@ def _submission_with_scores(db: Session, submission: Submission) -> SubmissionLi
         confidence_score=submission.confidence_score,
         created_at=submission.created_at,
         submission_hash=submission.submission_hash,
-        latest_event_type=_get_latest_event_type(db, submission.submission_id),
+        latest_event_type=latest_event_type
+        or _get_latest_event_type(db, submission.submission_id, as_of_seq),
         is_duplicate=is_duplicate,
         is_conflicted=is_conflicted,
         triage_priority=triage_priority,
@@ -186,39 +529,56 @@ def _submission_with_scores(db: Session, submission: Submission) -> SubmissionLi
 
 
 @app.get("/health")
-def healthcheck() -> dict[str, str]:
+async def healthcheck() -> dict[str, str]:
     return {"status": "ok"}
 
 
+@app.get("/metrics/write-pipeline")
+async def write_pipeline_metrics() -> dict[str, Any]:
+    return {"enabled": pipeline_enabled(), "pipelines": pipeline_stats()}
+
+
 @app.post("/cases", response_model=CaseResponse)
-def create_case(
+async def create_case(
     payload: CreateCaseRequest,
-    db: Session = Depends(get_db_session),
+    db: RequestDb = Depends(get_request_db),
 ) -> CaseResponse:
     start, deadline = derive_case_times(payload.start_time, payload.deadline_time)
-    case = Case(
-        title=payload.title,
-        priority=payload.priority.value,
-        start_time=start,
-        deadline_time=deadline,
-        status="OPEN",
-    )
-    db.add(case)
-    db.commit()
-    db.refresh(case)
-    return CaseResponse(
-        case_id=UUID(case.case_id),
-        title=case.title,
-        priority=case.priority,
-        start_time=case.start_time,
-        deadline_time=case.deadline_time,
-        status=case.status,
-    )
+    case_id = str(uuid4())
+    db = await db.for_new_case(case_id)
+
+    def insert_case(session: Session) -> CaseResponse:
+        case = Case(
+            case_id=case_id,
+            title=payload.title,
+            priority=payload.priority.value,
+            start_time=start,
+            deadline_time=deadline,
+            status="OPEN",
+        )
+        session.add(case)
+        session.commit()
+        session.refresh(case)
+        return CaseResponse(
+            case_id=UUID(case.case_id),
+            title=case.title,
+            priority=case.priority,
+            start_time=case.start_time,
+            deadline_time=case.deadline_time,
+            status=case.status,
+        )
+
+    return await db.run(insert_case)
 
 
 @app.get("/cases", response_model=list[CaseResponse])
-def list_cases(db: Session = Depends(get_db_session)) -> list[CaseResponse]:
-    rows = db.scalars(select(Case).order_by(desc(Case.start_time))).all()
+async def list_cases(db: RequestDb = Depends(get_request_db)) -> list[CaseResponse]:
+    statement = select(Case).order_by(desc(Case.start_time))
+    shards = await db.case_shards()
+    results = await asyncio.gather(*(shard.scalars(statement) for shard in shards))
+    rows = [row for shard_rows in results for row in shard_rows]
+    if len(shards) > 1:
+        rows.sort(key=lambda row: row.start_time, reverse=True)
     return [
         CaseResponse(
             case_id=UUID(row.case_id),
@@ -233,8 +593,8 @@ def list_cases(db: Session = Depends(get_db_session)) -> list[CaseResponse]:
 
 
 @app.get("/contractors", response_model=list[ContractorResponse])
-def list_contractors(db: Session = Depends(get_db_session)) -> list[ContractorResponse]:
-    rows = db.scalars(select(Contractor).order_by(Contractor.created_at)).all()
+async def list_contractors(db: RequestDb = Depends(get_request_db)) -> list[ContractorResponse]:
+    rows = await db.scalars(select(Contractor).order_by(Contractor.created_at))
     return [
         ContractorResponse(
             contractor_id=UUID(row.contractor_id),
@@ -246,178 +606,335 @@ def list_contractors(db: Session = Depends(get_db_session)) -> list[ContractorRe
 
 
 @app.post("/cases/{case_id}/submit", response_model=SubmitResponse)
-def submit_intelligence(
+async def submit_intelligence(
     case_id: UUID,
     payload: SubmitRequest,
-    db: Session = Depends(get_db_session),
+    db: RequestDb = Depends(get_request_db),
 ) -> SubmitResponse:
-    case = db.get(Case, str(case_id))
+    case = await db.get(Case, str(case_id))
     if case is None:
         raise HTTPException(status_code=404, detail="case_not_found")
+    if case.status == CaseStatusEnum.CLOSED.value:
+        raise HTTPException(status_code=409, detail="case_closed")
 
-    contractor = db.get(Contractor, str(payload.contractor_id))
-    if contractor is None:
+    if await db.catalog.get(Contractor, str(payload.contractor_id)) is None:
         raise HTTPException(status_code=404, detail="contractor_not_found")
 
     incoming_payload = payload.model_dump(by_alias=True, mode="json")
-    existing_same_case = db.scalars(
-        select(Submission).where(Submission.case_id == str(case_id))
-    ).all()
-
-    validation = validate_submission(
-        chain=payload.chain.value,
-        address=payload.address,
-        source_url=str(payload.source_url),
-        scam_type=payload.scam_type.value,
-        existing_same_case=existing_same_case,
-    )
-
-    canonical_payload = {
-        "case_id": str(case_id),
-        "payload": incoming_payload,
-        "normalized_chain": validation.normalized_chain,
-        "normalized_address": validation.normalized_address,
-    }
-
-    submission = Submission(
-        case_id=str(case_id),
-        contractor_id=str(payload.contractor_id),
-        chain=validation.normalized_chain,
-        address=validation.normalized_address,
-        scam_type=payload.scam_type.value,
-        source_url=str(payload.source_url),
-        confidence_score=payload.confidence_score,
-        raw_payload_json=canonical_json(incoming_payload),
-        submission_hash=submission_hash(canonical_payload),
-    )
-    db.add(submission)
-    db.flush()
+    chain = normalize_chain(payload.chain.value)
+    address = normalize_address(payload.address)
+
+    # Slow I/O first, outside the write transaction: nothing below depends on other
+    # submissions, so the address claim is held only for the short ledger writes.
+    enricher = shared_enricher(ENRICHMENT_DIR)
+    enrichments = await enricher.enrich(chain, address) if enricher is not None else None
+    fetched = None
+    if db.is_async:
+        fetched = await fetch_evidence_async(str(payload.source_url), ANALYSIS_DEADLINE_SECONDS)
+
+    def analyze(
+        session: Session,
+    ) -> tuple[EvidenceAnalysisResult | None, dict[str, Any], DeferredRuleMemo]:
+        memo = DeferredRuleMemo(session)
+        try:
+            evidence = run_evidence_analysis(
+                address=address,
+                scam_type=payload.scam_type.value,
+                source_url=str(payload.source_url),
+                memo=memo,
+                address_index=DbAddressIndex(session),
+                fetched=fetched,
+            )
+            return evidence, evidence.to_payload(), memo
+        except Exception as exc:  # defensive: ingestion should not fail if analysis fails
+            return (
+                None,
+                {
+                    "evidence_score": 0.0,
+                    "address_found": False,
+                    "classification_supported": False,
+                    "source_reachable": False,
+                    "notes": [f"Analyzer failed safely: {type(exc).__name__}"],
+                },
+                memo,
+            )
 
-    _create_event(
-        db,
-        submission_id=submission.submission_id,
-        event_type=EventType.INGESTED.value,
-        payload={"submission_hash": submission.submission_hash},
-        actor=str(payload.contractor_id),
-    )
+    evidence, evidence_payload, memo = await db.run(analyze)
+    evidence_store = EvidenceStore(shard_evidence_dir(EVIDENCE_DIR, db.shard_id))
+    submission_id = str(uuid4())
+    await db.add_route("submission", submission_id)
+
+    def record_submission(session: Session) -> tuple[str, str, dict[str, Any]]:
+        claim_address(session, case_id=str(case_id), chain=chain, address=address)
+        # Re-checked under the write lock: archiving a closed case must not miss a submission.
+        status = session.scalar(select(Case.status).where(Case.case_id == str(case_id)))
+        if status == CaseStatusEnum.CLOSED.value:
+            raise HTTPException(status_code=409, detail="case_closed")
+        validation = validate_submission(
+            chain=payload.chain.value,
+            address=payload.address,
+            source_url=str(payload.source_url),
+            scam_type=payload.scam_type.value,
+            existing_same_case=same_address_submissions(
+                session, case_id=str(case_id), chain=chain, address=address
+            ),
+        )
 
-    validation_payload = {
-        "passed": validation.passed,
-        "reasons": validation.reasons,
-        "normalized_chain": validation.normalized_chain,
-        "normalized_address": validation.normalized_address,
-        "duplicate_of": validation.duplicate_of,
-        "conflict_with": validation.conflict_with,
-    }
-    _create_event(
-        db,
-        submission_id=submission.submission_id,
-        event_type=EventType.VALIDATED.value,
-        payload=validation_payload,
-        actor="system",
-    )
+        canonical_payload = canonical_submission_payload(
+            case_id=str(case_id),
+            payload=incoming_payload,
+            normalized_chain=validation.normalized_chain,
+            normalized_address=validation.normalized_address,
+        )
 
-    try:
-        evidence = run_evidence_analysis(
+        submission = Submission(
+            submission_id=submission_id,
+            case_id=str(case_id),
+            contractor_id=str(payload.contractor_id),
+            chain=validation.normalized_chain,
             address=validation.normalized_address,
             scam_type=payload.scam_type.value,
             source_url=str(payload.source_url),
+            confidence_score=payload.confidence_score,
+            raw_payload_json=canonical_json(incoming_payload),
+            submission_hash=submission_hash(canonical_payload),
         )
-        evidence_payload = evidence.to_payload()
-    except Exception as exc:  # defensive: ingestion should not fail if analysis fails
-        evidence_payload = {
-            "evidence_score": 0.0,
-            "address_found": False,
-            "classification_supported": False,
-            "source_reachable": False,
-            "notes": [f"Analyzer failed safely: {type(exc).__name__}"],
+        session.add(submission)
+        session.flush()
+
+        _create_event(
+            session,
+            submission_id=submission.submission_id,
+            event_type=EventType.INGESTED.value,
+            payload={"submission_hash": submission.submission_hash},
+            actor=str(payload.contractor_id),
+        )
+
+        validation_payload = {
+            "passed": validation.passed,
+            "reasons": validation.reasons,
+            "normalized_chain": validation.normalized_chain,
+            "normalized_address": validation.normalized_address,
+            "duplicate_of": validation.duplicate_of,
+            "conflict_with": validation.conflict_with,
         }
+        _create_event(
+            session,
+            submission_id=submission.submission_id,
+            event_type=EventType.VALIDATED.value,
+            payload=validation_payload,
+            actor="system",
+        )
 
-    _create_event(
-        db,
-        submission_id=submission.submission_id,
-        event_type=EventType.EVIDENCE_ANALYZED.value,
-        payload=evidence_payload,
-        actor="system",
-    )
+        if enrichments is not None:
+            _create_event(
+                session,
+                submission_id=submission.submission_id,
+                event_type=EventType.ENRICHED.value,
+                payload={"providers": [result.to_payload() for result in enrichments]},
+                actor="system",
+            )
 
-    if validation.conflict_with:
+        memo.write_to(session)
+        if evidence is not None and evidence.evidence_text_hash:
+            attach_evidence(
+                session,
+                evidence_store,
+                submission.submission_id,
+                evidence.evidence_text,
+                evidence.evidence_text_hash,
+            )
         _create_event(
-            db,
+            session,
             submission_id=submission.submission_id,
-            event_type=EventType.CONFLICTED.value,
-            payload={"conflict_with": validation.conflict_with},
+            event_type=EventType.EVIDENCE_ANALYZED.value,
+            payload=evidence_payload,
             actor="system",
         )
 
-    db.commit()
+        if validation.conflict_with:
+            _create_event(
+                session,
+                submission_id=submission.submission_id,
+                event_type=EventType.CONFLICTED.value,
+                payload={"conflict_with": validation.conflict_with},
+                actor="system",
+            )
+
+        session.flush()
+        return submission.submission_id, submission.submission_hash, validation_payload
+
+    recorded_id, recorded_hash, validation_payload = await db.write(record_submission)
 
     return SubmitResponse(
-        submission_id=UUID(submission.submission_id),
-        submission_hash=submission.submission_hash,
+        submission_id=UUID(recorded_id),
+        submission_hash=recorded_hash,
         validation=ValidationResult(**validation_payload),
     )
 
 
 @app.get("/cases/{case_id}/submissions", response_model=list[SubmissionListItem])
-def list_case_submissions(
+async def list_case_submissions(
     case_id: UUID,
-    db: Session = Depends(get_db_session),
+    as_of: str | None = Query(default=None),
+    reliability: str = Query(default="lifetime", pattern="^(lifetime|case|global)$"),
+    db: RequestDb = Depends(get_request_db),
 ) -> list[SubmissionListItem]:
-    case = db.get(Case, str(case_id))
-    if case is None:
-        raise HTTPException(status_code=404, detail="case_not_found")
+    if reliability == "global" and sharding_enabled():
+        raise HTTPException(status_code=400, detail="reliability_global_unsupported")
+
+    def read(session: Session) -> list[SubmissionListItem]:
+        case = session.get(Case, str(case_id))
+        if case is None:
+            raise HTTPException(status_code=404, detail="case_not_found")
+
+        submissions = session.scalars(
+            select(Submission)
+            .where(Submission.case_id == str(case_id))
+            .order_by(desc(Submission.created_at))
+        ).all()
+        as_of_seq = _resolve_as_of_seq(session, as_of)
+        if reliability != "lifetime":
+            if as_of_seq is not None:
+                raise HTTPException(status_code=400, detail="reliability_as_of_unsupported")
+            scope = str(case_id) if reliability == "case" else RELIABILITY_GLOBAL_SCOPE
+            reliabilities = contractor_reliability_map(
+                session, {row.contractor_id for row in submissions}, scope
+            )
+            return [
+                _submission_with_scores(
+                    session, row, contractor_reliability=reliabilities[row.contractor_id]
+                )
+                for row in submissions
+            ]
+        if as_of_seq is None:
+            return [_submission_with_scores(session, row) for row in submissions]
+
+        states = case_states_as_of(session, str(case_id), as_of_seq)
+        return [
+            _submission_with_scores(
+                session,
+                row,
+                as_of_seq=as_of_seq,
+                latest_event_type=states[row.submission_id].latest_event_type,
+            )
+            for row in submissions
+            if row.submission_id in states
+        ]
 
-    submissions = db.scalars(
-        select(Submission)
-        .where(Submission.case_id == str(case_id))
-        .order_by(desc(Submission.created_at))
-    ).all()
-    return [_submission_with_scores(db, row) for row in submissions]
+    return await db.run(read)
+
+
+@app.get("/cases/{case_id}/events", response_model=CaseEventFeed)
+async def list_case_events(
+    case_id: UUID,
+    after_seq: int = Query(default=0, ge=0),
+    limit: int = Query(default=CASE_EVENT_PAGE_SIZE, ge=1, le=CASE_EVENT_PAGE_LIMIT),
+    db: RequestDb = Depends(get_request_db),
+) -> CaseEventFeed:
+    def read(session: Session) -> CaseEventFeed:
+        case = session.get(Case, str(case_id))
+        if case is None:
+            raise HTTPException(status_code=404, detail="case_not_found")
+
+        events = session.scalars(
+            select(SubmissionEvent)
+            .join(Submission, Submission.submission_id == SubmissionEvent.submission_id)
+            .where(Submission.case_id == str(case_id), SubmissionEvent.seq > after_seq)
+            .order_by(SubmissionEvent.seq)
+            .limit(limit)
+        ).all()
+        return CaseEventFeed(
+            events=[
+                CaseEventResponse(
+                    event_id=UUID(event.event_id),
+                    seq=event.seq,
+                    submission_id=UUID(event.submission_id),
+                    event_type=event.event_type,
+                    event_payload_json=json.loads(event.event_payload_json),
+                    created_at=event.created_at,
+                    actor=event.actor,
+                )
+                for event in events
+            ],
+            next_after_seq=events[-1].seq if events else after_seq,
+        )
+
+    return await db.run(read)
 
 
 @app.get("/submissions/{submission_id}", response_model=SubmissionDetail)
-def get_submission_detail(
+async def get_submission_detail(
     submission_id: UUID,
-    db: Session = Depends(get_db_session),
+    db: RequestDb = Depends(get_request_db),
 ) -> SubmissionDetail:
-    submission = db.get(Submission, str(submission_id))
-    if submission is None:
-        raise HTTPException(status_code=404, detail="submission_not_found")
+    def read(session: Session) -> SubmissionDetail:
+        submission = session.get(Submission, str(submission_id))
+        if submission is None:
+            raise HTTPException(status_code=404, detail="submission_not_found")
+
+        events = session.scalars(
+            select(SubmissionEvent)
+            .where(SubmissionEvent.submission_id == str(submission_id))
+            .order_by(SubmissionEvent.seq)
+        ).all()
 
-    events = db.scalars(
-        select(SubmissionEvent)
-        .where(SubmissionEvent.submission_id == str(submission_id))
-        .order_by(SubmissionEvent.created_at)
-    ).all()
+        return SubmissionDetail(
+            item=_submission_with_scores(session, submission),
+            events=[
+                SubmissionEventResponse(
+                    event_id=UUID(event.event_id),
+                    seq=event.seq,
+                    event_type=event.event_type,
+                    event_payload_json=json.loads(event.event_payload_json),
+                    created_at=event.created_at,
+                    actor=event.actor,
+                )
+                for event in events
+            ],
+        )
 
-    return SubmissionDetail(
-        item=_submission_with_scores(db, submission),
-        events=[
-            SubmissionEventResponse(
-                event_id=UUID(event.event_id),
-                event_type=event.event_type,
-                event_payload_json=json.loads(event.event_payload_json),
-                created_at=event.created_at,
-                actor=event.actor,
-            )
-            for event in events
-        ],
-    )
+    return await db.run(read)
+
+
+@app.get("/submissions/{submission_id}/evidence/addresses", response_model=EvidencePageAddresses)
+async def get_submission_evidence_addresses(
+    submission_id: UUID,
+    db: RequestDb = Depends(get_request_db),
+) -> EvidencePageAddresses:
+    def read(session: Session) -> EvidencePageAddresses:
+        submission = session.get(Submission, str(submission_id))
+        if submission is None:
+            raise HTTPException(status_code=404, detail="submission_not_found")
+        evidence = session.get(SubmissionEvidence, submission.submission_id)
+        if evidence is None:
+            raise HTTPException(status_code=404, detail="evidence_not_found")
+
+        own_address = submission.address.lower()
+        return EvidencePageAddresses(
+            submission_id=submission_id,
+            content_hash=evidence.content_hash,
+            addresses=[
+                EvidenceAddressItem(chain=chain, address=address)
+                for chain, address in page_addresses(session, evidence.content_hash)
+                if address.lower() != own_address
+            ],
+        )
+
+    return await db.run(read)
 
 
 @app.post("/submissions/{submission_id}/actions")
-def submission_action(
+async def submission_action(
     submission_id: UUID,
     payload: ManagerActionRequest,
-    db: Session = Depends(get_db_session),
+    db: RequestDb = Depends(get_request_db),
 ) -> JSONResponse:
-    submission = db.get(Submission, str(submission_id))
-    if submission is None:
+    if await db.get(Submission, str(submission_id)) is None:
         raise HTTPException(status_code=404, detail="submission_not_found")
 
     if payload.action.value == "approve":
-        has_validated_event = db.scalar(
+        has_validated_event = await db.scalar(
             select(func.count())
             .select_from(SubmissionEvent)
             .where(
@@ -429,103 +946,353 @@ def submission_action(
             raise HTTPException(status_code=409, detail="submission_not_validated")
 
     event_type = ACTION_TO_EVENT[payload.action.value]
-    event = _create_event(
-        db,
-        submission_id=str(submission_id),
-        event_type=event_type,
-        payload={"notes": payload.notes or "", "action": payload.action.value},
-        actor=payload.actor,
-    )
-    db.commit()
+
+    def record_action(session: Session) -> str:
+        event = _create_event(
+            session,
+            submission_id=str(submission_id),
+            event_type=event_type,
+            payload={"notes": payload.notes or "", "action": payload.action.value},
+            actor=payload.actor,
+        )
+        session.flush()
+        return event.event_id
+
+    event_id = await db.write(record_action)
 
     return JSONResponse(
         {
             "ok": True,
-            "event_id": event.event_id,
+            "event_id": event_id,
             "submission_id": str(submission_id),
             "event_type": event_type,
         }
     )
 
 
+def _approved_submission_ids(
+    db: Session,
+    case_id: str,
+    as_of_seq: int | None = None,
+) -> list[str]:
+    if as_of_seq is None:
+        latest_event_types = _latest_event_type_map_for_case(db, case_id)
+    else:
+        latest_event_types = {
+            sid: state.latest_event_type
+            for sid, state in case_states_as_of(db, case_id, as_of_seq).items()
+        }
+    return [
+        sid
+        for sid, event_type in latest_event_types.items()
+        if event_type in {EventType.APPROVED.value, EventType.EXPORTED.value}
+    ]
+
+
+def _iter_export_records(
+    db: Session,
+    case_id: str,
+    approved_ids: list[str],
+    as_of_seq: int | None = None,
+) -> Iterator[ExportRecord]:
+    if len(approved_ids) == 0:
+        return
+    approved_rows = db.scalars(
+        select(Submission).where(
+            Submission.case_id == case_id,
+            Submission.submission_id.in_(approved_ids),
+        )
+    ).all()
+    for row in approved_rows:
+        yield ExportRecord(
+            case_id=UUID(row.case_id),
+            submission_id=UUID(row.submission_id),
+            contractor_id=UUID(row.contractor_id),
+            created_at=row.created_at,
+            chain=row.chain,
+            address=row.address,
+            scam_type=row.scam_type,
+            source_url=row.source_url,
+            confidence_score=row.confidence_score,
+            submission_hash=row.submission_hash,
+            validation_summary=_latest_validated_payload(db, row.submission_id, as_of_seq),
+        )
+
+
+def _record_exported_event(db: Session, submission_id: str, export_format: str) -> None:
+    _create_event(
+        db,
+        submission_id=submission_id,
+        event_type=EventType.EXPORTED.value,
+        payload={"format": export_format, "exported_at": datetime.now(UTC).isoformat()},
+        actor="system",
+    )
+
+
 @app.get("/cases/{case_id}/export")
-def export_case(
+async def export_case(
     case_id: UUID,
     format: str = Query(default="json", pattern="^(json|csv)$"),
-    db: Session = Depends(get_db_session),
+    compression: str | None = Query(default=None, pattern="^(none|gzip|zstd)$"),
+    compression_level: int | None = Query(default=None),
+    as_of: str | None = Query(default=None),
+    accept_encoding: str | None = Header(default=None, alias="Accept-Encoding"),
+    db: RequestDb = Depends(get_request_db),
 ) -> Response:
-    case = db.get(Case, str(case_id))
-    if case is None:
+    if await db.get(Case, str(case_id)) is None:
         raise HTTPException(status_code=404, detail="case_not_found")
+    if db.archived and as_of is None:
+        # A current export appends EXPORTED events; archived cases only serve as_of exports.
+        raise HTTPException(status_code=409, detail="case_archived")
+
+    if compression is None:
+        codec = negotiate_compression(accept_encoding)
+    elif compression == "none":
+        codec = None
+    elif compression not in available_compressions():
+        raise HTTPException(status_code=400, detail="compression_unavailable")
+    else:
+        codec = compression
+    level = None
+    if codec is not None:
+        try:
+            level = resolve_compression_level(codec, compression_level)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    def resolve_export(session: Session) -> tuple[int | None, list[str]]:
+        as_of_seq = _resolve_as_of_seq(session, as_of)
+        return as_of_seq, _approved_submission_ids(session, str(case_id), as_of_seq)
+
+    as_of_seq, approved_ids = await db.run(resolve_export)
+
+    def load_batch(session: Session, batch: list[str]) -> list[ExportRecord]:
+        return list(_iter_export_records(session, str(case_id), batch, as_of_seq))
+
+    def record_exported(exported_ids: list[str]) -> Callable[[Session], None]:
+        def work(session: Session) -> None:
+            for submission_id in exported_ids:
+                _record_exported_event(session, submission_id, format)
+
+        return work
+
+    async def record_batches() -> AsyncIterator[list[ExportRecord]]:
+        # Records are read a batch at a time while the response streams. Historical (as_of)
+        # exports are read-only views; current ones append EXPORTED events in one short
+        # transaction once every record has been streamed.
+        exported_ids: list[str] = []
+        for start in range(0, len(approved_ids), EXPORT_PROGRESS_INTERVAL):
+            batch = await db.run(load_batch, approved_ids[start : start + EXPORT_PROGRESS_INTERVAL])
+            exported_ids.extend(str(record.submission_id) for record in batch)
+            yield batch
+        if exported_ids and as_of_seq is None:
+            await db.write(record_exported(exported_ids))
+
+    chunks = aiter_export_chunks(record_batches(), format)
+    now = datetime.now(UTC).strftime("%Y%m%d%H%M%S")
+    headers = {}
+    if format == "csv":
+        headers["Content-Disposition"] = f"attachment; filename=sentinel_export_{now}.csv"
+    if codec is None:
+        return StreamingResponse(chunks, media_type=EXPORT_MEDIA_TYPES[format], headers=headers)
+    headers.update({"Content-Encoding": codec, "Vary": "Accept-Encoding"})
+    return StreamingResponse(
+        acompress_chunks(chunks, codec, level),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers=headers,
+    )
 
-    latest_event_types = _latest_event_type_map_for_case(db, str(case_id))
-    approved_ids = [
-        sid
-        for sid, event_type in latest_event_types.items()
-        if event_type in {EventType.APPROVED.value, EventType.EXPORTED.value}
-    ]
-    if len(approved_ids) == 0:
-        records: list[ExportRecord] = []
+
+def _export_job_response(job: ExportJob) -> ExportJobResponse:
+    total = job.total_records
+    if job.status == ExportJobStatusEnum.COMPLETED.value:
+        progress = 1.0
     else:
-        approved_rows = db.scalars(
-            select(Submission).where(
-                Submission.case_id == str(case_id),
-                Submission.submission_id.in_(approved_ids),
-            )
-        ).all()
-        records = []
-        for row in approved_rows:
-            validation_summary = _latest_validated_payload(db, row.submission_id)
-            records.append(
-                ExportRecord(
-                    case_id=UUID(row.case_id),
-                    submission_id=UUID(row.submission_id),
-                    contractor_id=UUID(row.contractor_id),
-                    created_at=row.created_at,
-                    chain=row.chain,
-                    address=row.address,
-                    scam_type=row.scam_type,
-                    source_url=row.source_url,
-                    confidence_score=row.confidence_score,
-                    submission_hash=row.submission_hash,
-                    validation_summary=validation_summary,
-                )
-            )
-            _create_event(
-                db,
-                submission_id=row.submission_id,
-                event_type=EventType.EXPORTED.value,
-                payload={"format": format, "exported_at": datetime.now(UTC).isoformat()},
-                actor="system",
-            )
-        db.commit()
-
-    if format == "json":
-        return JSONResponse([record.model_dump(mode="json") for record in records])
-
-    output = io.StringIO()
-    writer = csv.DictWriter(
-        output,
-        fieldnames=[
-            "case_id",
-            "submission_id",
-            "contractor_id",
-            "created_at",
-            "chain",
-            "address",
-            "scam_type",
-            "source_url",
-            "confidence_score",
-            "submission_hash",
-            "validation_summary",
-        ],
+        progress = round(job.written_records / total, 4) if total > 0 else 0.0
+    completed = job.status == ExportJobStatusEnum.COMPLETED.value
+    return ExportJobResponse(
+        job_id=UUID(job.job_id),
+        case_id=UUID(job.case_id),
+        format=job.format,
+        status=job.status,
+        total_records=job.total_records,
+        written_records=job.written_records,
+        progress=progress,
+        byte_size=job.byte_size,
+        file_sha256=job.file_sha256,
+        download_url=f"/exports/{job.job_id}/download" if completed else None,
+        error=job.error,
+        created_at=job.created_at,
+        completed_at=job.completed_at,
     )
-    writer.writeheader()
-    for record in records:
-        row = record.model_dump(mode="json")
-        row["validation_summary"] = canonical_json(row["validation_summary"])
-        writer.writerow(row)
 
-    now = datetime.now(UTC).strftime("%Y%m%d%H%M%S")
-    headers = {"Content-Disposition": f"attachment; filename=sentinel_export_{now}.csv"}
-    return Response(content=output.getvalue(), media_type="text/csv", headers=headers)
+
+def _run_export_job(session_factory: sessionmaker[Session], job_id: str) -> None:
+    with session_factory() as db:
+        job = db.get(ExportJob, job_id)
+        if job is None:
+            return
+        export_dir = Path(EXPORT_DIR).resolve()
+        final_path = export_dir / f"{job.job_id}.{job.format}"
+        part_path = final_path.with_name(final_path.name + ".part")
+        try:
+            job.status = ExportJobStatusEnum.RUNNING.value
+            approved_ids = _approved_submission_ids(db, job.case_id)
+            job.total_records = len(approved_ids)
+            db.commit()
+
+            export_dir.mkdir(parents=True, exist_ok=True)
+            exported_ids: list[str] = []
+
+            def tracked_records() -> Iterator[ExportRecord]:
+                for record in _iter_export_records(db, job.case_id, approved_ids):
+                    exported_ids.append(str(record.submission_id))
+                    yield record
+                    if len(exported_ids) % EXPORT_PROGRESS_INTERVAL == 0:
+                        job.written_records = len(exported_ids)
+                        db.commit()
+
+            digest = hashlib.sha256()
+            byte_size = 0
+            with part_path.open("wb") as handle:
+                for chunk in iter_export_chunks(tracked_records(), job.format):
+                    encoded = chunk.encode("utf-8")
+                    digest.update(encoded)
+                    byte_size += len(encoded)
+                    handle.write(encoded)
+            part_path.replace(final_path)
+
+            for submission_id in exported_ids:
+                _record_exported_event(db, submission_id, job.format)
+            job.written_records = len(exported_ids)
+            job.total_records = len(exported_ids)
+            job.file_path = str(final_path)
+            job.byte_size = byte_size
+            job.file_sha256 = digest.hexdigest()
+            job.status = ExportJobStatusEnum.COMPLETED.value
+            job.completed_at = datetime.now(UTC)
+            db.commit()
+        except Exception as exc:  # defensive: a failed job must surface in its status record
+            db.rollback()
+            part_path.unlink(missing_ok=True)
+            job.status = ExportJobStatusEnum.FAILED.value
+            job.error = f"export_failed: {type(exc).__name__}"
+            job.completed_at = datetime.now(UTC)
+            db.commit()
+
+
+@app.post("/cases/{case_id}/exports", response_model=ExportJobResponse, status_code=202)
+async def create_export_job(
+    case_id: UUID,
+    payload: CreateExportJobRequest,
+    background_tasks: BackgroundTasks,
+    db: RequestDb = Depends(get_request_db),
+) -> ExportJobResponse:
+    if await db.get(Case, str(case_id)) is None:
+        raise HTTPException(status_code=404, detail="case_not_found")
+    job_id = str(uuid4())
+    await db.add_route("export_job", job_id)
+
+    def insert_job(session: Session) -> ExportJob:
+        job = ExportJob(
+            job_id=job_id,
+            case_id=str(case_id),
+            format=payload.format.value,
+            status=ExportJobStatusEnum.PENDING.value,
+            total_records=0,
+            written_records=0,
+        )
+        session.add(job)
+        session.commit()
+        session.refresh(job)
+        return job
+
+    job = await db.run(insert_job)
+    # The job runs after the response on a sync session, in the threadpool, on either path.
+    session_factory = sessionmaker(
+        bind=db.session.get_bind(),
+        autoflush=False,
+        autocommit=False,
+        expire_on_commit=False,
+        class_=Session,
+    )
+    background_tasks.add_task(_run_export_job, session_factory, job.job_id)
+    return _export_job_response(job)
+
+
+@app.get("/exports/{job_id}", response_model=ExportJobResponse)
+async def get_export_job(
+    job_id: UUID,
+    db: RequestDb = Depends(get_request_db),
+) -> ExportJobResponse:
+    job = await db.get(ExportJob, str(job_id))
+    if job is None:
+        raise HTTPException(status_code=404, detail="export_job_not_found")
+    return _export_job_response(job)
+
+
+def _iter_file_range(path: Path, start: int, end: int) -> Iterator[bytes]:
+    remaining = end - start + 1
+    with path.open("rb") as handle:
+        handle.seek(start)
+        while remaining > 0:
+            chunk = handle.read(min(EXPORT_DOWNLOAD_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+@app.get("/exports/{job_id}/download")
+async def download_export_job(
+    job_id: UUID,
+    range_header: str | None = Header(default=None, alias="Range"),
+    if_range: str | None = Header(default=None, alias="If-Range"),
+    db: RequestDb = Depends(get_request_db),
+) -> Response:
+    job = await db.get(ExportJob, str(job_id))
+    if job is None:
+        raise HTTPException(status_code=404, detail="export_job_not_found")
+    if job.status != ExportJobStatusEnum.COMPLETED.value or not job.file_path:
+        raise HTTPException(status_code=409, detail="export_not_ready")
+
+    path = Path(job.file_path)
+    if not path.is_file():
+        raise HTTPException(status_code=410, detail="export_file_missing")
+
+    size = path.stat().st_size
+    etag = f'"{job.file_sha256}"'
+    headers = {
+        "Accept-Ranges": "bytes",
+        "ETag": etag,
+        "Content-Disposition": f"attachment; filename=sentinel_export_{job.job_id}.{job.format}",
+    }
+    media_type = EXPORT_MEDIA_TYPES[job.format]
+
+    byte_range = None
+    if range_header and (if_range is None or if_range == etag):
+        try:
+            byte_range = parse_byte_range(range_header, size)
+        except ValueError:
+            return Response(
+                status_code=416,
+                headers={**headers, "Content-Range": f"bytes */{size}"},
+            )
+
+    if byte_range is None:
+        headers["Content-Length"] = str(size)
+        return StreamingResponse(
+            _iter_file_range(path, 0, size - 1),
+            media_type=media_type,
+            headers=headers,
+        )
+
+    start, end = byte_range
+    headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    headers["Content-Length"] = str(end - start + 1)
+    return StreamingResponse(
+        _iter_file_range(path, start, end),
+        status_code=206,
+        media_type=media_type,
+        headers=headers,
+    )
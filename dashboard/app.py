@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import json
 import os
+import time
 from datetime import UTC, datetime
 
 import pandas as pd
@@ -8,6 +10,8 @@ import requests
 import streamlit as st
 
 API_BASE = os.getenv("SENTINEL_API_BASE", "http://localhost:8000")
+EXPORT_POLL_SECONDS = 1.0
+EXPORT_POLL_LIMIT = 300
 MANUAL_REVIEW_TYPES = {"CONFLICTED", "ESCALATED", "REQUEST_MORE_EVIDENCE"}
 
 st.set_page_config(page_title="Sentinel-Ops", layout="wide")
@@ -33,6 +37,38 @@ def _post_json(path: str, payload: dict):
     return response.json()
 
 
+def _wait_for_export_job(job_id: str) -> dict:
+    for _ in range(EXPORT_POLL_LIMIT):
+        job = _get_json(f"/exports/{job_id}")
+        if job["status"] in {"COMPLETED", "FAILED"}:
+            return job
+        time.sleep(EXPORT_POLL_SECONDS)
+    raise TimeoutError(f"export job {job_id} did not finish")
+
+
+def _download_export(job: dict, max_attempts: int = 5) -> bytes:
+    """Download a finished export, resuming with Range requests after broken connections."""
+    buffer = bytearray()
+    for _ in range(max_attempts):
+        headers = {"If-Range": f'"{job["file_sha256"]}"'}
+        if buffer:
+            headers["Range"] = f"bytes={len(buffer)}-"
+        try:
+            with requests.get(
+                f"{API_BASE}{job['download_url']}", headers=headers, stream=True, timeout=30
+            ) as response:
+                response.raise_for_status()
+                if response.status_code == 200:
+                    buffer.clear()
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    buffer.extend(chunk)
+        except requests.RequestException:
+            continue
+        if len(buffer) >= job["byte_size"]:
+            return bytes(buffer)
+    raise RuntimeError(f"export download incomplete after {max_attempts} attempts")
+
+
 def _leaderboard_frame(submissions: list[dict], contractors: list[dict]) -> pd.DataFrame:
     if not submissions:
         return pd.DataFrame(
@@ -64,7 +100,11 @@ def _leaderboard_frame(submissions: list[dict], contractors: list[dict]) -> pd.D
 
 
 def _find_latest_evidence_event(events: list[dict]) -> dict | None:
-    evidence_events = [event for event in events if event["event_type"] == "EVIDENCE_ANALYZED"]
+    evidence_events = [
+        event
+        for event in events
+        if event["event_type"] in {"EVIDENCE_ANALYZED", "EVIDENCE_REANALYZED"}
+    ]
     if not evidence_events:
         return None
     return evidence_events[-1]
@@ -210,16 +250,19 @@ else:
 
 with st.expander("Export Approved Records"):
     export_format = st.radio("Format", options=["json", "csv"], horizontal=True)
-    export_url = f"{API_BASE}/cases/{selected_case['case_id']}/export?format={export_format}"
     if st.button("Run Export"):
-        response = requests.get(export_url, timeout=30)
-        response.raise_for_status()
-        if export_format == "json":
-            st.json(response.json())
+        job = _post_json(f"/cases/{selected_case['case_id']}/exports", {"format": export_format})
+        with st.spinner("Building export..."):
+            job = _wait_for_export_job(job["job_id"])
+        if job["status"] != "COMPLETED":
+            st.error(f"Export failed: {job.get('error') or 'unknown error'}")
         else:
+            data = _download_export(job)
+            if export_format == "json":
+                st.json(json.loads(data))
             st.download_button(
-                label="Download CSV",
-                data=response.text,
-                file_name="sentinel_export.csv",
-                mime="text/csv",
+                label=f"Download {export_format.upper()}",
+                data=data,
+                file_name=f"sentinel_export.{export_format}",
+                mime="application/json" if export_format == "json" else "text/csv",
             )
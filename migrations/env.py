@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from logging.config import fileConfig
 
 from alembic import context
@@ -12,6 +13,9 @@ config = context.config
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
+if os.getenv("SENTINEL_DATABASE_URL"):
+    config.set_main_option("sqlalchemy.url", os.environ["SENTINEL_DATABASE_URL"].replace("%", "%%"))
+
 target_metadata = Base.metadata
 
 
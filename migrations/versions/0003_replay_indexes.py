@@ -0,0 +1,34 @@
+"""replay indexes
+
+Revision ID: 0003_replay_indexes
+Revises: 0002_export_jobs
+Create Date: 2026-10-19 10:00:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0003_replay_indexes"
+down_revision = "0002_export_jobs"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_submissions_case_submission",
+        "submissions",
+        ["case_id", "submission_id"],
+    )
+    op.create_index(
+        "ix_submission_events_submission_created",
+        "submission_events",
+        ["submission_id", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_submission_events_submission_created", table_name="submission_events")
+    op.drop_index("ix_submissions_case_submission", table_name="submissions")
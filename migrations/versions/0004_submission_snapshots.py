@@ -0,0 +1,44 @@
+"""submission snapshots
+
+Revision ID: 0004_submission_snapshots
+Revises: 0003_replay_indexes
+Create Date: 2026-10-19 11:00:00
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0004_submission_snapshots"
+down_revision = "0003_replay_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "submission_snapshots",
+        sa.Column("snapshot_id", sa.String(length=36), nullable=False),
+        sa.Column("submission_id", sa.String(length=36), nullable=False),
+        sa.Column("case_id", sa.String(length=36), nullable=False),
+        sa.Column("event_sequence", sa.Integer(), nullable=False),
+        sa.Column("state_json", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["submission_id"], ["submissions.submission_id"]),
+        sa.ForeignKeyConstraint(["case_id"], ["cases.case_id"]),
+        sa.PrimaryKeyConstraint("snapshot_id"),
+    )
+    op.create_index(
+        "ix_submission_snapshots_submission_seq",
+        "submission_snapshots",
+        ["submission_id", "event_sequence"],
+    )
+    op.create_index("ix_submission_snapshots_case", "submission_snapshots", ["case_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_submission_snapshots_case", table_name="submission_snapshots")
+    op.drop_index("ix_submission_snapshots_submission_seq", table_name="submission_snapshots")
+    op.drop_table("submission_snapshots")
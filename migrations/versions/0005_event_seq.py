@@ -0,0 +1,95 @@
+"""monotonic event sequence
+
+Revision ID: 0005_event_seq
+Revises: 0004_submission_snapshots
+Create Date: 2026-10-19 12:00:00
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0005_event_seq"
+down_revision = "0004_submission_snapshots"
+branch_labels = None
+depends_on = None
+
+EVENT_SEQ_COUNTER = "submission_events.seq"
+
+
+def upgrade() -> None:
+    op.add_column("submission_events", sa.Column("seq", sa.Integer(), nullable=True))
+    # Existing rows get their sequence from the old (created_at, insertion) order.
+    op.execute("""
+        UPDATE submission_events
+        SET seq = (
+            SELECT ordered.seq FROM (
+                SELECT event_id, ROW_NUMBER() OVER (ORDER BY created_at, rowid) AS seq
+                FROM submission_events
+            ) AS ordered
+            WHERE ordered.event_id = submission_events.event_id
+        )
+        """)
+    with op.batch_alter_table("submission_events") as batch:
+        batch.alter_column("seq", existing_type=sa.Integer(), nullable=False)
+    op.drop_index("ix_submission_events_submission_created", table_name="submission_events")
+    op.create_index("ix_submission_events_seq", "submission_events", ["seq"], unique=True)
+    op.create_index(
+        "ix_submission_events_submission_seq",
+        "submission_events",
+        ["submission_id", "seq"],
+    )
+
+    op.create_table(
+        "ledger_counters",
+        sa.Column("name", sa.String(length=64), nullable=False),
+        sa.Column("value", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+    )
+    op.execute(
+        sa.text(
+            "INSERT INTO ledger_counters (name, value) "
+            "SELECT :name, COALESCE(MAX(seq), 0) FROM submission_events"
+        ).bindparams(name=EVENT_SEQ_COUNTER)
+    )
+
+    # Snapshots used to record how many events they covered; they now record the ledger seq
+    # of the last covered event.
+    op.execute("""
+        UPDATE submission_snapshots
+        SET event_sequence = (
+            SELECT ranked.seq FROM (
+                SELECT
+                    submission_id,
+                    seq,
+                    ROW_NUMBER() OVER (PARTITION BY submission_id ORDER BY seq) AS position
+                FROM submission_events
+            ) AS ranked
+            WHERE ranked.submission_id = submission_snapshots.submission_id
+              AND ranked.position = submission_snapshots.event_sequence
+        )
+        """)
+    op.execute("DELETE FROM submission_snapshots WHERE event_sequence IS NULL")
+
+
+def downgrade() -> None:
+    op.execute("""
+        UPDATE submission_snapshots
+        SET event_sequence = (
+            SELECT COUNT(*) FROM submission_events AS e
+            WHERE e.submission_id = submission_snapshots.submission_id
+              AND e.seq <= submission_snapshots.event_sequence
+        )
+        """)
+    op.drop_table("ledger_counters")
+    op.drop_index("ix_submission_events_submission_seq", table_name="submission_events")
+    op.drop_index("ix_submission_events_seq", table_name="submission_events")
+    op.create_index(
+        "ix_submission_events_submission_created",
+        "submission_events",
+        ["submission_id", "created_at"],
+    )
+    with op.batch_alter_table("submission_events") as batch:
+        batch.drop_column("seq")
@@ -0,0 +1,116 @@
+"""ledger hash chain and checkpoints
+
+Revision ID: 0006_ledger_hash_chain
+Revises: 0005_event_seq
+Create Date: 2026-10-19 13:00:00
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from datetime import UTC, datetime
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0006_ledger_hash_chain"
+down_revision = "0005_event_seq"
+branch_labels = None
+depends_on = None
+
+GENESIS_HASH = "0" * 64
+
+
+def _event_hash(row: sa.Row, prev_hash: str) -> str:
+    # Frozen copy of sentinel.hashing.ledger_event_hash as of this revision.
+    created_at = row.created_at
+    if isinstance(created_at, str):
+        created_at = datetime.fromisoformat(created_at)
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=UTC)
+    envelope = {
+        "case_id": row.case_id,
+        "seq": row.seq,
+        "event_id": row.event_id,
+        "submission_id": row.submission_id,
+        "event_type": row.event_type,
+        "event_payload_json": row.event_payload_json,
+        "actor": row.actor,
+        "created_at": created_at.astimezone(UTC).isoformat(),
+        "prev_hash": prev_hash,
+    }
+    canonical = json.dumps(envelope, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def upgrade() -> None:
+    op.add_column("submission_events", sa.Column("prev_hash", sa.String(length=64)))
+    op.add_column("submission_events", sa.Column("event_hash", sa.String(length=64)))
+    op.create_table(
+        "ledger_chain_heads",
+        sa.Column("case_id", sa.String(length=36), nullable=False),
+        sa.Column("head_seq", sa.Integer(), nullable=False),
+        sa.Column("head_hash", sa.String(length=64), nullable=False),
+        sa.ForeignKeyConstraint(["case_id"], ["cases.case_id"]),
+        sa.PrimaryKeyConstraint("case_id"),
+    )
+    op.create_table(
+        "ledger_checkpoints",
+        sa.Column("checkpoint_id", sa.String(length=36), nullable=False),
+        sa.Column("case_id", sa.String(length=36), nullable=False),
+        sa.Column("seq", sa.Integer(), nullable=False),
+        sa.Column("event_hash", sa.String(length=64), nullable=False),
+        sa.Column("event_count", sa.Integer(), nullable=False),
+        sa.Column("key_id", sa.String(length=16), nullable=False),
+        sa.Column("signature", sa.String(length=64), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["case_id"], ["cases.case_id"]),
+        sa.PrimaryKeyConstraint("checkpoint_id"),
+    )
+    op.create_index("ix_ledger_checkpoints_case_seq", "ledger_checkpoints", ["case_id", "seq"])
+
+    connection = op.get_bind()
+    rows = connection.execute(
+        sa.text(
+            "SELECT s.case_id, e.seq, e.event_id, e.submission_id, e.event_type, "
+            "e.event_payload_json, e.actor, e.created_at "
+            "FROM submission_events AS e JOIN submissions AS s "
+            "ON s.submission_id = e.submission_id "
+            "ORDER BY s.case_id, e.seq"
+        )
+    ).all()
+    heads: dict[str, tuple[int, str]] = {}
+    for row in rows:
+        prev_hash = heads.get(row.case_id, (0, GENESIS_HASH))[1]
+        event_hash = _event_hash(row, prev_hash)
+        connection.execute(
+            sa.text(
+                "UPDATE submission_events SET prev_hash = :prev_hash, event_hash = :event_hash "
+                "WHERE event_id = :event_id"
+            ),
+            {"prev_hash": prev_hash, "event_hash": event_hash, "event_id": row.event_id},
+        )
+        heads[row.case_id] = (row.seq, event_hash)
+    for case_id, (head_seq, head_hash) in heads.items():
+        connection.execute(
+            sa.text(
+                "INSERT INTO ledger_chain_heads (case_id, head_seq, head_hash) "
+                "VALUES (:case_id, :head_seq, :head_hash)"
+            ),
+            {"case_id": case_id, "head_seq": head_seq, "head_hash": head_hash},
+        )
+
+    with op.batch_alter_table("submission_events") as batch:
+        batch.alter_column("prev_hash", existing_type=sa.String(length=64), nullable=False)
+        batch.alter_column("event_hash", existing_type=sa.String(length=64), nullable=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_ledger_checkpoints_case_seq", table_name="ledger_checkpoints")
+    op.drop_table("ledger_checkpoints")
+    op.drop_table("ledger_chain_heads")
+    with op.batch_alter_table("submission_events") as batch:
+        batch.drop_column("event_hash")
+        batch.drop_column("prev_hash")
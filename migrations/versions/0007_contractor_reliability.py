@@ -0,0 +1,93 @@
+"""decayed contractor reliability counters
+
+Revision ID: 0007_contractor_reliability
+Revises: 0006_ledger_hash_chain
+Create Date: 2026-10-19 15:00:00
+"""
+
+from __future__ import annotations
+
+import os
+from datetime import UTC, datetime
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0007_contractor_reliability"
+down_revision = "0006_ledger_hash_chain"
+branch_labels = None
+depends_on = None
+
+GLOBAL_SCOPE = "global"
+
+
+def _as_utc(value: datetime | str) -> datetime:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "contractor_reliability",
+        sa.Column("contractor_id", sa.String(length=36), nullable=False),
+        sa.Column("scope", sa.String(length=36), nullable=False),
+        sa.Column("accepted", sa.Float(), nullable=False),
+        sa.Column("rejected", sa.Float(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["contractor_id"], ["contractors.contractor_id"]),
+        sa.PrimaryKeyConstraint("contractor_id", "scope"),
+    )
+
+    # Replay existing review outcomes in ledger order; same fold as
+    # sentinel.models.record_review_outcome as of this revision.
+    half_life = float(os.getenv("SENTINEL_RELIABILITY_HALF_LIFE_HOURS", "72")) * 3600.0
+    connection = op.get_bind()
+    rows = connection.execute(
+        sa.text(
+            "SELECT s.contractor_id, s.case_id, e.event_type, e.created_at "
+            "FROM submission_events AS e JOIN submissions AS s "
+            "ON s.submission_id = e.submission_id "
+            "WHERE e.event_type IN ('APPROVED', 'REJECTED') "
+            "ORDER BY e.seq"
+        )
+    ).all()
+    counters: dict[tuple[str, str], tuple[float, float, datetime]] = {}
+    for row in rows:
+        at = _as_utc(row.created_at)
+        for scope in (GLOBAL_SCOPE, row.case_id):
+            key = (row.contractor_id, scope)
+            accepted, rejected, updated_at = counters.get(key, (0.0, 0.0, at))
+            weight = 1.0
+            if at >= updated_at:
+                decay = 0.5 ** ((at - updated_at).total_seconds() / half_life)
+                accepted, rejected, updated_at = accepted * decay, rejected * decay, at
+            else:
+                weight = 0.5 ** ((updated_at - at).total_seconds() / half_life)
+            if row.event_type == "APPROVED":
+                accepted += weight
+            else:
+                rejected += weight
+            counters[key] = (accepted, rejected, updated_at)
+    for (contractor_id, scope), (accepted, rejected, updated_at) in counters.items():
+        connection.execute(
+            sa.text(
+                "INSERT INTO contractor_reliability "
+                "(contractor_id, scope, accepted, rejected, updated_at) "
+                "VALUES (:contractor_id, :scope, :accepted, :rejected, :updated_at)"
+            ),
+            {
+                "contractor_id": contractor_id,
+                "scope": scope,
+                "accepted": accepted,
+                "rejected": rejected,
+                "updated_at": updated_at,
+            },
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("contractor_reliability")
@@ -0,0 +1,31 @@
+"""content-addressed evidence text
+
+Revision ID: 0008_evidence_texts
+Revises: 0007_contractor_reliability
+Create Date: 2026-10-19 16:00:00
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0008_evidence_texts"
+down_revision = "0007_contractor_reliability"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "evidence_texts",
+        sa.Column("text_hash", sa.String(length=64), nullable=False),
+        sa.Column("text", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("text_hash"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("evidence_texts")
@@ -0,0 +1,147 @@
+"""content-addressed evidence store with refcounts and rule memo
+
+Revision ID: 0009_evidence_store
+Revises: 0008_evidence_texts
+Create Date: 2026-10-19 17:00:00
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+from datetime import UTC, datetime
+from pathlib import Path
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0009_evidence_store"
+down_revision = "0008_evidence_texts"
+branch_labels = None
+depends_on = None
+
+# Frozen copy of the sentinel.intelligence.evidence_store layout as of this revision.
+EVIDENCE_DIR = Path(os.getenv("SENTINEL_EVIDENCE_DIR", str(Path("data") / "evidence")))
+SUFFIXES = {"none": ".txt", "gzip": ".txt.gz", "zstd": ".txt.zst"}
+
+
+def _blob_path(text_hash: str, compression: str) -> Path:
+    return EVIDENCE_DIR / text_hash[:2] / f"{text_hash}{SUFFIXES[compression]}"
+
+
+def upgrade() -> None:
+    op.create_table(
+        "evidence_blobs",
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        sa.Column("compression", sa.String(length=16), nullable=False),
+        sa.Column("byte_size", sa.Integer(), nullable=False),
+        sa.Column("stored_size", sa.Integer(), nullable=False),
+        sa.Column("refcount", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("content_hash"),
+    )
+    op.create_table(
+        "submission_evidence",
+        sa.Column("submission_id", sa.String(length=36), nullable=False),
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        sa.ForeignKeyConstraint(["submission_id"], ["submissions.submission_id"]),
+        sa.ForeignKeyConstraint(["content_hash"], ["evidence_blobs.content_hash"]),
+        sa.PrimaryKeyConstraint("submission_id"),
+    )
+    op.create_index("ix_submission_evidence_content_hash", "submission_evidence", ["content_hash"])
+    op.create_table(
+        "evidence_rule_memo",
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        sa.Column("address", sa.String(length=256), nullable=False),
+        sa.Column("scam_type", sa.String(length=64), nullable=False),
+        sa.Column("rule_version", sa.String(length=16), nullable=False),
+        sa.Column("match_json", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("content_hash", "address", "scam_type", "rule_version"),
+    )
+
+    connection = op.get_bind()
+    # A submission references the text of its first analysis; re-analyses reuse the same text.
+    references: dict[str, str] = {}
+    for submission_id, payload_json in connection.execute(
+        sa.text(
+            "SELECT submission_id, event_payload_json FROM submission_events "
+            "WHERE event_type = 'EVIDENCE_ANALYZED' ORDER BY seq"
+        )
+    ):
+        text_hash = json.loads(payload_json or "{}").get("evidence_text_hash")
+        if text_hash:
+            references.setdefault(submission_id, text_hash)
+    refcounts: dict[str, int] = {}
+    for text_hash in references.values():
+        refcounts[text_hash] = refcounts.get(text_hash, 0) + 1
+
+    for text_hash, text in connection.execute(
+        sa.text("SELECT text_hash, text FROM evidence_texts")
+    ):
+        if text_hash not in refcounts:
+            continue
+        raw = text.encode("utf-8")
+        data = gzip.compress(raw, mtime=0)
+        path = _blob_path(text_hash, "gzip")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        connection.execute(
+            sa.text(
+                "INSERT INTO evidence_blobs "
+                "(content_hash, compression, byte_size, stored_size, refcount, created_at) "
+                "VALUES (:content_hash, 'gzip', :byte_size, :stored_size, :refcount, :created_at)"
+            ),
+            {
+                "content_hash": text_hash,
+                "byte_size": len(raw),
+                "stored_size": len(data),
+                "refcount": refcounts[text_hash],
+                "created_at": datetime.now(UTC),
+            },
+        )
+    stored = set(connection.execute(sa.text("SELECT content_hash FROM evidence_blobs")).scalars())
+    for submission_id, text_hash in references.items():
+        if text_hash in stored:
+            connection.execute(
+                sa.text(
+                    "INSERT INTO submission_evidence (submission_id, content_hash) "
+                    "VALUES (:submission_id, :content_hash)"
+                ),
+                {"submission_id": submission_id, "content_hash": text_hash},
+            )
+
+    op.drop_table("evidence_texts")
+
+
+def downgrade() -> None:
+    op.create_table(
+        "evidence_texts",
+        sa.Column("text_hash", sa.String(length=64), nullable=False),
+        sa.Column("text", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("text_hash"),
+    )
+    connection = op.get_bind()
+    for text_hash, compression, created_at in connection.execute(
+        sa.text("SELECT content_hash, compression, created_at FROM evidence_blobs")
+    ):
+        path = _blob_path(text_hash, compression)
+        if compression not in {"none", "gzip"} or not path.exists():
+            continue
+        data = path.read_bytes()
+        raw = gzip.decompress(data) if compression == "gzip" else data
+        connection.execute(
+            sa.text(
+                "INSERT INTO evidence_texts (text_hash, text, created_at) "
+                "VALUES (:text_hash, :text, :created_at)"
+            ),
+            {"text_hash": text_hash, "text": raw.decode("utf-8"), "created_at": created_at},
+        )
+
+    op.drop_table("evidence_rule_memo")
+    op.drop_index("ix_submission_evidence_content_hash", table_name="submission_evidence")
+    op.drop_table("submission_evidence")
+    op.drop_table("evidence_blobs")
@@ -0,0 +1,115 @@
+"""per-page address index for stored evidence
+
+Revision ID: 0010_evidence_addresses
+Revises: 0009_evidence_store
+Create Date: 2026-10-19 18:00:00
+"""
+
+from __future__ import annotations
+
+import gzip
+import os
+import re
+from pathlib import Path
+
+import sqlalchemy as sa
+from alembic import op
+
+try:
+    import zstandard
+except ImportError:  # zstd blobs are left unindexed and indexed on their next citation
+    zstandard = None
+
+# revision identifiers, used by Alembic.
+revision = "0010_evidence_addresses"
+down_revision = "0009_evidence_store"
+branch_labels = None
+depends_on = None
+
+# Frozen copies of the evidence store layout and the address patterns as of this revision.
+EVIDENCE_DIR = Path(os.getenv("SENTINEL_EVIDENCE_DIR", str(Path("data") / "evidence")))
+SUFFIXES = {"none": ".txt", "gzip": ".txt.gz", "zstd": ".txt.zst"}
+CHAIN_PATTERNS = {
+    "ETH": re.compile(r"^0x[a-fA-F0-9]{40}$"),
+    "BTC": re.compile(r"^(bc1|[13])[a-zA-HJ-NP-Z0-9]{25,62}$"),
+    "SOL": re.compile(r"^[1-9A-HJ-NP-Za-km-z]{32,44}$"),
+}
+SCAN_RE = re.compile(
+    "|".join(
+        rf"(?<![0-9A-Za-z])(?:{pattern.pattern[1:-1]})(?![0-9A-Za-z])"
+        for pattern in CHAIN_PATTERNS.values()
+    )
+)
+
+
+def _read_blob(text_hash: str, compression: str) -> str | None:
+    path = EVIDENCE_DIR / text_hash[:2] / f"{text_hash}{SUFFIXES.get(compression, '')}"
+    if compression not in SUFFIXES or not path.exists():
+        return None
+    data = path.read_bytes()
+    if compression == "gzip":
+        data = gzip.decompress(data)
+    elif compression == "zstd":
+        if zstandard is None:
+            return None
+        data = zstandard.ZstdDecompressor().decompress(data)
+    return data.decode("utf-8")
+
+
+def _extract(text: str) -> set[tuple[str, str]]:
+    found: set[tuple[str, str]] = set()
+    for match in SCAN_RE.finditer(text):
+        token = match.group()
+        found.update(
+            (chain, token) for chain, pattern in CHAIN_PATTERNS.items() if pattern.match(token)
+        )
+    return found
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("evidence_blobs") as batch:
+        batch.add_column(sa.Column("address_count", sa.Integer(), nullable=True))
+    op.create_table(
+        "evidence_addresses",
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        sa.Column("chain", sa.String(length=8), nullable=False),
+        sa.Column("address", sa.String(length=256), nullable=False),
+        sa.ForeignKeyConstraint(["content_hash"], ["evidence_blobs.content_hash"]),
+        sa.PrimaryKeyConstraint("content_hash", "chain", "address"),
+    )
+    op.create_index("ix_evidence_addresses_address", "evidence_addresses", ["address"])
+
+    connection = op.get_bind()
+    blobs = connection.execute(
+        sa.text("SELECT content_hash, compression FROM evidence_blobs")
+    ).all()
+    for text_hash, compression in blobs:
+        text = _read_blob(text_hash, compression)
+        if text is None:
+            continue
+        addresses = _extract(text)
+        if addresses:
+            connection.execute(
+                sa.text(
+                    "INSERT INTO evidence_addresses (content_hash, chain, address) "
+                    "VALUES (:content_hash, :chain, :address)"
+                ),
+                [
+                    {"content_hash": text_hash, "chain": chain, "address": address}
+                    for chain, address in sorted(addresses)
+                ],
+            )
+        connection.execute(
+            sa.text(
+                "UPDATE evidence_blobs SET address_count = :count "
+                "WHERE content_hash = :content_hash"
+            ),
+            {"count": len(addresses), "content_hash": text_hash},
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_evidence_addresses_address", table_name="evidence_addresses")
+    op.drop_table("evidence_addresses")
+    with op.batch_alter_table("evidence_blobs") as batch:
+        batch.drop_column("address_count")
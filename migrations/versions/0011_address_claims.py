@@ -0,0 +1,41 @@
+"""address claims for race-safe conflict detection
+
+Revision ID: 0011_address_claims
+Revises: 0010_evidence_addresses
+Create Date: 2026-10-19 19:00:00
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0011_address_claims"
+down_revision = "0010_evidence_addresses"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "address_claims",
+        sa.Column("case_id", sa.String(length=36), nullable=False),
+        sa.Column("chain", sa.String(length=8), nullable=False),
+        sa.Column("address", sa.String(length=256), nullable=False),
+        sa.Column("submission_count", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["case_id"], ["cases.case_id"]),
+        sa.PrimaryKeyConstraint("case_id", "chain", "address"),
+    )
+    op.create_index("ix_submissions_case_address", "submissions", ["case_id", "chain", "address"])
+    op.execute(
+        "INSERT INTO address_claims (case_id, chain, address, submission_count, updated_at) "
+        "SELECT case_id, chain, address, COUNT(*), MAX(created_at) FROM submissions "
+        "GROUP BY case_id, chain, address"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_submissions_case_address", table_name="submissions")
+    op.drop_table("address_claims")
@@ -0,0 +1,32 @@
+"""shard catalog routes for sharded storage mode
+
+Revision ID: 0012_shard_routes
+Revises: 0011_address_claims
+Create Date: 2026-10-19 21:00:00
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0012_shard_routes"
+down_revision = "0011_address_claims"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "shard_routes",
+        sa.Column("kind", sa.String(length=16), nullable=False),
+        sa.Column("key", sa.String(length=36), nullable=False),
+        sa.Column("shard_id", sa.String(length=64), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("kind", "key"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("shard_routes")
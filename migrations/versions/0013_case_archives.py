@@ -0,0 +1,45 @@
+"""archive records for closed cases moved to Parquet
+
+Revision ID: 0013_case_archives
+Revises: 0012_shard_routes
+Create Date: 2026-10-19 23:00:00
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0013_case_archives"
+down_revision = "0012_shard_routes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "case_archives",
+        sa.Column("case_id", sa.String(length=36), nullable=False),
+        sa.Column("archive_path", sa.String(length=512), nullable=False),
+        sa.Column("archive_sha256", sa.String(length=64), nullable=False),
+        sa.Column("submission_count", sa.Integer(), nullable=False),
+        sa.Column("event_count", sa.Integer(), nullable=False),
+        sa.Column("archived_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["case_id"], ["cases.case_id"]),
+        sa.PrimaryKeyConstraint("case_id"),
+    )
+    op.create_table(
+        "archived_submissions",
+        sa.Column("submission_id", sa.String(length=36), nullable=False),
+        sa.Column("case_id", sa.String(length=36), nullable=False),
+        sa.ForeignKeyConstraint(["case_id"], ["cases.case_id"]),
+        sa.PrimaryKeyConstraint("submission_id"),
+    )
+    op.create_index("ix_archived_submissions_case", "archived_submissions", ["case_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_archived_submissions_case", table_name="archived_submissions")
+    op.drop_table("archived_submissions")
+    op.drop_table("case_archives")
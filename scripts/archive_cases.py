@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from sentinel.archive import (
+    ARCHIVE_DIR,
+    archive_case,
+    archived_case_ids,
+    close_case,
+    verify_case_archive,
+)
+from sentinel.db import DATABASE_URL
+from sentinel.intelligence.evidence_store import EVIDENCE_DIR, EvidenceStore
+from sentinel.models import Case, CaseArchive
+from sentinel.schemas import CaseStatusEnum
+from sentinel.sharding import ledger_sessions, shard_evidence_dir
+
+
+def closed_unarchived_case_ids(db: Session) -> list[str]:
+    return list(
+        db.scalars(
+            select(Case.case_id)
+            .where(
+                Case.status == CaseStatusEnum.CLOSED.value,
+                Case.case_id.not_in(select(CaseArchive.case_id)),
+            )
+            .order_by(Case.case_id)
+        )
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Close cases and move closed cases' ledgers to Parquet archives"
+    )
+    parser.add_argument("--database-url", default=DATABASE_URL)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    close = subparsers.add_parser("close", help="mark cases CLOSED (no further submissions)")
+    close.add_argument("case_ids", nargs="+")
+
+    archive = subparsers.add_parser("archive", help="archive closed cases and drop their rows")
+    archive.add_argument("--case-id", help="limit to one case (default: every closed case)")
+    archive.add_argument("--archive-dir", type=Path, default=ARCHIVE_DIR)
+    archive.add_argument("--evidence-dir", type=Path, default=EVIDENCE_DIR)
+
+    verify = subparsers.add_parser("verify", help="check archive hashes and hash chains")
+    verify.add_argument("--case-id", help="limit to one case (default: all archived cases)")
+
+    args = parser.parse_args(argv)
+
+    # Sharded, each shard's closed cases are archived next to its own evidence store.
+    closed = dict.fromkeys(getattr(args, "case_ids", []), False)
+    archived: dict[str, dict[str, object]] = {}
+    reports = []
+    for shard_id, db in ledger_sessions(args.database_url):
+        if args.command == "close":
+            for case_id in closed:
+                closed[case_id] = close_case(db, case_id) or closed[case_id]
+        elif args.command == "archive":
+            store = EvidenceStore(shard_evidence_dir(args.evidence_dir, shard_id))
+            for case_id in closed_unarchived_case_ids(db):
+                if args.case_id not in (None, case_id):
+                    continue
+                row = archive_case(db, case_id, store, args.archive_dir)
+                archived[case_id] = {
+                    "path": row.archive_path,
+                    "sha256": row.archive_sha256,
+                    "submissions": row.submission_count,
+                    "events": row.event_count,
+                }
+        else:
+            for case_id in archived_case_ids(db):
+                if args.case_id in (None, case_id):
+                    reports.append(verify_case_archive(db, case_id))
+
+    if args.command == "close":
+        print(json.dumps({"closed": closed}, indent=2))
+        return 0 if all(closed.values()) else 1
+
+    if args.command == "archive":
+        print(json.dumps({"archived": archived, "total": len(archived)}, indent=2))
+        return 0 if args.case_id in (None, *archived) else 1
+
+    ok = all(report.ok for report in reports) and (args.case_id is None or bool(reports))
+    print(
+        json.dumps(
+            {
+                "cases": len(reports),
+                "events_checked": sum(report.events_checked for report in reports),
+                "reports": [report.to_dict() for report in reports if not report.ok],
+                "ok": ok,
+            },
+            indent=2,
+        )
+    )
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
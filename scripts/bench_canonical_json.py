@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import timeit
+from typing import Any
+from unittest import mock
+
+from sentinel import hashing
+from sentinel.hashing import canonical_json
+
+_ADDRESS = "0x" + "ab" * 20
+_ID = "5f0c1f0e-0000-4000-8000-000000000000"
+
+SAMPLES: dict[str, dict[str, Any]] = {
+    "submission": {
+        "case_id": _ID,
+        "payload": {
+            "contractor_id": _ID,
+            "blockchain": "ETH",
+            "address": _ADDRESS,
+            "scam_type": "Phishing",
+            "source_url": "https://example.com/evidence",
+            "confidence_score": 4,
+        },
+        "normalized_chain": "ETH",
+        "normalized_address": _ADDRESS,
+    },
+    "validated_event": {
+        "passed": True,
+        "reasons": [],
+        "normalized_chain": "ETH",
+        "normalized_address": _ADDRESS,
+        "duplicate_of": [],
+        "conflict_with": [_ID] * 8,
+    },
+    "evidence_event": {
+        "evidence_score": 72,
+        "supports_address": True,
+        "supports_scam_type": False,
+        "notes": ["Address found in evidence content", "Keyword match: phishing, wallet"],
+        "ratio": 0.4375,
+    },
+    "non_ascii_notes": {"notes": "Geprüft – Adresse bestätigt ✓", "action": "approve"},
+}
+
+
+def _stdlib(data: dict[str, Any]) -> str:
+    return json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+
+
+def _per_call_us(func, data: dict[str, Any], number: int) -> float:
+    return min(timeit.repeat(lambda: func(data), number=number, repeat=5)) / number * 1e6
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Microbenchmark canonical_json backends")
+    parser.add_argument("--number", type=int, default=20000, help="calls per timing run")
+    args = parser.parse_args(argv)
+
+    print(f"orjson: {'available' if hashing.orjson is not None else 'not installed'}")
+    print(f"{'payload':<18}{'json.dumps':>12}{'fallback':>12}{'canonical':>12}{'speedup':>10}")
+    for name, data in SAMPLES.items():
+        assert canonical_json(data) == _stdlib(data), name
+        baseline = _per_call_us(_stdlib, data, args.number)
+        with mock.patch.object(hashing, "orjson", None):
+            fallback = _per_call_us(canonical_json, data, args.number)
+        accelerated = _per_call_us(canonical_json, data, args.number)
+        print(
+            f"{name:<18}{baseline:>10.2f}us{fallback:>10.2f}us{accelerated:>10.2f}us"
+            f"{baseline / accelerated:>9.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest import mock
+
+from sqlalchemy import text
+
+import app.main as api_main
+from app.main import app
+from scripts.simulate_failure import (
+    _create_case,
+    _seed_contractors,
+    _setup_test_client,
+    scenario_submission_burst,
+)
+from sentinel.db import SQLITE_PROFILES
+from sentinel.intelligence import evidence_analyzer
+
+PAGE = "<p>Phishing kit drained wallet funds</p>"
+
+
+async def _fetch_page_async(*_):
+    return PAGE, True, ["Source reachable"]
+
+
+def _run_burst(db_dir: Path, profile: str, n: int) -> dict[str, float | str]:
+    db_path = db_dir / f"burst_{profile}.db"
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+    client, session_factory = _setup_test_client(db_path, profile)
+    with (
+        mock.patch.object(
+            evidence_analyzer, "fetch_evidence_html", lambda *_: (PAGE, True, ["Source reachable"])
+        ),
+        mock.patch.object(evidence_analyzer, "fetch_evidence_html_async", _fetch_page_async),
+        mock.patch.object(api_main, "EVIDENCE_DIR", db_dir / f"evidence_{profile}"),
+        client,
+    ):
+        contractors = _seed_contractors(session_factory, 50)
+        case_id = _create_case(client, title=f"Profile {profile}")
+        start = time.perf_counter()
+        burst = scenario_submission_burst(client, case_id, contractors, n)
+        elapsed = time.perf_counter() - start
+    app.dependency_overrides.clear()
+    with session_factory() as db:
+        journal_mode = db.execute(text("PRAGMA journal_mode")).scalar()
+    return {
+        "journal_mode": journal_mode,
+        "avg_latency_ms": burst.avg_latency_ms,
+        "throughput": n / elapsed,
+        "success_rate": burst.success_rate,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare SQLite profiles on the submission burst scenario"
+    )
+    parser.add_argument("--burst", type=int, default=500, help="submissions per profile")
+    parser.add_argument(
+        "--profiles", nargs="+", default=list(SQLITE_PROFILES), choices=list(SQLITE_PROFILES)
+    )
+    parser.add_argument(
+        "--db-dir", type=Path, default=None, help="directory for the benchmark databases"
+    )
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="sentinel_bench_") as scratch:
+        db_dir = args.db_dir or Path(scratch)
+        db_dir.mkdir(parents=True, exist_ok=True)
+        results = {profile: _run_burst(db_dir, profile, args.burst) for profile in args.profiles}
+
+    baseline = results[args.profiles[0]]["throughput"]
+    print(f"{'profile':<14}{'journal':>9}{'avg ms':>10}{'req/s':>10}{'speedup':>10}")
+    for profile, result in results.items():
+        print(
+            f"{profile:<14}{result['journal_mode']:>9}{result['avg_latency_ms']:>10.2f}"
+            f"{result['throughput']:>10.1f}{result['throughput'] / baseline:>9.2f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+
+from sentinel.sharding import MIGRATIONS_DIR, SHARD_DIR
+
+
+def migrate_shards(shard_dir: Path, revision: str = "head") -> list[Path]:
+    """Run ``alembic upgrade`` on every shard database in ``shard_dir``."""
+    config = Config(str(MIGRATIONS_DIR.parent / "alembic.ini"))
+    config.set_main_option("script_location", str(MIGRATIONS_DIR))
+    previous_url = os.environ.get("SENTINEL_DATABASE_URL")
+    shards = sorted(Path(shard_dir).glob("*.db"))
+    try:
+        for path in shards:
+            # migrations/env.py prefers SENTINEL_DATABASE_URL over the ini file.
+            os.environ["SENTINEL_DATABASE_URL"] = f"sqlite:///{path}"
+            command.upgrade(config, revision)
+    finally:
+        if previous_url is None:
+            os.environ.pop("SENTINEL_DATABASE_URL", None)
+        else:
+            os.environ["SENTINEL_DATABASE_URL"] = previous_url
+    return shards
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Upgrade every shard database to a revision")
+    parser.add_argument("--shard-dir", type=Path, default=SHARD_DIR)
+    parser.add_argument("--revision", default="head")
+    args = parser.parse_args(argv)
+
+    shards = migrate_shards(args.shard_dir, args.revision)
+    print(f"Upgraded {len(shards)} shard(s) in {args.shard_dir} to {args.revision}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
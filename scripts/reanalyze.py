@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
+from itertools import islice
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from sentinel.db import DATABASE_URL
+from sentinel.events import EventType
+from sentinel.hashing import canonical_json
+from sentinel.intelligence.evidence_analyzer import RuleKey, build_evidence_result
+from sentinel.intelligence.evidence_store import (
+    EVIDENCE_DIR,
+    DbRuleMemo,
+    EvidenceStore,
+    load_evidence_texts,
+)
+from sentinel.intelligence.rules import RuleMatch, evaluate_rules, rule_set_version
+from sentinel.models import Submission, SubmissionEvent
+from sentinel.sharding import ledger_sessions, shard_evidence_dir
+
+REANALYZE_BATCH_SIZE = 500
+CACHED_SOURCE_NOTES = ["Source reachable"]
+ANALYSIS_EVENT_TYPES = [EventType.EVIDENCE_ANALYZED.value, EventType.EVIDENCE_REANALYZED.value]
+REPORT_COUNTS = ["stale", "missing_text", "reanalyzed", "rules_evaluated", "score_changes"]
+
+
+class StaleAnalysis(NamedTuple):
+    submission_id: str
+    address: str
+    scam_type: str
+    rule_version: str
+    evidence_text_hash: str | None
+    evidence_score: float | None
+
+
+def stale_analyses(
+    db: Session, rule_version: str, case_id: str | None = None
+) -> list[StaleAnalysis]:
+    """Submissions whose most recent evidence analysis used another rule version.
+
+    Re-analysis appends EVIDENCE_REANALYZED events, which never become a submission's latest
+    event type, so submissions in any review state are re-scored without changing state.
+    """
+    latest = (
+        select(
+            SubmissionEvent.submission_id,
+            func.max(SubmissionEvent.seq).label("seq"),
+        )
+        .where(SubmissionEvent.event_type.in_(ANALYSIS_EVENT_TYPES))
+        .group_by(SubmissionEvent.submission_id)
+        .subquery()
+    )
+    criteria = [] if case_id is None else [Submission.case_id == case_id]
+    rows = db.execute(
+        select(
+            Submission.submission_id,
+            Submission.address,
+            Submission.scam_type,
+            SubmissionEvent.event_payload_json,
+        )
+        .join(latest, latest.c.submission_id == Submission.submission_id)
+        .join(SubmissionEvent, SubmissionEvent.seq == latest.c.seq)
+        .where(*criteria)
+        .order_by(Submission.submission_id)
+    )
+    stale: list[StaleAnalysis] = []
+    for submission_id, address, scam_type, payload_json in rows:
+        payload = json.loads(payload_json)
+        previous_version = payload.get("rule_version", "")
+        if previous_version != rule_version:
+            stale.append(
+                StaleAnalysis(
+                    submission_id,
+                    address,
+                    scam_type,
+                    previous_version,
+                    payload.get("evidence_text_hash"),
+                    payload.get("evidence_score"),
+                )
+            )
+    return stale
+
+
+def reanalyze(
+    db: Session,
+    *,
+    store: EvidenceStore | None = None,
+    case_id: str | None = None,
+    executor: str = "process",
+    workers: int | None = None,
+    batch_size: int = REANALYZE_BATCH_SIZE,
+    dry_run: bool = False,
+) -> dict[str, Any]:
+    """Re-run the rules over stored evidence text for every stale analysis, batch by batch.
+
+    No page is re-fetched: the evidence store stands in for the source. Rule outcomes are
+    memoized per (content hash, address, scam type, rule version), so a page cited by many
+    submissions is evaluated once. Each batch appends its EVIDENCE_REANALYZED events in one
+    commit.
+    """
+    started = time.perf_counter()
+    store = store or EvidenceStore(EVIDENCE_DIR)
+    current_version = rule_set_version()
+    stale = stale_analyses(db, current_version, case_id)
+    cached = [item for item in stale if item.evidence_text_hash]
+    report: dict[str, Any] = {
+        "rule_version": current_version,
+        "stale": len(stale),
+        "missing_text": len(stale) - len(cached),
+        "reanalyzed": 0,
+        "rules_evaluated": 0,
+        "score_changes": 0,
+        "dry_run": dry_run,
+    }
+    if dry_run or not cached:
+        report["elapsed_s"] = round(time.perf_counter() - started, 3)
+        return report
+
+    memo = DbRuleMemo(db)
+    pool: Executor | None = None
+    if executor == "process" and workers != 1:
+        pool = ProcessPoolExecutor(max_workers=workers)
+    elif executor == "thread" and workers != 1:
+        pool = ThreadPoolExecutor(max_workers=workers)
+    with pool or nullcontext():
+        items = iter(cached)
+        while batch := list(islice(items, batch_size)):
+            texts = load_evidence_texts(db, store, (item.evidence_text_hash for item in batch))
+            runnable = [item for item in batch if item.evidence_text_hash in texts]
+            report["missing_text"] += len(batch) - len(runnable)
+
+            keys = {
+                item.submission_id: RuleKey(
+                    item.evidence_text_hash, item.address, item.scam_type, current_version
+                )
+                for item in runnable
+            }
+            matches: dict[RuleKey, RuleMatch] = {}
+            for key in dict.fromkeys(keys.values()):
+                match = memo.get(key)
+                if match is not None:
+                    matches[key] = match
+            misses = [key for key in dict.fromkeys(keys.values()) if key not in matches]
+            evaluated = (pool.map if pool is not None else map)(
+                evaluate_rules,
+                [key.address for key in misses],
+                [key.scam_type for key in misses],
+                [texts[key.content_hash] for key in misses],
+            )
+            for key, match in zip(misses, evaluated, strict=True):
+                memo.put(key, match)
+                matches[key] = match
+            report["rules_evaluated"] += len(misses)
+
+            for item in runnable:
+                key = keys[item.submission_id]
+                payload = build_evidence_result(
+                    matches[key],
+                    source_reachable=True,
+                    notes=CACHED_SOURCE_NOTES,
+                    text=texts[key.content_hash],
+                    text_hash=key.content_hash,
+                    rule_version=current_version,
+                ).to_payload()
+                if item.evidence_score != payload["evidence_score"]:
+                    report["score_changes"] += 1
+                db.add(
+                    SubmissionEvent(
+                        submission_id=item.submission_id,
+                        event_type=EventType.EVIDENCE_REANALYZED.value,
+                        event_payload_json=canonical_json(payload),
+                        actor="system",
+                    )
+                )
+                report["reanalyzed"] += 1
+            db.commit()
+
+    report["elapsed_s"] = round(time.perf_counter() - started, 3)
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Re-run evidence rules over cached text where the rule version is stale"
+    )
+    parser.add_argument("--database-url", default=DATABASE_URL)
+    parser.add_argument("--evidence-dir", type=Path, default=EVIDENCE_DIR)
+    parser.add_argument("--case-id", default=None)
+    parser.add_argument("--executor", choices=["process", "thread", "serial"], default="process")
+    parser.add_argument("--workers", type=int, default=None, help="default: all cores")
+    parser.add_argument("--batch-size", type=int, default=REANALYZE_BATCH_SIZE)
+    parser.add_argument("--dry-run", action="store_true", help="only count stale analyses")
+    args = parser.parse_args(argv)
+
+    # Sharded, every shard is re-analysed against its own evidence store.
+    reports = [
+        reanalyze(
+            db,
+            store=EvidenceStore(shard_evidence_dir(args.evidence_dir, shard_id)),
+            case_id=args.case_id,
+            executor=args.executor,
+            workers=args.workers,
+            batch_size=args.batch_size,
+            dry_run=args.dry_run,
+        )
+        for shard_id, db in ledger_sessions(args.database_url)
+    ]
+    report = {**reports[0], **{key: sum(item[key] for item in reports) for key in REPORT_COUNTS}}
+    report["elapsed_s"] = round(sum(item["elapsed_s"] for item in reports), 3)
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from collections import deque
+from collections.abc import Iterator
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from sentinel.db import DATABASE_URL
+from sentinel.hashing import (
+    HASH_CHUNK_SIZE,
+    HashFailure,
+    canonical_submission_payload,
+    submission_hashes,
+)
+from sentinel.models import Submission
+from sentinel.sharding import ledger_sessions
+
+StoredRow = tuple[str, str, str, str]
+
+
+def stored_submission_payload(row: StoredRow) -> dict[str, Any]:
+    case_id, chain, address, raw_payload_json = row
+    return canonical_submission_payload(
+        case_id=case_id,
+        payload=json.loads(raw_payload_json),
+        normalized_chain=chain,
+        normalized_address=address,
+    )
+
+
+def rehash_submissions(
+    db: Session,
+    *,
+    executor: str = "process",
+    workers: int | None = None,
+    chunk_size: int = HASH_CHUNK_SIZE,
+) -> dict[str, Any]:
+    """Recompute every stored ``submission_hash`` on a worker pool and report mismatches.
+
+    A payload that cannot be decoded is reported as a mismatch with an ``error`` instead of a
+    ``recomputed`` hash.
+    """
+    started = time.perf_counter()
+    pending: deque[tuple[str, str]] = deque()
+
+    def rows() -> Iterator[StoredRow]:
+        for submission_id, case_id, chain, address, raw_payload_json, stored in db.execute(
+            select(
+                Submission.submission_id,
+                Submission.case_id,
+                Submission.chain,
+                Submission.address,
+                Submission.raw_payload_json,
+                Submission.submission_hash,
+            )
+            .order_by(Submission.submission_id)
+            .execution_options(yield_per=chunk_size)
+        ):
+            pending.append((submission_id, stored))
+            yield case_id, chain, address, raw_payload_json
+
+    mismatches: list[dict[str, str]] = []
+    checked = 0
+    for recomputed in submission_hashes(
+        rows(),
+        prepare=stored_submission_payload,
+        executor=executor,
+        workers=workers,
+        chunk_size=chunk_size,
+        capture_errors=True,
+    ):
+        submission_id, stored = pending.popleft()
+        checked += 1
+        if isinstance(recomputed, HashFailure):
+            mismatches.append(
+                {"submission_id": submission_id, "stored": stored, "error": recomputed.error}
+            )
+        elif recomputed != stored:
+            mismatches.append(
+                {"submission_id": submission_id, "stored": stored, "recomputed": recomputed}
+            )
+
+    elapsed = time.perf_counter() - started
+    return {
+        "submissions": checked,
+        "elapsed_s": round(elapsed, 3),
+        "submissions_per_s": round(checked / elapsed, 1) if elapsed > 0 else 0.0,
+        "mismatches": mismatches,
+        "ok": not mismatches,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Re-hash every stored submission payload")
+    parser.add_argument("--database-url", default=DATABASE_URL)
+    parser.add_argument("--executor", choices=["process", "thread", "serial"], default="process")
+    parser.add_argument("--workers", type=int, default=None, help="default: all cores")
+    parser.add_argument("--chunk-size", type=int, default=HASH_CHUNK_SIZE)
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    reports = [
+        rehash_submissions(
+            db,
+            executor=args.executor,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+        )
+        for _, db in ledger_sessions(args.database_url)
+    ]
+    elapsed = time.perf_counter() - started
+    checked = sum(item["submissions"] for item in reports)
+    mismatches = [mismatch for item in reports for mismatch in item["mismatches"]]
+    report = {
+        "submissions": checked,
+        "elapsed_s": round(elapsed, 3),
+        "submissions_per_s": round(checked / elapsed, 1) if elapsed > 0 else 0.0,
+        "mismatches": mismatches,
+        "ok": not mismatches,
+    }
+    print(json.dumps(report, indent=2))
+    return 0 if report["ok"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+
+from sentinel.db import DATABASE_URL
+from sentinel.sharding import ledger_sessions
+from sentinel.snapshots import (
+    SNAPSHOT_INTERVAL,
+    all_case_ids,
+    create_snapshots,
+    verify_snapshots,
+)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Create and verify replay snapshots")
+    parser.add_argument("--database-url", default=DATABASE_URL)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    create = subparsers.add_parser("create", help="snapshot submissions with new events")
+    create.add_argument("--case-id", help="limit to one case (default: all cases)")
+    create.add_argument(
+        "--interval",
+        type=int,
+        default=SNAPSHOT_INTERVAL,
+        help="minimum new events since the last snapshot before taking another",
+    )
+
+    verify = subparsers.add_parser("verify", help="check snapshots against full replay")
+    verify.add_argument("--case-id", help="limit to one case (default: all cases)")
+
+    args = parser.parse_args(argv)
+
+    created: dict[str, int] = {}
+    discrepancies = []
+    cases = 0
+    for _, db in ledger_sessions(args.database_url):
+        case_ids = [case_id for case_id in all_case_ids(db) if args.case_id in (None, case_id)]
+        cases += len(case_ids)
+        if args.command == "create":
+            for case_id in case_ids:
+                created[case_id] = create_snapshots(db, case_id, interval=args.interval)
+        else:
+            discrepancies += [
+                item for case_id in case_ids for item in verify_snapshots(db, case_id)
+            ]
+
+    if args.command == "create":
+        print(json.dumps({"created": created, "total": sum(created.values())}, indent=2))
+        return 0
+
+    print(
+        json.dumps(
+            {"cases": cases, "discrepancies": discrepancies, "ok": not discrepancies},
+            indent=2,
+        )
+    )
+    return 0 if not discrepancies else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
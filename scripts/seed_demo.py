@@ -8,7 +8,7 @@ from datetime import UTC, datetime, timedelta
 from sqlalchemy import delete
 
 from sentinel.db import DB_PATH, SessionLocal
-from sentinel.hashing import canonical_json, submission_hash
+from sentinel.hashing import canonical_json, canonical_submission_payload, submission_hash
 from sentinel.models import Case, Contractor, Submission, SubmissionEvent
 
 # Maintained for compatibility with verifier monkeypatch contracts.
@@ -97,7 +97,14 @@ def main(*, reset: bool = False) -> None:
                 source_url=payload["source_url"],
                 confidence_score=payload["confidence_score"],
                 raw_payload_json=canonical_json(payload),
-                submission_hash=submission_hash({"case_id": case.case_id, "payload": payload}),
+                submission_hash=submission_hash(
+                    canonical_submission_payload(
+                        case_id=case.case_id,
+                        payload=payload,
+                        normalized_chain="ETH",
+                        normalized_address=address,
+                    )
+                ),
             )
             db.add(submission)
             db.flush()
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+
+from sentinel.db import DATABASE_URL
+from sentinel.ledger import create_checkpoint, verify_case_chain
+from sentinel.sharding import ledger_sessions
+from sentinel.snapshots import all_case_ids
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Sign ledger checkpoints and verify per-case event hash chains"
+    )
+    parser.add_argument("--database-url", default=DATABASE_URL)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    checkpoint = subparsers.add_parser("checkpoint", help="sign each case's current chain head")
+    checkpoint.add_argument("--case-id", help="limit to one case (default: all cases)")
+
+    verify = subparsers.add_parser("verify", help="re-hash events after the last checkpoint")
+    verify.add_argument("--case-id", help="limit to one case (default: all cases)")
+    verify.add_argument(
+        "--full",
+        action="store_true",
+        help="re-hash the whole chain and validate every checkpoint",
+    )
+
+    args = parser.parse_args(argv)
+
+    created: dict[str, dict[str, object]] = {}
+    reports = []
+    for _, db in ledger_sessions(args.database_url):
+        case_ids = [case_id for case_id in all_case_ids(db) if args.case_id in (None, case_id)]
+        if args.command == "checkpoint":
+            for case_id in case_ids:
+                row = create_checkpoint(db, case_id)
+                if row is not None:
+                    created[case_id] = {"seq": row.seq, "event_hash": row.event_hash}
+        else:
+            reports += [verify_case_chain(db, case_id, full=args.full) for case_id in case_ids]
+
+    if args.command == "checkpoint":
+        print(json.dumps({"created": created, "total": len(created)}, indent=2))
+        return 0
+
+    ok = all(report.ok for report in reports)
+    print(
+        json.dumps(
+            {
+                "cases": len(reports),
+                "events_checked": sum(report.events_checked for report in reports),
+                "reports": [report.to_dict() for report in reports if not report.ok],
+                "ok": ok,
+            },
+            indent=2,
+        )
+    )
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
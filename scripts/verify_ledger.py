@@ -0,0 +1,309 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from itertools import groupby
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from sentinel.db import DATABASE_URL, make_engine
+from sentinel.events import EventType
+from sentinel.hashing import canonical_submission_payload, submission_hash
+from sentinel.models import Case, Submission, SubmissionEvent, SubmissionSnapshot
+from sentinel.replay import SubmissionState, replay_event_rows, replay_event_rows_until
+from sentinel.sharding import ledger_databases
+from sentinel.snapshots import state_from_json
+
+DEFAULT_PARTITION_SIZE = 5000
+
+_worker_engines: dict[str, Engine] = {}
+
+
+@dataclass(frozen=True)
+class Partition:
+    """Submissions of one case with ``after < submission_id <= until`` (open bounds if None),
+    in the database at ``database_url`` (the case's shard when sharded)."""
+
+    database_url: str
+    case_id: str
+    after: str | None = None
+    until: str | None = None
+
+
+@dataclass
+class PartitionReport:
+    partition: Partition
+    submissions: int = 0
+    events: int = 0
+    elapsed_s: float = 0.0
+    discrepancies: list[dict[str, Any]] = field(default_factory=list)
+
+
+def plan_partitions(db: Session, database_url: str, partition_size: int) -> list[Partition]:
+    """Split every case in ``db`` into contiguous submission-id ranges of ``partition_size``
+    rows."""
+    partitions: list[Partition] = []
+    for case_id in db.scalars(select(Case.case_id).order_by(Case.case_id)):
+        submission_ids = db.scalars(
+            select(Submission.submission_id)
+            .where(Submission.case_id == case_id)
+            .order_by(Submission.submission_id)
+        ).all()
+        if not submission_ids:
+            continue
+        bounds = submission_ids[partition_size - 1 :: partition_size]
+        after = None
+        for until in bounds:
+            partitions.append(Partition(database_url, case_id, after=after, until=until))
+            after = until
+        if after != submission_ids[-1]:
+            partitions.append(Partition(database_url, case_id, after=after, until=None))
+    return partitions
+
+
+def _range_filter(partition: Partition) -> list[Any]:
+    criteria = [Submission.case_id == partition.case_id]
+    if partition.after is not None:
+        criteria.append(Submission.submission_id > partition.after)
+    if partition.until is not None:
+        criteria.append(Submission.submission_id <= partition.until)
+    return criteria
+
+
+def _issue(submission_id: str, check: str, **details: Any) -> dict[str, Any]:
+    return {"submission_id": submission_id, "check": check, **details}
+
+
+def _error(exc: Exception) -> str:
+    return f"{type(exc).__name__}: {exc}"
+
+
+def _snapshot_state(state_json: str) -> SubmissionState | None:
+    """A snapshot that no longer decodes compares unequal to the replayed state."""
+    try:
+        return state_from_json(state_json)
+    except (ValueError, TypeError, KeyError):
+        return None
+
+
+def verify_partition(db: Session, partition: Partition) -> PartitionReport:
+    started = time.perf_counter()
+    report = PartitionReport(partition=partition)
+    criteria = _range_filter(partition)
+
+    submissions = db.execute(
+        select(
+            Submission.submission_id,
+            Submission.case_id,
+            Submission.chain,
+            Submission.address,
+            Submission.raw_payload_json,
+            Submission.submission_hash,
+        )
+        .where(*criteria)
+        .order_by(Submission.submission_id)
+    ).all()
+    report.submissions = len(submissions)
+
+    for submission_id, case_id, chain, address, raw_payload_json, stored_hash in submissions:
+        # One corrupt row is a finding, not a reason to abandon the audit.
+        try:
+            recomputed = submission_hash(
+                canonical_submission_payload(
+                    case_id=case_id,
+                    payload=json.loads(raw_payload_json),
+                    normalized_chain=chain,
+                    normalized_address=address,
+                )
+            )
+        except Exception as exc:
+            report.discrepancies.append(
+                _issue(submission_id, "submission_hash", stored=stored_hash, error=_error(exc))
+            )
+            continue
+        if recomputed != stored_hash:
+            report.discrepancies.append(
+                _issue(submission_id, "submission_hash", stored=stored_hash, recomputed=recomputed)
+            )
+
+    snapshot_rows = db.execute(
+        select(
+            SubmissionSnapshot.submission_id,
+            SubmissionSnapshot.event_sequence,
+            SubmissionSnapshot.state_json,
+        )
+        .join(Submission, Submission.submission_id == SubmissionSnapshot.submission_id)
+        .where(*criteria)
+        .order_by(SubmissionSnapshot.submission_id, SubmissionSnapshot.event_sequence)
+    ).all()
+    latest_snapshots = {row[0]: (row[1], row[2]) for row in snapshot_rows}
+
+    event_rows = db.execute(
+        select(
+            SubmissionEvent.submission_id,
+            SubmissionEvent.seq,
+            SubmissionEvent.event_type,
+            SubmissionEvent.event_payload_json,
+        )
+        .join(Submission, Submission.submission_id == SubmissionEvent.submission_id)
+        .where(*criteria)
+        .order_by(Submission.submission_id, SubmissionEvent.seq)
+    )
+    seen: set[str] = set()
+    for submission_id, group in groupby(event_rows, key=lambda row: row[0]):
+        rows = [tuple(row) for row in group]
+        seen.add(submission_id)
+        report.events += len(rows)
+        event_types = [row[2] for row in rows]
+
+        if event_types[0] != EventType.INGESTED.value:
+            report.discrepancies.append(_issue(submission_id, "first_event", found=event_types[0]))
+        if EventType.APPROVED.value in event_types and (
+            EventType.VALIDATED.value not in event_types
+            or event_types.index(EventType.APPROVED.value)
+            < event_types.index(EventType.VALIDATED.value)
+        ):
+            report.discrepancies.append(_issue(submission_id, "approved_without_validation"))
+
+        snapshot = latest_snapshots.get(submission_id)
+        try:
+            # Every event is decoded and folded once: up to the snapshot (if any) to compare
+            # with it, then onwards from that state.
+            resume_from = None
+            if snapshot is not None:
+                sequence, state_json = snapshot
+                limits = {submission_id: sequence}
+                _, prefix_state, last_seq = next(replay_event_rows_until(rows, limits))
+                if last_seq != sequence or prefix_state != _snapshot_state(state_json):
+                    report.discrepancies.append(
+                        _issue(submission_id, "snapshot", event_sequence=sequence)
+                    )
+                resume_from = {submission_id: prefix_state}
+                rows = [row for row in rows if row[1] > last_seq]
+            for _ in replay_event_rows(rows, resume_from):
+                pass
+        except Exception as exc:
+            report.discrepancies.append(_issue(submission_id, "replay", error=_error(exc)))
+
+    for submission_id, *_ in submissions:
+        if submission_id not in seen:
+            report.discrepancies.append(_issue(submission_id, "no_events"))
+
+    report.elapsed_s = time.perf_counter() - started
+    return report
+
+
+def _verify_in_worker(partition: Partition) -> PartitionReport:
+    engine = _worker_engines.get(partition.database_url)
+    if engine is None:
+        engine = _worker_engines[partition.database_url] = make_engine(partition.database_url)
+    with Session(engine) as db:
+        return verify_partition(db, partition)
+
+
+def run_verification(
+    database_url: str,
+    *,
+    workers: int | None = None,
+    partition_size: int = DEFAULT_PARTITION_SIZE,
+    progress: bool = False,
+) -> dict[str, Any]:
+    started = time.perf_counter()
+    partitions: list[Partition] = []
+    for _, url in ledger_databases(database_url):
+        engine = make_engine(url)
+        with Session(engine) as db:
+            partitions += plan_partitions(db, url, partition_size)
+        engine.dispose()
+
+    workers = workers or os.cpu_count() or 1
+    reports: list[PartitionReport] = []
+    submissions = events = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_verify_in_worker, partition) for partition in partitions]
+        for done, future in enumerate(as_completed(futures), start=1):
+            report = future.result()
+            reports.append(report)
+            submissions += report.submissions
+            events += report.events
+            if progress:
+                elapsed = time.perf_counter() - started
+                print(
+                    f"[{done}/{len(partitions)}] {submissions} submissions, {events} events, "
+                    f"{submissions / elapsed:.0f} submissions/s",
+                    file=sys.stderr,
+                )
+
+    elapsed = time.perf_counter() - started
+    discrepancies = [
+        {"case_id": report.partition.case_id, **item}
+        for report in sorted(reports, key=lambda r: (r.partition.case_id, r.partition.after or ""))
+        for item in report.discrepancies
+    ]
+    return {
+        "database_url": database_url,
+        "workers": workers,
+        "partitions": len(partitions),
+        "submissions": submissions,
+        "events": events,
+        "elapsed_s": round(elapsed, 3),
+        "submissions_per_s": round(submissions / elapsed, 1) if elapsed > 0 else 0.0,
+        "events_per_s": round(events / elapsed, 1) if elapsed > 0 else 0.0,
+        "discrepancy_count": len(discrepancies),
+        "discrepancies": discrepancies,
+        "partition_reports": [
+            {
+                **asdict(report.partition),
+                "submissions": report.submissions,
+                "events": report.events,
+                "elapsed_s": round(report.elapsed_s, 3),
+                "discrepancies": len(report.discrepancies),
+            }
+            for report in reports
+        ],
+        "ok": not discrepancies,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Replay and hash-check the full Sentinel-Ops ledger across processes"
+    )
+    parser.add_argument("--database-url", default=DATABASE_URL)
+    parser.add_argument("--workers", type=int, default=None, help="default: all cores")
+    parser.add_argument("--partition-size", type=int, default=DEFAULT_PARTITION_SIZE)
+    parser.add_argument("--output", type=Path, default=None, help="write JSON report here")
+    args = parser.parse_args(argv)
+
+    report = run_verification(
+        args.database_url,
+        workers=args.workers,
+        partition_size=args.partition_size,
+        progress=True,
+    )
+    rendered = json.dumps(report, indent=2)
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(rendered, encoding="utf-8")
+        print(f"Wrote ledger verification report to {args.output}", file=sys.stderr)
+    else:
+        print(rendered)
+    print(
+        f"Verified {report['submissions']} submissions / {report['events']} events in "
+        f"{report['elapsed_s']}s: {report['discrepancy_count']} discrepancies",
+        file=sys.stderr,
+    )
+    return 0 if report["ok"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,490 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import (
+    Boolean,
+    ColumnElement,
+    DateTime,
+    Engine,
+    Float,
+    Integer,
+    Select,
+    Table,
+    create_engine,
+    delete,
+    insert,
+    select,
+    update,
+)
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from sentinel.db import DB_PATH
+from sentinel.hashing import canonical_json, content_hash
+from sentinel.intelligence.evidence_store import (
+    EvidenceStore,
+    load_evidence_texts,
+    release_evidence,
+    remove_unreferenced,
+)
+from sentinel.ledger import verify_case_chain
+from sentinel.models import (
+    RELIABILITY_GLOBAL_SCOPE,
+    AddressClaim,
+    ArchivedSubmission,
+    Base,
+    Case,
+    CaseArchive,
+    ContractorReliability,
+    EvidenceAddress,
+    LedgerChainHead,
+    LedgerCheckpoint,
+    Submission,
+    SubmissionEvent,
+    SubmissionEvidence,
+    SubmissionSnapshot,
+)
+from sentinel.schemas import CaseStatusEnum
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # optional dependency: archives are only written and read when installed
+    pyarrow = None
+
+ARCHIVE_DIR = Path(os.getenv("SENTINEL_ARCHIVE_DIR", str(DB_PATH.parent / "archive")))
+ARCHIVE_COMPRESSION = os.getenv("SENTINEL_ARCHIVE_COMPRESSION", "zstd")
+ARCHIVE_CACHE_SIZE = int(os.getenv("SENTINEL_ARCHIVE_CACHE_SIZE", "8"))
+ARCHIVE_BATCH_ROWS = 10_000
+EVIDENCE_TEXT_BATCH_ROWS = 100
+MANIFEST_NAME = "manifest.json"
+EVIDENCE_TEXTS_NAME = "evidence_texts"
+
+_views: OrderedDict[tuple[str, str], ArchiveView] = OrderedDict()
+_views_lock = threading.Lock()
+
+
+class ArchiveIntegrityError(ValueError):
+    """An archive's files no longer match its recorded hashes or ledger chain."""
+
+
+def archive_available() -> bool:
+    return pyarrow is not None
+
+
+def _require_pyarrow() -> None:
+    if pyarrow is None:
+        raise RuntimeError('case archives require: pip install ".[archive]"')
+
+
+def _case_submission_ids(case_id: str) -> Select:
+    return select(Submission.submission_id).where(Submission.case_id == case_id)
+
+
+def _case_evidence_hashes(case_id: str) -> Select:
+    return select(SubmissionEvidence.content_hash).where(
+        SubmissionEvidence.submission_id.in_(_case_submission_ids(case_id))
+    )
+
+
+# Hot tables whose rows for a case move into its archive, one Parquet file each (in load order).
+ARCHIVED_TABLES: tuple[tuple[Table, Callable[[str], ColumnElement[bool]]], ...] = (
+    (Submission.__table__, lambda case_id: Submission.case_id == case_id),
+    (
+        SubmissionEvent.__table__,
+        lambda case_id: SubmissionEvent.submission_id.in_(_case_submission_ids(case_id)),
+    ),
+    (
+        SubmissionEvidence.__table__,
+        lambda case_id: SubmissionEvidence.submission_id.in_(_case_submission_ids(case_id)),
+    ),
+    (
+        EvidenceAddress.__table__,
+        lambda case_id: EvidenceAddress.content_hash.in_(_case_evidence_hashes(case_id)),
+    ),
+)
+
+
+def _arrow_type(column_type: Any) -> Any:
+    if isinstance(column_type, DateTime):
+        return pyarrow.timestamp("us")
+    if isinstance(column_type, Integer):
+        return pyarrow.int64()
+    if isinstance(column_type, Float):
+        return pyarrow.float64()
+    if isinstance(column_type, Boolean):
+        return pyarrow.bool_()
+    return pyarrow.string()
+
+
+def _arrow_schema(table: Table) -> Any:
+    return pyarrow.schema(
+        [
+            pyarrow.field(column.name, _arrow_type(column.type), nullable=column.nullable)
+            for column in table.columns
+        ]
+    )
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _write_table(db: Session, table: Table, criteria: ColumnElement[bool], path: Path) -> int:
+    schema = _arrow_schema(table)
+    partial = path.with_name(f"{path.name}.part")
+    rows = 0
+    result = db.execute(
+        select(table)
+        .where(criteria)
+        .order_by(*table.primary_key.columns)
+        .execution_options(yield_per=ARCHIVE_BATCH_ROWS)
+    )
+    with pyarrow.parquet.ParquetWriter(partial, schema, compression=ARCHIVE_COMPRESSION) as writer:
+        for batch in result.mappings().partitions():
+            writer.write_table(pyarrow.Table.from_pylist([dict(row) for row in batch], schema))
+            rows += len(batch)
+    os.replace(partial, path)
+    return rows
+
+
+def _write_evidence_texts(db: Session, store: EvidenceStore, case_id: str, path: Path) -> int:
+    """Copy the stripped text of every page the case cites out of ``store``.
+
+    Pages whose file is missing are left out; :func:`_verify_view` then reports them.
+    """
+    schema = pyarrow.schema(
+        [
+            pyarrow.field("content_hash", pyarrow.string(), nullable=False),
+            pyarrow.field("text", pyarrow.string(), nullable=False),
+        ]
+    )
+    text_hashes = sorted(set(db.scalars(_case_evidence_hashes(case_id))))
+    partial = path.with_name(f"{path.name}.part")
+    rows = 0
+    with pyarrow.parquet.ParquetWriter(partial, schema, compression=ARCHIVE_COMPRESSION) as writer:
+        for start in range(0, len(text_hashes), EVIDENCE_TEXT_BATCH_ROWS):
+            texts = load_evidence_texts(
+                db, store, text_hashes[start : start + EVIDENCE_TEXT_BATCH_ROWS]
+            )
+            batch = [{"content_hash": key, "text": texts[key]} for key in sorted(texts)]
+            writer.write_table(pyarrow.Table.from_pylist(batch, schema))
+            rows += len(batch)
+    os.replace(partial, path)
+    return rows
+
+
+def _manifest_entry(file_path: Path, rows: int) -> dict[str, Any]:
+    return {"file": file_path.name, "rows": rows, "sha256": _file_sha256(file_path)}
+
+
+def _write_archive(
+    db: Session, case_id: str, store: EvidenceStore, path: Path
+) -> tuple[dict[str, int], str]:
+    """Write the case's archived tables, evidence texts and manifest; returns row counts and the
+    manifest hash."""
+    tables: dict[str, dict[str, Any]] = {}
+    for table, criteria in ARCHIVED_TABLES:
+        file_path = path / f"{table.name}.parquet"
+        tables[table.name] = _manifest_entry(
+            file_path, _write_table(db, table, criteria(case_id), file_path)
+        )
+    file_path = path / f"{EVIDENCE_TEXTS_NAME}.parquet"
+    tables[EVIDENCE_TEXTS_NAME] = _manifest_entry(
+        file_path, _write_evidence_texts(db, store, case_id, file_path)
+    )
+    manifest = {"case_id": case_id, "compression": ARCHIVE_COMPRESSION, "tables": tables}
+    (path / MANIFEST_NAME).write_text(canonical_json(manifest), encoding="utf-8")
+    counts = {name: entry["rows"] for name, entry in tables.items()}
+    return counts, _file_sha256(path / MANIFEST_NAME)
+
+
+def _file_issues(archive: CaseArchive) -> list[dict[str, Any]]:
+    path = Path(archive.archive_path)
+    manifest_path = path / MANIFEST_NAME
+    if not manifest_path.is_file():
+        return [{"check": "manifest", "path": str(manifest_path), "error": "missing"}]
+    if _file_sha256(manifest_path) != archive.archive_sha256:
+        return [{"check": "manifest", "path": str(manifest_path), "error": "sha256_mismatch"}]
+    issues = []
+    for entry in json.loads(manifest_path.read_text(encoding="utf-8"))["tables"].values():
+        file_path = path / entry["file"]
+        if not file_path.is_file():
+            issues.append({"check": "file", "path": str(file_path), "error": "missing"})
+        elif _file_sha256(file_path) != entry["sha256"]:
+            issues.append({"check": "file", "path": str(file_path), "error": "sha256_mismatch"})
+    return issues
+
+
+def _hot_view_rows(
+    db: Session, case_id: str, contractor_ids: set[str]
+) -> list[tuple[Table, list[dict[str, Any]]]]:
+    """Rows that stay in the hot database but are copied into the case's view."""
+    criteria: list[tuple[Table, ColumnElement[bool]]] = [
+        (Case.__table__, Case.case_id == case_id),
+        (LedgerChainHead.__table__, LedgerChainHead.case_id == case_id),
+        (LedgerCheckpoint.__table__, LedgerCheckpoint.case_id == case_id),
+        (
+            ContractorReliability.__table__,
+            ContractorReliability.contractor_id.in_(contractor_ids)
+            & ContractorReliability.scope.in_([case_id, RELIABILITY_GLOBAL_SCOPE]),
+        ),
+    ]
+    return [
+        (table, [dict(row) for row in db.execute(select(table).where(where)).mappings()])
+        for table, where in criteria
+    ]
+
+
+class ArchiveView:
+    """Read-only in-memory SQLite database holding one archived case, queried with the same
+    code as the hot database.
+
+    All sessions share a single connection, so callers hold ``lock`` while using one.
+    """
+
+    def __init__(self, engine: Engine) -> None:
+        self.engine = engine
+        self.lock = threading.Lock()
+        self.session_factory = sessionmaker(
+            bind=engine, autoflush=False, autocommit=False, class_=Session
+        )
+
+
+def load_archive_view(db: Session, archive: CaseArchive) -> ArchiveView:
+    """Verify ``archive``'s file hashes and load it, with the case's hot rows (case, chain head,
+    checkpoints, contractor reliability), into a new :class:`ArchiveView`."""
+    _require_pyarrow()
+    issues = _file_issues(archive)
+    if issues:
+        raise ArchiveIntegrityError(f"archive of case {archive.case_id} failed verification")
+    engine = create_engine(
+        "sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(bind=engine)
+    path = Path(archive.archive_path)
+    contractor_ids: set[str] = set()
+    with engine.begin() as connection:
+        for table, _criteria in ARCHIVED_TABLES:
+            parquet_file = pyarrow.parquet.ParquetFile(path / f"{table.name}.parquet")
+            for batch in parquet_file.iter_batches(batch_size=ARCHIVE_BATCH_ROWS):
+                rows = batch.to_pylist()
+                if rows:
+                    # Core inserts: the ledger's before_insert hook must not re-sequence events.
+                    connection.execute(insert(table), rows)
+                if table is Submission.__table__:
+                    contractor_ids.update(row["contractor_id"] for row in rows)
+        for table, rows in _hot_view_rows(db, archive.case_id, contractor_ids):
+            if rows:
+                connection.execute(insert(table), rows)
+    return ArchiveView(engine)
+
+
+def archive_view(db: Session, archive: CaseArchive) -> ArchiveView:
+    """Cached :func:`load_archive_view` (the ``SENTINEL_ARCHIVE_CACHE_SIZE`` most recent)."""
+    key = (archive.archive_path, archive.archive_sha256)
+    with _views_lock:
+        view = _views.get(key)
+        if view is not None:
+            _views.move_to_end(key)
+            return view
+    view = load_archive_view(db, archive)
+    with _views_lock:
+        _views[key] = view
+        while len(_views) > ARCHIVE_CACHE_SIZE:
+            _views.popitem(last=False)
+    return view
+
+
+def clear_archive_views() -> None:
+    with _views_lock:
+        _views.clear()
+
+
+@dataclass
+class ArchiveReport:
+    case_id: str
+    submissions: int = 0
+    events_checked: int = 0
+    issues: list[dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.issues
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "case_id": self.case_id,
+            "submissions": self.submissions,
+            "events_checked": self.events_checked,
+            "issues": self.issues,
+            "ok": self.ok,
+        }
+
+
+def _evidence_texts_path(archive: CaseArchive) -> Path:
+    return Path(archive.archive_path) / f"{EVIDENCE_TEXTS_NAME}.parquet"
+
+
+def archived_evidence_text(archive: CaseArchive, text_hash: str) -> str | None:
+    """The stripped page text with content hash ``text_hash`` kept in ``archive``, if any."""
+    _require_pyarrow()
+    texts = pyarrow.parquet.read_table(
+        _evidence_texts_path(archive), columns=["text"], filters=[("content_hash", "==", text_hash)]
+    )
+    return texts.column("text")[0].as_py() if texts.num_rows else None
+
+
+def _evidence_text_issues(archive: CaseArchive, text_hashes: set[str]) -> list[dict[str, Any]]:
+    """Every cited page must be archived, and its text must still hash to its content hash."""
+    issues = []
+    path = _evidence_texts_path(archive)
+    if path.is_file():
+        parquet_file = pyarrow.parquet.ParquetFile(path)
+        for batch in parquet_file.iter_batches(batch_size=EVIDENCE_TEXT_BATCH_ROWS):
+            for row in batch.to_pylist():
+                text_hash = row["content_hash"]
+                if content_hash(row["text"]) != text_hash:
+                    issues.append(
+                        {
+                            "check": "evidence_text",
+                            "content_hash": text_hash,
+                            "error": "sha256_mismatch",
+                        }
+                    )
+                text_hashes.discard(text_hash)
+    issues += [
+        {"check": "evidence_text", "content_hash": text_hash, "error": "missing"}
+        for text_hash in sorted(text_hashes)
+    ]
+    return issues
+
+
+def _verify_view(view: ArchiveView, archive: CaseArchive) -> ArchiveReport:
+    report = ArchiveReport(case_id=archive.case_id)
+    with view.session_factory() as session:
+        report.submissions = len(session.scalars(_case_submission_ids(archive.case_id)).all())
+        chain = verify_case_chain(session, archive.case_id, full=True)
+        text_hashes = set(session.scalars(select(SubmissionEvidence.content_hash)))
+    report.events_checked = chain.events_checked
+    report.issues.extend(chain.issues)
+    report.issues.extend(_evidence_text_issues(archive, text_hashes))
+    if report.submissions != archive.submission_count:
+        report.issues.append({"check": "submission_count", "expected": archive.submission_count})
+    if report.events_checked != archive.event_count:
+        report.issues.append({"check": "event_count", "expected": archive.event_count})
+    return report
+
+
+def verify_case_archive(db: Session, case_id: str) -> ArchiveReport:
+    """Check an archive's file hashes, row counts, evidence texts and ledger hash chain (against
+    the chain head kept in the hot database)."""
+    archive = db.get(CaseArchive, case_id)
+    if archive is None:
+        return ArchiveReport(case_id=case_id, issues=[{"check": "archive", "error": "missing"}])
+    issues = _file_issues(archive)
+    if issues:
+        return ArchiveReport(case_id=case_id, issues=issues)
+    return _verify_view(load_archive_view(db, archive), archive)
+
+
+def archived_case_ids(db: Session) -> list[str]:
+    return list(db.scalars(select(CaseArchive.case_id).order_by(CaseArchive.case_id)))
+
+
+def close_case(db: Session, case_id: str) -> bool:
+    """Mark a case CLOSED; it then accepts no new submissions. False if there is no such case."""
+    closed = db.execute(
+        update(Case).where(Case.case_id == case_id).values(status=CaseStatusEnum.CLOSED.value)
+    ).rowcount
+    db.commit()
+    return bool(closed)
+
+
+def _drop_hot_rows(db: Session, case_id: str) -> list[tuple[str, str]]:
+    submission_ids = list(db.scalars(_case_submission_ids(case_id)))
+    orphans = [release_evidence(db, submission_id) for submission_id in submission_ids]
+    db.execute(delete(SubmissionSnapshot).where(SubmissionSnapshot.case_id == case_id))
+    db.execute(
+        delete(SubmissionEvent).where(
+            SubmissionEvent.submission_id.in_(_case_submission_ids(case_id))
+        )
+    )
+    db.execute(delete(Submission).where(Submission.case_id == case_id))
+    db.execute(delete(AddressClaim).where(AddressClaim.case_id == case_id))
+    if submission_ids:
+        db.execute(
+            insert(ArchivedSubmission),
+            [
+                {"submission_id": submission_id, "case_id": case_id}
+                for submission_id in submission_ids
+            ],
+        )
+    return [orphan for orphan in orphans if orphan is not None]
+
+
+def archive_case(
+    db: Session,
+    case_id: str,
+    store: EvidenceStore,
+    archive_dir: Path = ARCHIVE_DIR,
+) -> CaseArchive:
+    """Move a closed case's submissions, events, evidence links and evidence texts into Parquet
+    files under ``archive_dir/<case_id>`` and delete them from the hot tables.
+
+    The files are read back, the ledger chain verified and every archived text checked against
+    its content hash before anything is deleted. Evidence files no other submission references
+    are removed from ``store`` after the commit; the case row, chain head, checkpoints and
+    reliability counters stay in the hot database.
+    """
+    _require_pyarrow()
+    # Taking the write lock first keeps submissions and actions out until the commit.
+    closed = db.execute(
+        update(Case)
+        .where(Case.case_id == case_id, Case.status == CaseStatusEnum.CLOSED.value)
+        .values(status=CaseStatusEnum.CLOSED.value)
+    ).rowcount
+    if not closed:
+        db.rollback()
+        raise ValueError(f"case {case_id} does not exist or is not closed")
+    if db.get(CaseArchive, case_id) is not None:
+        db.rollback()
+        raise ValueError(f"case {case_id} is already archived")
+
+    path = Path(archive_dir) / case_id
+    path.mkdir(parents=True, exist_ok=True)
+    try:
+        counts, archive_sha256 = _write_archive(db, case_id, store, path)
+        archive = CaseArchive(
+            case_id=case_id,
+            archive_path=str(path),
+            archive_sha256=archive_sha256,
+            submission_count=counts[Submission.__tablename__],
+            event_count=counts[SubmissionEvent.__tablename__],
+        )
+        report = _verify_view(load_archive_view(db, archive), archive)
+        if not report.ok:
+            raise ArchiveIntegrityError(f"archive of case {case_id} failed verification")
+        orphans = _drop_hot_rows(db, case_id)
+        db.add(archive)
+        db.commit()
+    except Exception:
+        db.rollback()
+        shutil.rmtree(path, ignore_errors=True)
+        raise
+    remove_unreferenced(db, store, orphans)
+    return archive
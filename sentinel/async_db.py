@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from collections.abc import Callable
+from typing import TypeVar
+
+from sqlalchemy import URL, Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session
+
+from sentinel.db import (
+    LOCK_RETRY_ATTEMPTS,
+    LOCK_RETRY_BACKOFF_SECONDS,
+    SQLITE_PROFILE,
+    apply_sqlite_profile,
+    is_database_locked,
+    pool_settings,
+)
+
+try:
+    import aiosqlite
+except ImportError:  # optional dependency: the async path is only offered when installed
+    aiosqlite = None
+
+try:
+    import greenlet
+except ImportError:  # optional dependency: SQLAlchemy's run_sync bridge needs it
+    greenlet = None
+
+# "1" serves requests on AsyncSession (aiosqlite) and async evidence fetching.
+ASYNC_DB_ENABLED = os.getenv("SENTINEL_ASYNC_DB", "0") == "1"
+ASYNC_DRIVERS = {"sqlite": "sqlite+aiosqlite", "sqlite+pysqlite": "sqlite+aiosqlite"}
+
+T = TypeVar("T")
+
+_session_factories: dict[str, async_sessionmaker[AsyncSession]] = {}
+_session_factories_lock = threading.Lock()
+
+
+def async_db_enabled() -> bool:
+    return ASYNC_DB_ENABLED
+
+
+def async_db_available() -> bool:
+    return aiosqlite is not None and greenlet is not None
+
+
+def async_url(url: URL) -> URL:
+    """``url`` with its async driver (``sqlite`` -> ``sqlite+aiosqlite``)."""
+    if url.drivername in ASYNC_DRIVERS.values():
+        return url
+    driver = ASYNC_DRIVERS.get(url.drivername)
+    if driver is None:
+        raise ValueError(f"no async driver for {url.drivername!r}")
+    return url.set(drivername=driver)
+
+
+def async_session_factory(
+    bind: Engine, profile: str = SQLITE_PROFILE
+) -> async_sessionmaker[AsyncSession]:
+    """Process-wide :class:`AsyncSession` factory for the database of the sync engine ``bind``.
+
+    The async engine gets the same pool settings and SQLite profile as :func:`make_engine`.
+    """
+    if not async_db_available():
+        raise RuntimeError('async database support requires: pip install ".[async]"')
+    key = bind.url.render_as_string(hide_password=False)
+    with _session_factories_lock:
+        factory = _session_factories.get(key)
+        if factory is None:
+            url = async_url(bind.url)
+            engine = create_async_engine(url, **pool_settings(url))
+            apply_sqlite_profile(engine.sync_engine, profile)
+            factory = _session_factories[key] = async_sessionmaker(
+                engine, autoflush=False, expire_on_commit=False
+            )
+        return factory
+
+
+async def dispose_async_engines() -> None:
+    with _session_factories_lock:
+        engines: list[AsyncEngine] = [factory.kw["bind"] for factory in _session_factories.values()]
+        _session_factories.clear()
+    for engine in engines:
+        await engine.dispose()
+
+
+async def run_write_async(
+    session: AsyncSession,
+    work: Callable[[Session], T],
+    *,
+    attempts: int = LOCK_RETRY_ATTEMPTS,
+    backoff: float = LOCK_RETRY_BACKOFF_SECONDS,
+) -> T:
+    """:func:`~sentinel.write_pipeline.run_write` without the pipeline on an
+    :class:`AsyncSession`: the backoff between lock retries sleeps without blocking the loop."""
+
+    def transaction(sync_session: Session) -> T:
+        result = work(sync_session)
+        sync_session.commit()
+        return result
+
+    for attempt in range(attempts - 1):
+        try:
+            return await session.run_sync(transaction)
+        except OperationalError as exc:
+            await session.rollback()
+            if not is_database_locked(exc):
+                raise
+            await asyncio.sleep(backoff * 2**attempt)
+    return await session.run_sync(transaction)
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from enum import IntFlag
+
+import numpy as np
+
+from sentinel.events import EventType
+from sentinel.replay import SubmissionState
+
+# Code 0 means "no event yet"; event types keep their declaration order so codes are stable.
+EVENT_TYPE_CODES: dict[str, int] = {"": 0} | {
+    event.value: code for code, event in enumerate(EventType, start=1)
+}
+EVENT_TYPE_NAMES: list[str] = list(EVENT_TYPE_CODES)
+
+_INITIAL_CAPACITY = 1024
+
+
+class StateFlag(IntFlag):
+    VALIDATED = 1 << 0
+    APPROVED = 1 << 1
+    REJECTED = 1 << 2
+    CONFLICTED = 1 << 3
+    EXPORTED = 1 << 4
+    ESCALATED = 1 << 5
+    NEEDS_MORE_EVIDENCE = 1 << 6
+
+
+# SubmissionState boolean field -> flag bit.
+_FLAG_FIELDS: tuple[tuple[str, StateFlag], ...] = (
+    ("validated", StateFlag.VALIDATED),
+    ("approved", StateFlag.APPROVED),
+    ("rejected", StateFlag.REJECTED),
+    ("conflicted", StateFlag.CONFLICTED),
+    ("exported", StateFlag.EXPORTED),
+    ("escalated", StateFlag.ESCALATED),
+    ("needs_more_evidence", StateFlag.NEEDS_MORE_EVIDENCE),
+)
+
+
+def pack_flags(state: SubmissionState) -> int:
+    flags = 0
+    for name, flag in _FLAG_FIELDS:
+        if getattr(state, name):
+            flags |= flag
+    return flags
+
+
+def _unpack_flags(flags: int) -> dict[str, bool]:
+    return {name: bool(flags & flag) for name, flag in _FLAG_FIELDS}
+
+
+class CompactSubmissionState:
+    """Memory-lean equivalent of :class:`SubmissionState` for bulk in-memory use."""
+
+    __slots__ = ("flags", "latest_type_code", "duplicate_of", "conflict_with")
+
+    def __init__(
+        self,
+        flags: int = 0,
+        latest_type_code: int = 0,
+        duplicate_of: tuple[str, ...] = (),
+        conflict_with: tuple[str, ...] = (),
+    ) -> None:
+        self.flags = flags
+        self.latest_type_code = latest_type_code
+        self.duplicate_of = duplicate_of
+        self.conflict_with = conflict_with
+
+    @classmethod
+    def from_state(cls, state: SubmissionState) -> CompactSubmissionState:
+        return cls(
+            flags=pack_flags(state),
+            latest_type_code=EVENT_TYPE_CODES[state.latest_event_type],
+            duplicate_of=tuple(state.duplicate_of),
+            conflict_with=tuple(state.conflict_with),
+        )
+
+    def to_state(self) -> SubmissionState:
+        return SubmissionState(
+            latest_event_type=EVENT_TYPE_NAMES[self.latest_type_code],
+            duplicate_of=list(self.duplicate_of),
+            conflict_with=list(self.conflict_with),
+            **_unpack_flags(self.flags),
+        )
+
+    @property
+    def latest_event_type(self) -> str:
+        return EVENT_TYPE_NAMES[self.latest_type_code]
+
+    def has(self, flag: StateFlag) -> bool:
+        return bool(self.flags & flag)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CompactSubmissionState):
+            return NotImplemented
+        return (
+            self.flags == other.flags
+            and self.latest_type_code == other.latest_type_code
+            and self.duplicate_of == other.duplicate_of
+            and self.conflict_with == other.conflict_with
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"CompactSubmissionState(flags={StateFlag(self.flags)!r}, "
+            f"latest_event_type={self.latest_event_type!r}, "
+            f"duplicate_of={self.duplicate_of!r}, conflict_with={self.conflict_with!r})"
+        )
+
+
+class StateColumns:
+    """Columnar store of submission states backed by NumPy arrays.
+
+    Flags, latest event type codes and duplicate/conflict counts live in fixed-width arrays
+    (a few bytes per submission); the id lists themselves are only kept for submissions that
+    have any, so :meth:`get` still round-trips to a full :class:`SubmissionState`.
+    """
+
+    def __init__(self, capacity: int = _INITIAL_CAPACITY) -> None:
+        capacity = max(capacity, 1)
+        self.submission_ids: list[str] = []
+        self._index: dict[str, int] = {}
+        self._flags = np.zeros(capacity, dtype=np.uint8)
+        self._latest_type = np.zeros(capacity, dtype=np.uint8)
+        self._duplicate_count = np.zeros(capacity, dtype=np.uint32)
+        self._conflict_count = np.zeros(capacity, dtype=np.uint32)
+        self._duplicate_of: dict[int, tuple[str, ...]] = {}
+        self._conflict_with: dict[int, tuple[str, ...]] = {}
+
+    @classmethod
+    def from_states(cls, states: Iterable[tuple[str, SubmissionState]]) -> StateColumns:
+        """Build a store from ``(submission_id, state)`` pairs, e.g. :func:`replay_case`."""
+        columns = cls()
+        for submission_id, state in states:
+            columns.put(submission_id, state)
+        return columns
+
+    def __len__(self) -> int:
+        return len(self.submission_ids)
+
+    def __contains__(self, submission_id: object) -> bool:
+        return submission_id in self._index
+
+    def _grow(self) -> None:
+        capacity = len(self._flags) * 2
+        self._flags = np.resize(self._flags, capacity)
+        self._latest_type = np.resize(self._latest_type, capacity)
+        self._duplicate_count = np.resize(self._duplicate_count, capacity)
+        self._conflict_count = np.resize(self._conflict_count, capacity)
+
+    def put(self, submission_id: str, state: SubmissionState) -> None:
+        """Insert or overwrite the state of ``submission_id``."""
+        row = self._index.get(submission_id)
+        if row is None:
+            row = len(self.submission_ids)
+            if row == len(self._flags):
+                self._grow()
+            self._index[submission_id] = row
+            self.submission_ids.append(submission_id)
+
+        self._flags[row] = pack_flags(state)
+        self._latest_type[row] = EVENT_TYPE_CODES[state.latest_event_type]
+        self._duplicate_count[row] = len(state.duplicate_of)
+        self._conflict_count[row] = len(state.conflict_with)
+        for store, ids in (
+            (self._duplicate_of, state.duplicate_of),
+            (self._conflict_with, state.conflict_with),
+        ):
+            if ids:
+                store[row] = tuple(ids)
+            else:
+                store.pop(row, None)
+
+    def compact(self, submission_id: str) -> CompactSubmissionState:
+        row = self._index[submission_id]
+        return CompactSubmissionState(
+            flags=int(self._flags[row]),
+            latest_type_code=int(self._latest_type[row]),
+            duplicate_of=self._duplicate_of.get(row, ()),
+            conflict_with=self._conflict_with.get(row, ()),
+        )
+
+    def get(self, submission_id: str) -> SubmissionState:
+        return self.compact(submission_id).to_state()
+
+    def items(self) -> Iterator[tuple[str, SubmissionState]]:
+        for submission_id in self.submission_ids:
+            yield submission_id, self.get(submission_id)
+
+    @property
+    def flags(self) -> np.ndarray:
+        return self._flags[: len(self)]
+
+    @property
+    def latest_type_codes(self) -> np.ndarray:
+        return self._latest_type[: len(self)]
+
+    @property
+    def duplicate_counts(self) -> np.ndarray:
+        return self._duplicate_count[: len(self)]
+
+    @property
+    def conflict_counts(self) -> np.ndarray:
+        return self._conflict_count[: len(self)]
+
+    def mask(self, flag: StateFlag) -> np.ndarray:
+        """Boolean array selecting submissions with every bit of ``flag`` set."""
+        return (self.flags & int(flag)) == int(flag)
+
+    def count(self, flag: StateFlag) -> int:
+        return int(np.count_nonzero(self.mask(flag)))
+
+    def select(self, flag: StateFlag) -> list[str]:
+        return [self.submission_ids[row] for row in np.flatnonzero(self.mask(flag))]
+
+    def latest_type_counts(self) -> dict[str, int]:
+        counts = np.bincount(self.latest_type_codes, minlength=len(EVENT_TYPE_NAMES))
+        return {
+            name: int(counts[code]) for code, name in enumerate(EVENT_TYPE_NAMES) if counts[code]
+        }
+
+    def nbytes(self) -> int:
+        """Bytes held by the fixed-width columns (excludes ids and sparse id lists)."""
+        return sum(
+            array.nbytes
+            for array in (
+                self._flags,
+                self._latest_type,
+                self._duplicate_count,
+                self._conflict_count,
+            )
+        )
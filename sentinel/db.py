@@ -1,16 +1,81 @@
 from __future__ import annotations
 
+import os
+import time
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any, TypeVar
 
-from sqlalchemy import create_engine
+from sqlalchemy import URL, Engine, create_engine, event, make_url
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session, sessionmaker
 
 DB_PATH = Path("data") / "sentinel_ops.db"
-DATABASE_URL = f"sqlite:///{DB_PATH}"
+DATABASE_URL = os.getenv("SENTINEL_DATABASE_URL", f"sqlite:///{DB_PATH}")
+SQLITE_PROFILE = os.getenv("SENTINEL_SQLITE_PROFILE", "wal")
+DB_POOL_SIZE = int(os.getenv("SENTINEL_DB_POOL_SIZE", "8"))
+DB_MAX_OVERFLOW = int(os.getenv("SENTINEL_DB_MAX_OVERFLOW", "8"))
+DB_POOL_TIMEOUT_SECONDS = float(os.getenv("SENTINEL_DB_POOL_TIMEOUT", "30"))
+LOCK_RETRY_ATTEMPTS = 5
+LOCK_RETRY_BACKOFF_SECONDS = 0.05
 
-engine = create_engine(DATABASE_URL, future=True)
+# PRAGMAs run on every new connection, in order. "default" keeps SQLite's own settings
+# (rollback journal, synchronous=FULL, 2 MiB page cache, temp files on disk).
+SQLITE_PROFILES: dict[str, dict[str, Any]] = {
+    "default": {},
+    "wal": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -65536,  # KiB, i.e. 64 MiB
+        "mmap_size": 268435456,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+}
+SQLITE_PROFILES["wal-durable"] = {**SQLITE_PROFILES["wal"], "synchronous": "FULL"}
+
+
+def apply_sqlite_profile(engine: Engine, profile: str = SQLITE_PROFILE) -> Engine:
+    """Run ``profile``'s PRAGMAs on each connection ``engine`` opens."""
+    if profile not in SQLITE_PROFILES:
+        raise ValueError(f"unknown SQLite profile {profile!r}")
+    pragmas = SQLITE_PROFILES[profile]
+    if not pragmas or engine.dialect.name != "sqlite":
+        return engine
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, _record) -> None:
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+    return engine
+
+
+def pool_settings(url: str | URL) -> dict[str, Any]:
+    """Connection pool arguments for ``url`` (none for in-memory SQLite, which uses one
+    connection per thread)."""
+    if make_url(url).database in (None, "", ":memory:"):
+        return {}
+    return {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT_SECONDS,
+    }
+
+
+def make_engine(url: str = DATABASE_URL, profile: str = SQLITE_PROFILE, **kwargs: Any) -> Engine:
+    """Engine for ``url`` with the connection pool settings and, for SQLite, ``profile``."""
+    kwargs = {**pool_settings(url), **kwargs}
+    return apply_sqlite_profile(create_engine(url, future=True, **kwargs), profile)
+
+
+engine = make_engine()
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, class_=Session)
 
+T = TypeVar("T")
+
 
 def get_db_session() -> Session:
     db = SessionLocal()
@@ -18,3 +83,27 @@ def get_db_session() -> Session:
         yield db
     finally:
         db.close()
+
+
+def is_database_locked(exc: BaseException) -> bool:
+    return isinstance(exc, OperationalError) and "database is locked" in str(exc.orig)
+
+
+def retry_on_lock(
+    db: Session,
+    work: Callable[[], T],
+    *,
+    attempts: int = LOCK_RETRY_ATTEMPTS,
+    backoff: float = LOCK_RETRY_BACKOFF_SECONDS,
+) -> T:
+    """Run the transaction ``work`` (which commits), rolling back and retrying it with
+    exponential backoff when SQLite's busy timeout expires."""
+    for attempt in range(attempts - 1):
+        try:
+            return work()
+        except OperationalError as exc:
+            db.rollback()
+            if not is_database_locked(exc):
+                raise
+            time.sleep(backoff * 2**attempt)
+    return work()
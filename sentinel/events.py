@@ -15,6 +15,11 @@ class EventType(StrEnum):
     REQUEST_MORE_EVIDENCE = "REQUEST_MORE_EVIDENCE"
     EXPORTED = "EXPORTED"
     AI_AUDITED = "AI_AUDITED"
+    EVIDENCE_REANALYZED = "EVIDENCE_REANALYZED"
 
 
 ALL_EVENT_TYPES = {event.value for event in EventType}
+
+# Recorded in the ledger but never a submission's latest_event_type, so appending one cannot
+# move a submission through the review workflow.
+STATUS_NEUTRAL_EVENT_TYPES = {EventType.EVIDENCE_REANALYZED.value}
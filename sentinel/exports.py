@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+import os
+import zlib
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+from sentinel.db import DB_PATH
+from sentinel.hashing import canonical_json
+from sentinel.schemas import ExportRecord
+
+try:
+    import zstandard
+except ImportError:  # optional dependency: zstd is only offered when installed
+    zstandard = None
+
+EXPORT_DIR = Path(os.getenv("SENTINEL_EXPORT_DIR", str(DB_PATH.parent / "exports")))
+
+EXPORT_FIELDNAMES = [
+    "case_id",
+    "submission_id",
+    "contractor_id",
+    "created_at",
+    "chain",
+    "address",
+    "scam_type",
+    "source_url",
+    "confidence_score",
+    "submission_hash",
+    "validation_summary",
+]
+
+EXPORT_MEDIA_TYPES = {
+    "json": "application/json",
+    "csv": "text/csv",
+}
+
+# codec -> (min level, max level, default level); order is the server preference on ties.
+COMPRESSION_LEVELS: dict[str, tuple[int, int, int]] = {
+    "zstd": (1, 19, int(os.getenv("SENTINEL_EXPORT_ZSTD_LEVEL", "3"))),
+    "gzip": (1, 9, int(os.getenv("SENTINEL_EXPORT_GZIP_LEVEL", "6"))),
+}
+
+
+def _csv_line(row: dict[str, object]) -> str:
+    output = io.StringIO()
+    writer = csv.DictWriter(output, fieldnames=EXPORT_FIELDNAMES)
+    writer.writerow(row)
+    return output.getvalue()
+
+
+def _export_row(record: ExportRecord, export_format: str, index: int) -> str:
+    if export_format == "json":
+        prefix = "," if index else ""
+        return prefix + json.dumps(record.model_dump(mode="json"), separators=(",", ":"))
+    row = record.model_dump(mode="json")
+    row["validation_summary"] = canonical_json(row["validation_summary"])
+    return _csv_line(row)
+
+
+def _export_header(export_format: str) -> str:
+    return "[" if export_format == "json" else _csv_line({name: name for name in EXPORT_FIELDNAMES})
+
+
+def iter_export_chunks(records: Iterable[ExportRecord], export_format: str) -> Iterator[str]:
+    """Serialize export records incrementally so large cases never sit in memory twice."""
+    yield _export_header(export_format)
+    for index, record in enumerate(records):
+        yield _export_row(record, export_format, index)
+    if export_format == "json":
+        yield "]"
+
+
+async def aiter_export_chunks(
+    batches: AsyncIterable[Iterable[ExportRecord]], export_format: str
+) -> AsyncIterator[str]:
+    """:func:`iter_export_chunks` over record batches that are fetched as the output streams."""
+    yield _export_header(export_format)
+    index = 0
+    async for batch in batches:
+        for record in batch:
+            yield _export_row(record, export_format, index)
+            index += 1
+    if export_format == "json":
+        yield "]"
+
+
+def available_compressions() -> list[str]:
+    return [codec for codec in COMPRESSION_LEVELS if codec != "zstd" or zstandard is not None]
+
+
+def resolve_compression_level(codec: str, level: int | None) -> int:
+    minimum, maximum, default = COMPRESSION_LEVELS[codec]
+    if level is None:
+        return default
+    if not minimum <= level <= maximum:
+        raise ValueError("invalid_compression_level")
+    return level
+
+
+def negotiate_compression(accept_encoding: str | None) -> str | None:
+    """Pick the preferred available codec from an ``Accept-Encoding`` header, if any."""
+    if not accept_encoding:
+        return None
+
+    weights: dict[str, float] = {}
+    for token in accept_encoding.split(","):
+        coding, _, params = token.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        weight = 1.0
+        name, _, value = params.strip().partition("=")
+        if name.strip().lower() == "q":
+            try:
+                weight = float(value)
+            except ValueError:
+                weight = 0.0
+        weights[coding] = weight
+
+    best: str | None = None
+    best_weight = 0.0
+    for codec in available_compressions():
+        weight = weights.get(codec, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = codec, weight
+    return best
+
+
+def _compressor(codec: str, level: int) -> Any:
+    if codec == "gzip":
+        return zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    if codec == "zstd" and zstandard is not None:
+        return zstandard.ZstdCompressor(level=level).compressobj()
+    raise ValueError("compression_unavailable")
+
+
+async def acompress_chunks(
+    chunks: AsyncIterable[str], codec: str, level: int
+) -> AsyncIterator[bytes]:
+    """Compress an async stream of serialized export chunks on the fly, without buffering the
+    whole payload."""
+    compressor = _compressor(codec, level)
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk.encode("utf-8"))
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def parse_byte_range(header: str, size: int) -> tuple[int, int] | None:
+    """Parse a single-range ``Range`` header into inclusive ``(start, end)`` offsets.
+
+    Returns ``None`` when the header should be ignored (multi-range or non-byte units) and
+    raises ``ValueError`` when the range cannot be satisfied for a file of ``size`` bytes.
+    """
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+
+    start_raw, sep, end_raw = spec.strip().partition("-")
+    if not sep:
+        raise ValueError("malformed_range")
+
+    if start_raw == "":
+        if not end_raw.isdigit() or int(end_raw) == 0:
+            raise ValueError("malformed_range")
+        suffix = min(int(end_raw), size)
+        start, end = size - suffix, size - 1
+    else:
+        if not start_raw.isdigit() or (end_raw and not end_raw.isdigit()):
+            raise ValueError("malformed_range")
+        start = int(start_raw)
+        end = min(int(end_raw), size - 1) if end_raw else size - 1
+
+    if size == 0 or start >= size or start > end:
+        raise ValueError("range_not_satisfiable")
+    return start, end
@@ -2,13 +2,224 @@ from __future__ import annotations
 
 import hashlib
 import json
-from typing import Any
+import os
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from functools import partial
+from itertools import islice
+from typing import Any, Literal, TypeVar
+
+try:
+    import orjson
+except ImportError:  # optional dependency: canonical_json falls back to the stdlib encoder
+    orjson = None
+
+GENESIS_HASH = "0" * 64
+HASH_CHUNK_SIZE = 2000
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class HashFailure:
+    """Yielded by :func:`submission_hashes` in place of the hash of an item that failed to
+    prepare or hash, when called with ``capture_errors=True``."""
+
+    error: str
+
+
+# ADR-0002 canonical form. The encoder is stateless, so one instance serves every call.
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+
+_FAST_SCALARS = frozenset({str, int, bool, type(None)})
+# Python's float repr only uses exponent notation outside [1e-4, 1e16); inside it, orjson
+# prints the same shortest round-trip digits.
+_FAST_FLOAT_MIN = 1e-4
+_FAST_FLOAT_MAX = 1e16
+_FAST_MAX_DEPTH = 64
+
+
+def _fast_path_safe(value: Any, depth: int = 0) -> bool:
+    """True when orjson renders ``value`` exactly like the stdlib canonical encoder.
+
+    Only exact JSON types qualify: subclasses (enums), non-string keys, floats needing an
+    exponent, NaN/infinity and very deep nesting all take the stdlib path.
+    """
+    kind = type(value)
+    if kind in _FAST_SCALARS:
+        return True
+    if kind is float:
+        return value == 0.0 or _FAST_FLOAT_MIN <= abs(value) < _FAST_FLOAT_MAX
+    if depth >= _FAST_MAX_DEPTH:
+        return False
+    if kind is dict:
+        for key, item in value.items():
+            if type(key) is not str:
+                return False
+            if type(item) not in _FAST_SCALARS and not _fast_path_safe(item, depth + 1):
+                return False
+        return True
+    if kind is list or kind is tuple:
+        for item in value:
+            if type(item) not in _FAST_SCALARS and not _fast_path_safe(item, depth + 1):
+                return False
+        return True
+    return False
+
+
+def _canonical_json_orjson(data: Any) -> str | None:
+    try:
+        encoded = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+    except orjson.JSONEncodeError:  # lone surrogates, integers beyond 64 bits
+        return None
+    # orjson emits non-ASCII text (and DEL) raw; ensure_ascii escaping is left to the stdlib
+    # encoder, which is faster at it than re-escaping here.
+    if not encoded.isascii() or b"\x7f" in encoded:
+        return None
+    return encoded.decode("ascii")
 
 
 def canonical_json(data: dict[str, Any]) -> str:
-    return json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+    """ADR-0002 canonical JSON: sorted keys, compact separators, ASCII-only output.
+
+    Uses orjson when installed and the payload is in the subset it renders byte-identically;
+    everything else goes through the stdlib encoder.
+    """
+    if orjson is not None and _fast_path_safe(data):
+        text = _canonical_json_orjson(data)
+        if text is not None:
+            return text
+    return _CANONICAL_ENCODER.encode(data)
 
 
 def submission_hash(data: dict[str, Any]) -> str:
     payload = canonical_json(data).encode("utf-8")
     return hashlib.sha256(payload).hexdigest()
+
+
+def content_hash(text: str) -> str:
+    """SHA-256 of UTF-8 text; the key of content-addressed evidence."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _hash_chunk(
+    chunk: list[Any],
+    prepare: Callable[[Any], dict[str, Any]] | None = None,
+    capture_errors: bool = False,
+) -> list[str | HashFailure]:
+    if not capture_errors:
+        if prepare is None:
+            return [submission_hash(data) for data in chunk]
+        return [submission_hash(prepare(item)) for item in chunk]
+    hashes: list[str | HashFailure] = []
+    for item in chunk:
+        try:
+            hashes.append(submission_hash(item if prepare is None else prepare(item)))
+        except Exception as exc:
+            hashes.append(HashFailure(f"{type(exc).__name__}: {exc}"))
+    return hashes
+
+
+def _chunks(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def submission_hashes(
+    payloads: Iterable[T],
+    *,
+    prepare: Callable[[T], dict[str, Any]] | None = None,
+    executor: Literal["process", "thread", "serial"] = "process",
+    workers: int | None = None,
+    chunk_size: int = HASH_CHUNK_SIZE,
+    capture_errors: bool = False,
+) -> Iterator[str | HashFailure]:
+    """Yield :func:`submission_hash` of every payload, in input order, using a worker pool.
+
+    ``payloads`` may be a list or a lazy stream: it is consumed in ``chunk_size`` batches and at
+    most two batches per worker are in flight, so memory stays bounded for any input size.
+    ``prepare`` turns each item into the dict to hash inside the worker (e.g. parsing stored
+    JSON); with the process executor it must be a picklable module-level function. With
+    ``capture_errors`` an item whose ``prepare`` or hashing raises yields a :class:`HashFailure`
+    instead of ending the stream.
+    Canonicalization holds the GIL, so ``"process"`` is what saturates cores; ``"thread"``
+    only helps when payloads are large enough for SHA-256 (which releases the GIL) to dominate.
+    """
+    if executor not in {"process", "thread", "serial"}:
+        raise ValueError(f"unknown executor: {executor}")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    workers = workers or os.cpu_count() or 1
+    chunks = _chunks(payloads, chunk_size)
+    hash_chunk = partial(_hash_chunk, prepare=prepare, capture_errors=capture_errors)
+    if executor == "serial" or workers == 1:
+        for chunk in chunks:
+            yield from hash_chunk(chunk)
+        return
+
+    pool: Executor
+    if executor == "process":
+        pool = ProcessPoolExecutor(max_workers=workers)
+    else:
+        pool = ThreadPoolExecutor(max_workers=workers)
+    with pool:
+        in_flight = deque()
+        for chunk in chunks:
+            in_flight.append(pool.submit(hash_chunk, chunk))
+            if len(in_flight) >= 2 * workers:
+                yield from in_flight.popleft().result()
+        while in_flight:
+            yield from in_flight.popleft().result()
+
+
+def canonical_submission_payload(
+    *,
+    case_id: str,
+    payload: dict[str, Any],
+    normalized_chain: str,
+    normalized_address: str,
+) -> dict[str, Any]:
+    return {
+        "case_id": case_id,
+        "payload": payload,
+        "normalized_chain": normalized_chain,
+        "normalized_address": normalized_address,
+    }
+
+
+def _utc_isoformat(value: datetime) -> str:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value.astimezone(UTC).isoformat()
+
+
+def ledger_event_hash(
+    *,
+    case_id: str,
+    seq: int,
+    event_id: str,
+    submission_id: str,
+    event_type: str,
+    event_payload_json: str,
+    actor: str,
+    created_at: datetime,
+    prev_hash: str,
+) -> str:
+    """SHA-256 over the canonical JSON of an event and the hash of its predecessor in the case."""
+    return submission_hash(
+        {
+            "case_id": case_id,
+            "seq": seq,
+            "event_id": event_id,
+            "submission_id": submission_id,
+            "event_type": event_type,
+            "event_payload_json": event_payload_json,
+            "actor": actor,
+            "created_at": _utc_isoformat(created_at),
+            "prev_hash": prev_hash,
+        }
+    )
@@ -1,4 +1,13 @@
-from sentinel.intelligence.evidence_analyzer import run_evidence_analysis
-from sentinel.intelligence.models import EvidenceAnalysisResult
+from sentinel.intelligence.enrichment import Enricher, EnrichmentProvider, shared_enricher
+from sentinel.intelligence.evidence_analyzer import run_evidence_analyses, run_evidence_analysis
+from sentinel.intelligence.models import EnrichmentResult, EvidenceAnalysisResult
 
-__all__ = ["run_evidence_analysis", "EvidenceAnalysisResult"]
+__all__ = [
+    "run_evidence_analysis",
+    "run_evidence_analyses",
+    "EvidenceAnalysisResult",
+    "Enricher",
+    "EnrichmentProvider",
+    "EnrichmentResult",
+    "shared_enricher",
+]
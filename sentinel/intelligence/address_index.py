@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import re
+
+from sqlalchemy import select, update
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from sentinel.models import EvidenceAddress, EvidenceBlob
+from sentinel.validation import BTC_RE, ETH_RE, SOL_RE
+
+CHAIN_PATTERNS: dict[str, re.Pattern[str]] = {"ETH": ETH_RE, "BTC": BTC_RE, "SOL": SOL_RE}
+
+# Whole tokens only: an address must not be glued to other letters or digits.
+_EDGE = "[0-9A-Za-z]"
+
+
+def _token_pattern(chain: str, pattern: re.Pattern[str]) -> str:
+    body = pattern.pattern.removeprefix("^").removesuffix("$")
+    return f"(?<!{_EDGE})(?P<{chain}>{body})(?!{_EDGE})"
+
+
+# One alternation of the validation patterns, so a page is scanned in a single pass.
+ADDRESS_SCAN_RE = re.compile(
+    "|".join(_token_pattern(chain, pattern) for chain, pattern in CHAIN_PATTERNS.items())
+)
+
+
+def extract_addresses(text: str) -> list[tuple[str, str]]:
+    """Sorted ``(chain, address)`` pairs for every chain-shaped token in ``text``.
+
+    Base58 tokens valid for both BTC and SOL are reported for both chains.
+    """
+    found: set[tuple[str, str]] = set()
+    for match in ADDRESS_SCAN_RE.finditer(text):
+        token = match.group()
+        found.update(
+            (chain, token) for chain, pattern in CHAIN_PATTERNS.items() if pattern.match(token)
+        )
+    return sorted(found)
+
+
+def index_page_addresses(db: Session, text_hash: str, text: str) -> int:
+    """Fill ``evidence_addresses`` for a stored page once; returns the address count."""
+    indexed = db.scalar(
+        select(EvidenceBlob.address_count).where(EvidenceBlob.content_hash == text_hash)
+    )
+    if indexed is not None:
+        return indexed
+    addresses = extract_addresses(text)
+    if addresses:
+        db.execute(
+            insert(EvidenceAddress).on_conflict_do_nothing(),
+            [
+                {"content_hash": text_hash, "chain": chain, "address": address}
+                for chain, address in addresses
+            ],
+        )
+    db.execute(
+        update(EvidenceBlob)
+        .where(EvidenceBlob.content_hash == text_hash)
+        .values(address_count=len(addresses))
+    )
+    return len(addresses)
+
+
+def page_addresses(db: Session, text_hash: str) -> list[tuple[str, str]]:
+    return [
+        (chain, address)
+        for chain, address in db.execute(
+            select(EvidenceAddress.chain, EvidenceAddress.address)
+            .where(EvidenceAddress.content_hash == text_hash)
+            .order_by(EvidenceAddress.chain, EvidenceAddress.address)
+        )
+    ]
+
+
+class DbAddressIndex:
+    """:class:`~sentinel.intelligence.evidence_analyzer.AddressIndex` backed by
+    ``evidence_addresses``."""
+
+    def __init__(self, db: Session) -> None:
+        self.db = db
+
+    def get(self, text_hash: str) -> frozenset[str] | None:
+        """Lower-cased addresses on the page, or ``None`` if it has not been indexed."""
+        indexed = self.db.scalar(
+            select(EvidenceBlob.address_count).where(EvidenceBlob.content_hash == text_hash)
+        )
+        if indexed is None:
+            return None
+        return frozenset(address.lower() for _chain, address in page_addresses(self.db, text_hash))
@@ -0,0 +1,321 @@
+from __future__ import annotations
+
+import asyncio
+import csv
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import Counter, OrderedDict
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any, Protocol
+
+from sentinel.db import DB_PATH
+from sentinel.intelligence.models import EnrichmentResult
+
+ENRICHMENT_DIR = Path(os.getenv("SENTINEL_ENRICHMENT_DIR", str(DB_PATH.parent / "enrichment")))
+ENRICHMENT_TIMEOUT_SECONDS = 2.0
+ENRICHMENT_CACHE_TTL_SECONDS = 300.0
+ENRICHMENT_CACHE_SIZE = 4096
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_RESET_SECONDS = 30.0
+
+Clock = Callable[[], float]
+
+
+class EnrichmentProvider(Protocol):
+    """Looks up one address; returns ``None`` when it knows nothing about it.
+
+    ``timeout`` bounds each lookup and ``cache_ttl`` how long hits and misses are reused.
+    """
+
+    name: str
+    timeout: float
+    cache_ttl: float
+
+    async def lookup(self, chain: str, address: str) -> dict[str, Any] | None: ...
+
+
+class ResultCache:
+    """Thread-safe LRU of lookup outcomes with a per-entry expiry."""
+
+    def __init__(self, max_size: int = ENRICHMENT_CACHE_SIZE, clock: Clock = time.monotonic):
+        self.max_size = max_size
+        self.clock = clock
+        self._entries: OrderedDict[tuple[str, str], tuple[float, dict[str, Any] | None]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[str, str]) -> tuple[bool, dict[str, Any] | None]:
+        """``(found, data)``; ``data`` is ``None`` for a cached miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            expires_at, data = entry
+            if expires_at <= self.clock():
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+            return True, data
+
+    def put(self, key: tuple[str, str], data: dict[str, Any] | None, ttl: float) -> None:
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (self.clock() + ttl, data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+
+class CircuitBreaker:
+    """Opens after ``failure_threshold`` consecutive failures; after ``reset_after`` seconds one
+    trial call is let through (half-open) and its outcome closes or re-opens the circuit."""
+
+    def __init__(
+        self,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        reset_after: float = BREAKER_RESET_SECONDS,
+        clock: Clock = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_after = reset_after
+        self.clock = clock
+        self.failures = 0
+        self.opened_at: float | None = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if self.clock() - self.opened_at >= self.reset_after:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return True
+            if state == "half_open" and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self._trial_in_flight or self.failures >= self.failure_threshold:
+                self.opened_at = self.clock()
+            self._trial_in_flight = False
+
+
+def _elapsed_ms(start: float) -> float:
+    return round((time.perf_counter() - start) * 1000, 3)
+
+
+class Enricher:
+    """Fans one address out to every provider concurrently.
+
+    Each provider gets its own result cache and circuit breaker; a slow, failing or open
+    provider yields a ``timeout``/``error``/``circuit_open`` result instead of delaying or
+    failing the others.
+    """
+
+    def __init__(
+        self,
+        providers: Iterable[EnrichmentProvider],
+        *,
+        cache_size: int = ENRICHMENT_CACHE_SIZE,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        reset_after: float = BREAKER_RESET_SECONDS,
+        clock: Clock = time.monotonic,
+    ) -> None:
+        self.providers = list(providers)
+        self.caches = {provider.name: ResultCache(cache_size, clock) for provider in self.providers}
+        self.breakers = {
+            provider.name: CircuitBreaker(failure_threshold, reset_after, clock)
+            for provider in self.providers
+        }
+
+    async def _run_provider(
+        self, provider: EnrichmentProvider, chain: str, address: str
+    ) -> EnrichmentResult:
+        start = time.perf_counter()
+        key = (chain, address.lower())
+        cache = self.caches[provider.name]
+        found, data = cache.get(key)
+        if found:
+            status = "miss" if data is None else "hit"
+            return EnrichmentResult(provider.name, status, data or {}, True, _elapsed_ms(start))
+
+        breaker = self.breakers[provider.name]
+        if not breaker.allow():
+            return EnrichmentResult(provider.name, "circuit_open", elapsed_ms=_elapsed_ms(start))
+        try:
+            data = await asyncio.wait_for(provider.lookup(chain, address), provider.timeout)
+        except TimeoutError:
+            breaker.record_failure()
+            return EnrichmentResult(provider.name, "timeout", elapsed_ms=_elapsed_ms(start))
+        except Exception as exc:
+            breaker.record_failure()
+            return EnrichmentResult(
+                provider.name,
+                "error",
+                {"error": type(exc).__name__},
+                elapsed_ms=_elapsed_ms(start),
+            )
+        breaker.record_success()
+        cache.put(key, data, provider.cache_ttl)
+        status = "miss" if data is None else "hit"
+        return EnrichmentResult(provider.name, status, data or {}, elapsed_ms=_elapsed_ms(start))
+
+    async def enrich(self, chain: str, address: str) -> list[EnrichmentResult]:
+        """One result per provider, in provider order."""
+        return list(
+            await asyncio.gather(
+                *(self._run_provider(provider, chain, address) for provider in self.providers)
+            )
+        )
+
+    def enrich_sync(self, chain: str, address: str) -> list[EnrichmentResult]:
+        """:meth:`enrich` for callers without a running event loop (sync API handlers)."""
+        return asyncio.run(self.enrich(chain, address))
+
+
+class FileProvider(ABC):
+    """Base for offline providers backed by one local file, re-read when its mtime changes.
+
+    Subclasses set ``name`` and implement :meth:`parse`.
+    """
+
+    name = "file"
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        timeout: float = ENRICHMENT_TIMEOUT_SECONDS,
+        cache_ttl: float = ENRICHMENT_CACHE_TTL_SECONDS,
+    ) -> None:
+        self.path = Path(path)
+        self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        self._mtime_ns: int | None = None
+        self._index: dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def parse(self, path: Path) -> dict[str, Any]:
+        """Lower-cased address -> provider data."""
+
+    def _current_index(self) -> dict[str, Any]:
+        mtime_ns = self.path.stat().st_mtime_ns
+        with self._lock:
+            if mtime_ns != self._mtime_ns:
+                self._index = self.parse(self.path)
+                self._mtime_ns = mtime_ns
+            return self._index
+
+    def entry(self, chain: str, address: str) -> dict[str, Any] | None:
+        value = self._current_index().get(address.lower())
+        return None if value is None else dict(value)
+
+    async def lookup(self, chain: str, address: str) -> dict[str, Any] | None:
+        return await asyncio.to_thread(self.entry, chain, address)
+
+
+class LabelFileProvider(FileProvider):
+    """``labels.json``: ``{"<address>": {"label": ..., ...}}``."""
+
+    name = "labels"
+
+    def parse(self, path: Path) -> dict[str, Any]:
+        labels = json.loads(path.read_text(encoding="utf-8"))
+        return {address.lower(): dict(entry) for address, entry in labels.items()}
+
+
+class SanctionsListProvider(FileProvider):
+    """``sanctions.txt``: one address per line; blank lines and ``#`` comments are ignored."""
+
+    name = "sanctions"
+
+    def parse(self, path: Path) -> dict[str, Any]:
+        entry = {"sanctioned": True, "list": path.name}
+        index: dict[str, Any] = {}
+        for line in path.read_text(encoding="utf-8").splitlines():
+            address = line.split("#", 1)[0].strip()
+            if address:
+                index[address.lower()] = entry
+        return index
+
+
+class ClusterFileProvider(FileProvider):
+    """``clusters.csv`` with ``address,cluster_id`` columns (header row required)."""
+
+    name = "clusters"
+
+    def parse(self, path: Path) -> dict[str, Any]:
+        with path.open(newline="", encoding="utf-8") as handle:
+            rows = [
+                (row["address"].strip(), row["cluster_id"].strip())
+                for row in csv.DictReader(handle)
+            ]
+        sizes = Counter(cluster_id for _address, cluster_id in rows)
+        return {
+            address.lower(): {"cluster_id": cluster_id, "cluster_size": sizes[cluster_id]}
+            for address, cluster_id in rows
+        }
+
+
+LOCAL_PROVIDER_FILES: dict[str, type[FileProvider]] = {
+    "labels.json": LabelFileProvider,
+    "sanctions.txt": SanctionsListProvider,
+    "clusters.csv": ClusterFileProvider,
+}
+
+ENRICHMENT_PROVIDERS: dict[str, EnrichmentProvider] = {}
+_shared_enrichers: dict[Path, Enricher] = {}
+_shared_enrichers_lock = threading.Lock()
+
+
+def register_enrichment_provider(provider: EnrichmentProvider) -> None:
+    """Add ``provider`` to every shared :class:`Enricher` (alongside the local file providers)."""
+    with _shared_enrichers_lock:
+        ENRICHMENT_PROVIDERS[provider.name] = provider
+        _shared_enrichers.clear()
+
+
+def local_providers(root: Path) -> list[FileProvider]:
+    """File-backed providers for the files present under ``root``."""
+    return [
+        provider_cls(Path(root) / filename)
+        for filename, provider_cls in LOCAL_PROVIDER_FILES.items()
+        if (Path(root) / filename).is_file()
+    ]
+
+
+def shared_enricher(root: Path = ENRICHMENT_DIR) -> Enricher | None:
+    """Process-wide enricher for ``root``, or ``None`` when no provider is configured.
+
+    Files are discovered on first use; later edits to them are picked up by mtime.
+    """
+    root = Path(root)
+    with _shared_enrichers_lock:
+        enricher = _shared_enrichers.get(root)
+        if enricher is None:
+            enricher = Enricher([*local_providers(root), *ENRICHMENT_PROVIDERS.values()])
+            _shared_enrichers[root] = enricher
+    return enricher if enricher.providers else None
@@ -1,17 +1,83 @@
 from __future__ import annotations
 
+import os
 import re
-from collections.abc import Callable
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import replace
 from html import unescape
+from typing import Literal, NamedTuple, Protocol
+from urllib.parse import urlsplit
 
+import httpx
 import requests
 
+from sentinel.hashing import content_hash
+from sentinel.intelligence.host_health import HOST_HEALTH, HostHealth
 from sentinel.intelligence.models import EvidenceAnalysisResult
-from sentinel.intelligence.rules import address_found, build_keyword_notes, keyword_match_score
+from sentinel.intelligence.rules import RuleMatch, evaluate_rules, rule_set_version
 
 TAG_RE = re.compile(r"<[^>]+>")
 WHITESPACE_RE = re.compile(r"\s+")
 
+ExecutorKind = Literal["process", "thread", "serial"]
+Fetcher = Callable[[str], tuple[str, bool, list[str]]]
+
+# CPU stage of API-path analyses: "serial" runs it in the request thread; "process" keeps the
+# regex work (which holds the GIL) out of the API process.
+ANALYSIS_EXECUTOR = os.getenv("SENTINEL_ANALYSIS_EXECUTOR", "serial")
+ANALYSIS_WORKERS = int(os.getenv("SENTINEL_ANALYSIS_WORKERS", "0")) or None
+FETCH_WORKERS = 8
+# Wall-clock budget of one API-path analysis: caps the fetch timeout and the wait for the CPU
+# stage on a pool.
+ANALYSIS_DEADLINE_SECONDS = float(os.getenv("SENTINEL_ANALYSIS_DEADLINE_SECONDS", "10"))
+
+_shared_pool: Executor | None = None
+_shared_pool_lock = threading.Lock()
+
+
+class EvidenceRequest(NamedTuple):
+    address: str
+    scam_type: str
+    source_url: str
+
+
+class FetchedEvidence(NamedTuple):
+    text: str
+    source_reachable: bool
+    notes: list[str]
+    html: bool
+    fetch_ms: float
+
+
+class RuleKey(NamedTuple):
+    content_hash: str
+    address: str
+    scam_type: str
+    rule_version: str
+
+
+class RuleMemo(Protocol):
+    """Memo of :class:`RuleMatch` results per :class:`RuleKey`."""
+
+    def get(self, key: RuleKey) -> RuleMatch | None: ...
+
+    def put(self, key: RuleKey, match: RuleMatch) -> None: ...
+
+
+class AddressIndex(Protocol):
+    """Addresses already extracted from a stored page, by content hash."""
+
+    def get(self, content_hash: str) -> frozenset[str] | None: ...
+
+
+def _elapsed_ms(start: float) -> float:
+    return round((time.perf_counter() - start) * 1000, 3)
+
 
 def _strip_html(raw: str) -> str:
     text = TAG_RE.sub(" ", raw)
@@ -19,52 +85,376 @@ def _strip_html(raw: str) -> str:
     return WHITESPACE_RE.sub(" ", text).strip()
 
 
-def fetch_evidence_text(source_url: str, timeout: int = 8) -> tuple[str, bool, list[str]]:
+def _host_budget(source_url: str, timeout: float | None) -> tuple[HostHealth | None, float]:
+    """The source host's health and fetch timeout; no health when its circuit is open."""
+    health = HOST_HEALTH.get(urlsplit(source_url).hostname or "")
+    if not health.allow():
+        return None, 0.0
+    return health, health.timeout() if timeout is None else min(timeout, health.timeout())
+
+
+def _circuit_open(source_url: str) -> tuple[str, bool, list[str]]:
+    return "", False, [f"Source host circuit open: {urlsplit(source_url).hostname or ''}"]
+
+
+def fetch_evidence_html(
+    source_url: str, timeout: float | None = None
+) -> tuple[str, bool, list[str]]:
+    """I/O stage only: the raw response body, unstripped.
+
+    The host's health (see :mod:`sentinel.intelligence.host_health`) sets the timeout, capped
+    by ``timeout``; a host whose circuit is open fails fast without a request. Every way out of
+    the request either records an outcome or releases a half-open probe.
+    """
+    health, budget = _host_budget(source_url, timeout)
+    if health is None:
+        return _circuit_open(source_url)
+
+    start = time.perf_counter()
     try:
-        response = requests.get(source_url, timeout=timeout)
+        response = requests.get(source_url, timeout=budget)
         response.raise_for_status()
-    except requests.RequestException as exc:
+    except requests.HTTPError as exc:
+        # The host answered; an error status says nothing about its availability.
+        health.record_success(time.perf_counter() - start)
+        return "", False, [f"Source unreachable: {type(exc).__name__}"]
+    except Exception as exc:
+        # Connection errors, timeouts and anything unexpected (an unparseable URL) all count.
+        health.record_failure(timed_out=isinstance(exc, requests.Timeout))
         return "", False, [f"Source unreachable: {type(exc).__name__}"]
+    except BaseException:
+        health.release_probe()
+        raise
 
-    return _strip_html(response.text), True, ["Source reachable"]
+    health.record_success(time.perf_counter() - start)
+    return response.text, True, ["Source reachable"]
 
 
-def run_evidence_analysis(
-    *,
-    address: str,
-    scam_type: str,
-    source_url: str,
-    fetcher: Callable[[str], tuple[str, bool, list[str]]] | None = None,
-) -> EvidenceAnalysisResult:
-    fetch_fn = fetcher or fetch_evidence_text
+async def fetch_evidence_html_async(
+    source_url: str, timeout: float | None = None
+) -> tuple[str, bool, list[str]]:
+    """:func:`fetch_evidence_html` over ``httpx`` for the async request path."""
+    health, budget = _host_budget(source_url, timeout)
+    if health is None:
+        return _circuit_open(source_url)
+
+    start = time.perf_counter()
     try:
-        text, source_reachable, notes = fetch_fn(source_url)
+        async with httpx.AsyncClient(timeout=budget, follow_redirects=True) as client:
+            response = await client.get(source_url)
+        response.raise_for_status()
+    except httpx.HTTPStatusError as exc:
+        health.record_success(time.perf_counter() - start)
+        return "", False, [f"Source unreachable: {type(exc).__name__}"]
+    except Exception as exc:
+        # httpx.InvalidURL, for one, is not an httpx.HTTPError.
+        health.record_failure(timed_out=isinstance(exc, httpx.TimeoutException))
+        return "", False, [f"Source unreachable: {type(exc).__name__}"]
+    except BaseException:
+        # Cancelled: nothing to record, but a probe must not stay in flight forever.
+        health.release_probe()
+        raise
+
+    health.record_success(time.perf_counter() - start)
+    return response.text, True, ["Source reachable"]
+
+
+def fetch_evidence_text(
+    source_url: str, timeout: float | None = None
+) -> tuple[str, bool, list[str]]:
+    raw, source_reachable, notes = fetch_evidence_html(source_url, timeout)
+    return _strip_html(raw), source_reachable, notes
+
+
+def fetch_evidence(
+    source_url: str, fetcher: Fetcher | None = None, timeout: float | None = None
+) -> FetchedEvidence:
+    """Run the I/O stage. A custom ``fetcher`` returns already-extracted text; the default
+    returns raw HTML, which the CPU stage strips. ``timeout`` caps the default fetcher."""
+    start = time.perf_counter()
+    try:
+        if fetcher is not None:
+            text, source_reachable, notes = fetcher(source_url)
+        else:
+            text, source_reachable, notes = fetch_evidence_html(source_url, timeout)
+    except Exception as exc:
+        text, source_reachable, notes = "", False, [f"Source unreachable: {type(exc).__name__}"]
+    return FetchedEvidence(text, source_reachable, list(notes), fetcher is None, _elapsed_ms(start))
+
+
+async def fetch_evidence_async(source_url: str, timeout: float | None = None) -> FetchedEvidence:
+    """:func:`fetch_evidence` with the default fetcher, without blocking the event loop."""
+    start = time.perf_counter()
+    try:
+        text, source_reachable, notes = await fetch_evidence_html_async(source_url, timeout)
     except Exception as exc:
         text, source_reachable, notes = "", False, [f"Source unreachable: {type(exc).__name__}"]
+    return FetchedEvidence(text, source_reachable, list(notes), True, _elapsed_ms(start))
+
+
+def normalize_evidence(text: str, html: bool = False) -> tuple[str, str | None]:
+    """Stripped text and its content hash (``None`` for an empty page)."""
+    if html:
+        text = _strip_html(text)
+    return text, content_hash(text) if text else None
+
 
-    addr_found = address_found(address, text)
-    keyword_score = keyword_match_score(scam_type, text)
-    class_supported = keyword_score > 0
+def build_evidence_result(
+    match: RuleMatch,
+    *,
+    source_reachable: bool,
+    notes: list[str],
+    text: str,
+    text_hash: str | None,
+    rule_version: str,
+) -> EvidenceAnalysisResult:
+    """Combine fetch outcome and rule outcome into the scored result."""
+    notes = list(notes)
+    class_supported = match.keyword_score > 0
 
-    if addr_found:
+    if match.address_found:
         notes.append("Address mentioned")
     else:
         notes.append("Address not found")
 
     if class_supported:
-        notes.extend(build_keyword_notes(scam_type, text))
+        notes.extend(match.keyword_notes)
     else:
         notes.append("Classification keywords not detected")
 
     evidence_score = round(
-        (0.5 * float(addr_found)) + (0.3 * keyword_score) + (0.2 * float(source_reachable)),
+        (0.5 * float(match.address_found))
+        + (0.3 * match.keyword_score)
+        + (0.2 * float(source_reachable)),
         4,
     )
 
     return EvidenceAnalysisResult(
         evidence_score=evidence_score,
-        address_found=addr_found,
+        address_found=match.address_found,
         classification_supported=class_supported,
         source_reachable=source_reachable,
         notes=notes,
+        rule_version=rule_version,
+        evidence_text_hash=text_hash,
+        evidence_text=text,
+    )
+
+
+def analyze_evidence(
+    *,
+    address: str,
+    scam_type: str,
+    text: str,
+    source_reachable: bool,
+    notes: list[str],
+    html: bool = False,
+) -> EvidenceAnalysisResult:
+    """CPU stage: HTML stripping (when ``html``) and the keyword/address rules.
+
+    Pure and picklable, so it can run on a process pool.
+    """
+    start = time.perf_counter()
+    text, text_hash = normalize_evidence(text, html)
+    result = build_evidence_result(
+        evaluate_rules(address, scam_type, text),
+        source_reachable=source_reachable,
+        notes=notes,
+        text=text,
+        text_hash=text_hash,
+        rule_version=rule_set_version(),
+    )
+    return replace(result, timings={"analyze_ms": _elapsed_ms(start)})
+
+
+def _remaining(deadline_at: float | None) -> float | None:
+    return None if deadline_at is None else max(0.0, deadline_at - time.perf_counter())
+
+
+def _run_on(pool: Executor | None, fn: Callable, *args, deadline_at: float | None = None):
+    if pool is None:
+        return fn(*args)
+    return pool.submit(fn, *args).result(timeout=_remaining(deadline_at))
+
+
+def _analyze_memoized(
+    pool: Executor | None,
+    request: EvidenceRequest,
+    fetched: FetchedEvidence,
+    memo: RuleMemo | None,
+    address_index: AddressIndex | None,
+    deadline_at: float | None = None,
+) -> EvidenceAnalysisResult:
+    """CPU stage keyed by content hash: rules are looked up in ``memo`` before being evaluated,
+    and a page already in ``address_index`` answers the address rule with a set lookup."""
+    start = time.perf_counter()
+    text, text_hash = _run_on(
+        pool, normalize_evidence, fetched.text, fetched.html, deadline_at=deadline_at
     )
+    rule_version = rule_set_version()
+    key = RuleKey(text_hash, request.address, request.scam_type, rule_version)
+    match = memo.get(key) if memo is not None and text_hash else None
+    if match is None:
+        known = address_index.get(text_hash) if address_index is not None and text_hash else None
+        match = _run_on(
+            pool,
+            evaluate_rules,
+            request.address,
+            request.scam_type,
+            text,
+            known,
+            deadline_at=deadline_at,
+        )
+        if memo is not None and text_hash:
+            memo.put(key, match)
+    result = build_evidence_result(
+        match,
+        source_reachable=fetched.source_reachable,
+        notes=fetched.notes,
+        text=text,
+        text_hash=text_hash,
+        rule_version=rule_version,
+    )
+    return replace(result, timings={"analyze_ms": _elapsed_ms(start)})
+
+
+def _submit_analysis(
+    pool: Executor | None, request: EvidenceRequest, fetched: FetchedEvidence
+) -> Future[EvidenceAnalysisResult]:
+    kwargs = {
+        "address": request.address,
+        "scam_type": request.scam_type,
+        "text": fetched.text,
+        "source_reachable": fetched.source_reachable,
+        "notes": fetched.notes,
+        "html": fetched.html,
+    }
+    if pool is not None:
+        return pool.submit(analyze_evidence, **kwargs)
+    future: Future[EvidenceAnalysisResult] = Future()
+    future.set_result(analyze_evidence(**kwargs))
+    return future
+
+
+def _with_stage_timings(
+    result: EvidenceAnalysisResult, fetched: FetchedEvidence, start: float
+) -> EvidenceAnalysisResult:
+    timings = {"fetch_ms": fetched.fetch_ms, **result.timings, "total_ms": _elapsed_ms(start)}
+    return replace(result, timings=timings)
+
+
+def _make_pool(executor: ExecutorKind, workers: int) -> Executor:
+    if executor == "process":
+        return ProcessPoolExecutor(max_workers=workers)
+    return ThreadPoolExecutor(max_workers=workers)
+
+
+def analysis_pool() -> Executor | None:
+    """Shared CPU-stage pool for API-path analyses, per ``SENTINEL_ANALYSIS_EXECUTOR``."""
+    global _shared_pool
+    if ANALYSIS_EXECUTOR == "serial":
+        return None
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            workers = ANALYSIS_WORKERS or os.cpu_count() or 1
+            _shared_pool = _make_pool(ANALYSIS_EXECUTOR, workers)
+        return _shared_pool
+
+
+def shutdown_analysis_pool() -> None:
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is not None:
+            _shared_pool.shutdown(wait=True)
+            _shared_pool = None
+
+
+def run_evidence_analysis(
+    *,
+    address: str,
+    scam_type: str,
+    source_url: str,
+    fetcher: Fetcher | None = None,
+    pool: Executor | None = None,
+    memo: RuleMemo | None = None,
+    address_index: AddressIndex | None = None,
+    deadline: float | None = ANALYSIS_DEADLINE_SECONDS,
+    fetched: FetchedEvidence | None = None,
+) -> EvidenceAnalysisResult:
+    """Fetch in the calling thread, then analyze on ``pool`` (default: :func:`analysis_pool`).
+    A page already ``fetched`` (e.g. by :func:`fetch_evidence_async`) is analyzed as is.
+
+    ``deadline`` (seconds) caps the fetch timeout and the wait for the pool; a pool stage that
+    overruns it raises :class:`TimeoutError`.
+
+    With a ``memo``, pages whose normalized text was already checked against the same address,
+    scam type and rule version skip the rules; with an ``address_index``, a page whose
+    addresses were already extracted answers the address rule from that set.
+    ``result.timings`` reports ``fetch_ms``, ``analyze_ms`` and ``total_ms``; timings are not
+    part of equality or of the event payload.
+    """
+    start = time.perf_counter()
+    deadline_at = None if deadline is None else start + deadline
+    request = EvidenceRequest(address, scam_type, source_url)
+    if fetched is None:
+        fetched = fetch_evidence(source_url, fetcher, deadline)
+    pool = pool or analysis_pool()
+    if memo is not None or address_index is not None:
+        result = _analyze_memoized(pool, request, fetched, memo, address_index, deadline_at)
+    else:
+        result = _submit_analysis(pool, request, fetched).result(timeout=_remaining(deadline_at))
+    return _with_stage_timings(result, fetched, start)
+
+
+def run_evidence_analyses(
+    requests_: Iterable[EvidenceRequest],
+    *,
+    fetcher: Fetcher | None = None,
+    executor: ExecutorKind = "process",
+    workers: int | None = None,
+    fetch_workers: int = FETCH_WORKERS,
+    pool: Executor | None = None,
+) -> Iterator[EvidenceAnalysisResult]:
+    """Analyze many submissions, yielding results in input order.
+
+    Fetches run on a thread pool of ``fetch_workers``; the CPU stage runs on a private pool of
+    ``workers`` (``"process"`` by default, so batch re-analysis does not compete with API
+    threads for the GIL). Both stages are bounded to a few items per worker in flight, so
+    ``requests_`` may be a lazy stream of any length. Pass ``pool`` to reuse a caller-owned
+    CPU pool across calls; it is not shut down here.
+    """
+    if executor not in {"process", "thread", "serial"}:
+        raise ValueError(f"unknown executor: {executor}")
+    workers = workers or os.cpu_count() or 1
+    owned_pool = None
+    if pool is None and executor != "serial" and workers > 1:
+        owned_pool = _make_pool(executor, workers)
+    cpu_pool = pool or owned_pool
+    limit = 2 * max(fetch_workers, workers)
+
+    with ThreadPoolExecutor(max_workers=fetch_workers) as io_pool, owned_pool or nullcontext():
+        fetching: deque[tuple[EvidenceRequest, float, Future[FetchedEvidence]]] = deque()
+        analyzing: deque[tuple[FetchedEvidence, float, Future[EvidenceAnalysisResult]]] = deque()
+
+        def advance_fetch() -> None:
+            request, start, fetch_future = fetching.popleft()
+            fetched = fetch_future.result()
+            analyzing.append((fetched, start, _submit_analysis(cpu_pool, request, fetched)))
+
+        def finish() -> EvidenceAnalysisResult:
+            fetched, start, analysis_future = analyzing.popleft()
+            return _with_stage_timings(analysis_future.result(), fetched, start)
+
+        for request in requests_:
+            start = time.perf_counter()
+            fetching.append(
+                (request, start, io_pool.submit(fetch_evidence, request.source_url, fetcher))
+            )
+            if len(fetching) >= limit:
+                advance_fetch()
+            if len(analyzing) >= limit:
+                yield finish()
+        while fetching:
+            advance_fetch()
+        while analyzing:
+            yield finish()
@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import gzip
+import json
+import os
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from sentinel.db import DB_PATH, retry_on_lock
+from sentinel.hashing import canonical_json, content_hash
+from sentinel.intelligence.address_index import index_page_addresses
+from sentinel.intelligence.evidence_analyzer import RuleKey
+from sentinel.intelligence.rules import RuleMatch
+from sentinel.models import EvidenceAddress, EvidenceBlob, EvidenceRuleMemo, SubmissionEvidence
+
+try:
+    import zstandard
+except ImportError:  # optional dependency: zstd is only offered when installed
+    zstandard = None
+
+EVIDENCE_DIR = Path(os.getenv("SENTINEL_EVIDENCE_DIR", str(DB_PATH.parent / "evidence")))
+EVIDENCE_COMPRESSION = os.getenv("SENTINEL_EVIDENCE_COMPRESSION", "gzip")
+
+
+@dataclass(frozen=True)
+class EvidenceCodec:
+    name: str
+    suffix: str
+    compress: Callable[[bytes], bytes]
+    decompress: Callable[[bytes], bytes]
+
+
+EVIDENCE_CODECS: dict[str, EvidenceCodec] = {}
+
+
+def register_evidence_codec(codec: EvidenceCodec) -> None:
+    """Make ``codec`` available to :class:`EvidenceStore` under ``codec.name``."""
+    EVIDENCE_CODECS[codec.name] = codec
+
+
+register_evidence_codec(EvidenceCodec("none", ".txt", bytes, bytes))
+register_evidence_codec(
+    EvidenceCodec(
+        "gzip",
+        ".txt.gz",
+        lambda data: gzip.compress(data, mtime=0),
+        gzip.decompress,
+    )
+)
+if zstandard is not None:
+    register_evidence_codec(
+        EvidenceCodec(
+            "zstd",
+            ".txt.zst",
+            lambda data: zstandard.ZstdCompressor().compress(data),
+            lambda data: zstandard.ZstdDecompressor().decompress(data),
+        )
+    )
+
+
+class EvidenceStore:
+    """Content-addressed files under ``root``: ``<root>/<hash[:2]>/<hash><suffix>``."""
+
+    def __init__(self, root: Path, compression: str = EVIDENCE_COMPRESSION) -> None:
+        if compression not in EVIDENCE_CODECS:
+            raise ValueError(f"unknown evidence compression: {compression}")
+        self.root = Path(root)
+        self.compression = compression
+
+    def path_for(self, text_hash: str, compression: str) -> Path:
+        return self.root / text_hash[:2] / f"{text_hash}{EVIDENCE_CODECS[compression].suffix}"
+
+    def write(self, text_hash: str, text: str) -> int:
+        """Write ``text`` if absent and return the stored (compressed) size."""
+        path = self.path_for(text_hash, self.compression)
+        if path.exists():
+            return path.stat().st_size
+        data = EVIDENCE_CODECS[self.compression].compress(text.encode("utf-8"))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_name(f"{path.name}.{os.getpid()}.part")
+        partial.write_bytes(data)
+        os.replace(partial, path)
+        return len(data)
+
+    def read(self, text_hash: str, compression: str) -> str:
+        data = self.path_for(text_hash, compression).read_bytes()
+        text = EVIDENCE_CODECS[compression].decompress(data).decode("utf-8")
+        if content_hash(text) != text_hash:
+            raise ValueError(f"evidence blob {text_hash} does not match its hash")
+        return text
+
+    def remove(self, text_hash: str, compression: str) -> None:
+        self.path_for(text_hash, compression).unlink(missing_ok=True)
+
+
+def attach_evidence(
+    db: Session,
+    store: EvidenceStore,
+    submission_id: str,
+    text: str,
+    text_hash: str | None = None,
+) -> str:
+    """Store ``text`` once, index its addresses, and count one reference from ``submission_id``."""
+    text_hash = text_hash or content_hash(text)
+    stored_size = store.write(text_hash, text)
+    db.execute(
+        insert(EvidenceBlob)
+        .values(
+            content_hash=text_hash,
+            compression=store.compression,
+            byte_size=len(text.encode("utf-8")),
+            stored_size=stored_size,
+            refcount=0,
+        )
+        .on_conflict_do_nothing(index_elements=["content_hash"])
+    )
+    db.execute(
+        update(EvidenceBlob)
+        .where(EvidenceBlob.content_hash == text_hash)
+        .values(refcount=EvidenceBlob.refcount + 1)
+    )
+    index_page_addresses(db, text_hash, text)
+    db.add(SubmissionEvidence(submission_id=submission_id, content_hash=text_hash))
+    return text_hash
+
+
+def release_evidence(db: Session, submission_id: str) -> tuple[str, str] | None:
+    """Drop ``submission_id``'s reference.
+
+    Returns ``(content_hash, compression)`` when that was the last reference; the caller
+    passes it to :func:`remove_unreferenced` once the transaction has committed.
+    """
+    text_hash = db.scalar(
+        select(SubmissionEvidence.content_hash).where(
+            SubmissionEvidence.submission_id == submission_id
+        )
+    )
+    if text_hash is None:
+        return None
+    db.execute(delete(SubmissionEvidence).where(SubmissionEvidence.submission_id == submission_id))
+    refcount, compression = db.execute(
+        update(EvidenceBlob)
+        .where(EvidenceBlob.content_hash == text_hash)
+        .values(refcount=EvidenceBlob.refcount - 1)
+        .returning(EvidenceBlob.refcount, EvidenceBlob.compression)
+    ).one()
+    if refcount > 0:
+        return None
+    db.execute(delete(EvidenceAddress).where(EvidenceAddress.content_hash == text_hash))
+    db.execute(delete(EvidenceBlob).where(EvidenceBlob.content_hash == text_hash))
+    return text_hash, compression
+
+
+def remove_unreferenced(
+    db: Session, store: EvidenceStore, released: Iterable[tuple[str, str]]
+) -> int:
+    """Delete the files of blobs dropped by :func:`release_evidence`, unless re-attached since.
+
+    Between the release and the unlink another submission can cite the same page: its
+    :meth:`EvidenceStore.write` finds the file still present and skips it. Each file is therefore
+    re-checked in a write transaction of its own, which a concurrent :func:`attach_evidence`
+    cannot interleave with, and is only removed if its blob row is still gone.
+    """
+    removed = 0
+    for text_hash, compression in released:
+
+        def unlink(text_hash: str = text_hash, compression: str = compression) -> bool:
+            # A no-op UPDATE takes SQLite's write lock and tells whether the row is back.
+            referenced = db.execute(
+                update(EvidenceBlob)
+                .where(EvidenceBlob.content_hash == text_hash)
+                .values(refcount=EvidenceBlob.refcount)
+                .returning(EvidenceBlob.content_hash)
+            ).first()
+            if referenced is None:
+                store.remove(text_hash, compression)
+            db.commit()
+            return referenced is None
+
+        removed += retry_on_lock(db, unlink)
+    return removed
+
+
+def load_evidence_texts(
+    db: Session, store: EvidenceStore, text_hashes: Iterable[str]
+) -> dict[str, str]:
+    """Texts for the given hashes; blobs whose file is missing are left out."""
+    text_hashes = set(text_hashes)
+    if not text_hashes:
+        return {}
+    texts: dict[str, str] = {}
+    for text_hash, compression in db.execute(
+        select(EvidenceBlob.content_hash, EvidenceBlob.compression).where(
+            EvidenceBlob.content_hash.in_(text_hashes)
+        )
+    ):
+        try:
+            texts[text_hash] = store.read(text_hash, compression)
+        except FileNotFoundError:
+            continue
+    return texts
+
+
+def _insert_rule_memo(db: Session, key: RuleKey, match: RuleMatch) -> None:
+    db.execute(
+        insert(EvidenceRuleMemo)
+        .values(
+            **key._asdict(),
+            match_json=canonical_json(
+                {
+                    "address_found": match.address_found,
+                    "keyword_score": match.keyword_score,
+                    "keyword_notes": list(match.keyword_notes),
+                }
+            ),
+        )
+        .on_conflict_do_nothing()
+    )
+
+
+class DbRuleMemo:
+    """:class:`~sentinel.intelligence.evidence_analyzer.RuleMemo` backed by
+    ``evidence_rule_memo``."""
+
+    def __init__(self, db: Session) -> None:
+        self.db = db
+
+    def get(self, key: RuleKey) -> RuleMatch | None:
+        match_json = self.db.scalar(
+            select(EvidenceRuleMemo.match_json).where(
+                EvidenceRuleMemo.content_hash == key.content_hash,
+                EvidenceRuleMemo.address == key.address,
+                EvidenceRuleMemo.scam_type == key.scam_type,
+                EvidenceRuleMemo.rule_version == key.rule_version,
+            )
+        )
+        if match_json is None:
+            return None
+        match = json.loads(match_json)
+        return RuleMatch(
+            address_found=match["address_found"],
+            keyword_score=match["keyword_score"],
+            keyword_notes=tuple(match["keyword_notes"]),
+        )
+
+    def put(self, key: RuleKey, match: RuleMatch) -> None:
+        _insert_rule_memo(self.db, key, match)
+
+
+class DeferredRuleMemo(DbRuleMemo):
+    """Reads through ``db`` but buffers new outcomes until :meth:`write_to`, so analysis can run
+    before (and outside) the transaction that records the submission."""
+
+    def __init__(self, db: Session) -> None:
+        super().__init__(db)
+        self.pending: list[tuple[RuleKey, RuleMatch]] = []
+
+    def put(self, key: RuleKey, match: RuleMatch) -> None:
+        self.pending.append((key, match))
+
+    def write_to(self, session: Session) -> None:
+        for key, match in self.pending:
+            _insert_rule_memo(session, key, match)
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+
+HOST_WINDOW = 20
+HOST_MIN_CALLS = 5
+HOST_FAILURE_RATE = 0.5
+HOST_OPEN_SECONDS = 30.0
+FETCH_TIMEOUT_MIN_SECONDS = 1.0
+FETCH_TIMEOUT_MAX_SECONDS = 8.0
+
+Clock = Callable[[], float]
+
+
+class HostHealth:
+    """Failure-rate circuit breaker and adaptive timeout for one evidence host.
+
+    The circuit opens when at least ``min_calls`` of the last ``window`` fetches were made and
+    ``failure_rate`` or more of them failed. After ``open_seconds`` one probe is let through
+    (half-open) with the maximum timeout; its outcome closes or re-opens the circuit.
+
+    The timeout follows observed latency like a TCP retransmission timer (smoothed latency plus
+    four deviations, RFC 6298), clamped to ``[min_timeout, max_timeout]``, and doubles after a
+    timeout.
+    """
+
+    def __init__(
+        self,
+        *,
+        window: int = HOST_WINDOW,
+        min_calls: int = HOST_MIN_CALLS,
+        failure_rate: float = HOST_FAILURE_RATE,
+        open_seconds: float = HOST_OPEN_SECONDS,
+        min_timeout: float = FETCH_TIMEOUT_MIN_SECONDS,
+        max_timeout: float = FETCH_TIMEOUT_MAX_SECONDS,
+        clock: Clock = time.monotonic,
+    ) -> None:
+        self.min_calls = min_calls
+        self.failure_threshold = failure_rate
+        self.open_seconds = open_seconds
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.clock = clock
+        self.outcomes: deque[bool] = deque(maxlen=window)
+        self.srtt: float | None = None
+        self.rttvar = 0.0
+        self.opened_at: float | None = None
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if self.clock() - self.opened_at >= self.open_seconds:
+            return "half_open"
+        return "open"
+
+    @property
+    def failure_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    def allow(self) -> bool:
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return True
+            if state == "half_open" and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def timeout(self) -> float:
+        if self._probe_in_flight or self.srtt is None:
+            return self.max_timeout
+        return min(self.max_timeout, max(self.min_timeout, self.srtt + 4 * self.rttvar))
+
+    def record_success(self, latency: float) -> None:
+        with self._lock:
+            if self.srtt is None:
+                self.srtt, self.rttvar = latency, latency / 2
+            else:
+                self.rttvar = 0.75 * self.rttvar + 0.25 * abs(self.srtt - latency)
+                self.srtt = 0.875 * self.srtt + 0.125 * latency
+            if self._probe_in_flight:
+                self.outcomes.clear()
+            self.outcomes.append(True)
+            self.opened_at = None
+            self._probe_in_flight = False
+
+    def record_failure(self, *, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out and self.srtt is not None:
+                self.srtt = min(self.srtt * 2, self.max_timeout)
+            self.outcomes.append(False)
+            if self._probe_in_flight or (
+                len(self.outcomes) >= self.min_calls and self.failure_rate >= self.failure_threshold
+            ):
+                self.opened_at = self.clock()
+            self._probe_in_flight = False
+
+    def release_probe(self) -> None:
+        """End a half-open probe that produced no outcome (the fetch was cancelled), so the next
+        fetch probes again instead of the host staying blocked."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def snapshot(self) -> dict[str, object]:
+        return {
+            "state": self.state,
+            "failure_rate": round(self.failure_rate, 4),
+            "calls": len(self.outcomes),
+            "timeout": round(self.timeout(), 3),
+        }
+
+
+class HostHealthRegistry:
+    """One :class:`HostHealth` per host name, created on first use with shared settings."""
+
+    def __init__(self, **settings) -> None:
+        self.settings = settings
+        self._hosts: dict[str, HostHealth] = {}
+        self._lock = threading.Lock()
+
+    def get(self, host: str) -> HostHealth:
+        with self._lock:
+            health = self._hosts.get(host)
+            if health is None:
+                health = self._hosts[host] = HostHealth(**self.settings)
+            return health
+
+    def snapshot(self) -> dict[str, dict[str, object]]:
+        with self._lock:
+            hosts = dict(self._hosts)
+        return {host: health.snapshot() for host, health in sorted(hosts.items())}
+
+
+HOST_HEALTH = HostHealthRegistry()
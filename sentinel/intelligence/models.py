@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from typing import Any
 
 
 @dataclass(frozen=True)
@@ -10,6 +11,12 @@ class EvidenceAnalysisResult:
     classification_supported: bool
     source_reachable: bool
     notes: list[str] = field(default_factory=list)
+    rule_version: str = ""
+    evidence_text_hash: str | None = None
+    # Stripped page text, kept so callers can store it under evidence_text_hash.
+    evidence_text: str = field(default="", compare=False, repr=False)
+    # Per-stage wall-clock milliseconds; diagnostic only, so excluded from equality and payload.
+    timings: dict[str, float] = field(default_factory=dict, compare=False, repr=False)
 
     def to_payload(self) -> dict[str, object]:
         return {
@@ -18,4 +25,25 @@ class EvidenceAnalysisResult:
             "classification_supported": self.classification_supported,
             "source_reachable": self.source_reachable,
             "notes": self.notes,
+            "rule_version": self.rule_version,
+            "evidence_text_hash": self.evidence_text_hash,
+        }
+
+
+@dataclass(frozen=True)
+class EnrichmentResult:
+    provider: str
+    # hit | miss | timeout | error | circuit_open
+    status: str
+    data: dict[str, Any] = field(default_factory=dict)
+    cached: bool = False
+    # Diagnostic only, so excluded from equality and payload.
+    elapsed_ms: float = field(default=0.0, compare=False, repr=False)
+
+    def to_payload(self) -> dict[str, object]:
+        return {
+            "provider": self.provider,
+            "status": self.status,
+            "data": self.data,
+            "cached": self.cached,
         }
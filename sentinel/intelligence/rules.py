@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+from typing import NamedTuple
+
+from sentinel.hashing import canonical_json, content_hash
+
 CLASSIFICATION_KEYWORDS: dict[str, list[str]] = {
     "Phishing": ["phishing", "fake website", "impersonation"],
     "Rugpull": ["rug", "liquidity removed", "exit scam"],
@@ -9,6 +13,12 @@ CLASSIFICATION_KEYWORDS: dict[str, list[str]] = {
 }
 
 
+def rule_set_version(keywords: dict[str, list[str]] | None = None) -> str:
+    """Short hash of the keyword table; any edit to the rules yields a new version."""
+    table = CLASSIFICATION_KEYWORDS if keywords is None else keywords
+    return content_hash(canonical_json(table))[:16]
+
+
 def address_found(address: str, text: str) -> bool:
     return address.lower() in text.lower()
 
@@ -30,3 +40,31 @@ def build_keyword_notes(scam_type: str, text: str) -> list[str]:
     text_l = text.lower()
     notes = [f"Keyword matched: {keyword}" for keyword in keywords if keyword.lower() in text_l]
     return sorted(notes)
+
+
+class RuleMatch(NamedTuple):
+    """Text-only rule outcome; independent of how the page was fetched, so it can be memoized."""
+
+    address_found: bool
+    keyword_score: float
+    keyword_notes: tuple[str, ...]
+
+
+def evaluate_rules(
+    address: str,
+    scam_type: str,
+    text: str,
+    known_addresses: frozenset[str] | None = None,
+) -> RuleMatch:
+    """Apply the rules to ``text``.
+
+    ``known_addresses`` (lower-cased addresses indexed from the page) settles a hit without
+    scanning; a miss still falls back to the substring scan, which also matches addresses the
+    index did not tokenize.
+    """
+    return RuleMatch(
+        address_found=(known_addresses is not None and address.lower() in known_addresses)
+        or address_found(address, text),
+        keyword_score=keyword_match_score(scam_type, text),
+        keyword_notes=tuple(build_keyword_notes(scam_type, text)),
+    )
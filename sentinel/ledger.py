@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import hashlib
+import hmac
+import os
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from sentinel.hashing import GENESIS_HASH, canonical_json, ledger_event_hash
+from sentinel.models import (
+    LedgerChainHead,
+    LedgerCheckpoint,
+    Submission,
+    SubmissionEvent,
+)
+
+# Development fallback only; deployments must set SENTINEL_LEDGER_KEY.
+_DEFAULT_LEDGER_KEY = "sentinel-ops-dev-ledger-key"
+
+
+def _ledger_key() -> bytes:
+    return os.getenv("SENTINEL_LEDGER_KEY", _DEFAULT_LEDGER_KEY).encode("utf-8")
+
+
+def ledger_key_id(key: bytes | None = None) -> str:
+    """Short public fingerprint of the signing key, stored with each checkpoint."""
+    return hashlib.sha256(key or _ledger_key()).hexdigest()[:16]
+
+
+def _checkpoint_message(case_id: str, seq: int, event_hash: str, event_count: int) -> bytes:
+    return canonical_json(
+        {"case_id": case_id, "seq": seq, "event_hash": event_hash, "event_count": event_count}
+    ).encode("utf-8")
+
+
+def sign_checkpoint(case_id: str, seq: int, event_hash: str, event_count: int) -> str:
+    message = _checkpoint_message(case_id, seq, event_hash, event_count)
+    return hmac.new(_ledger_key(), message, hashlib.sha256).hexdigest()
+
+
+def checkpoint_signature_valid(checkpoint: LedgerCheckpoint) -> bool:
+    if checkpoint.key_id != ledger_key_id():
+        return False
+    expected = sign_checkpoint(
+        checkpoint.case_id, checkpoint.seq, checkpoint.event_hash, checkpoint.event_count
+    )
+    return hmac.compare_digest(expected, checkpoint.signature)
+
+
+def _case_event_count(db: Session, case_id: str, until_seq: int | None = None) -> int:
+    criteria = [Submission.case_id == case_id]
+    if until_seq is not None:
+        criteria.append(SubmissionEvent.seq <= until_seq)
+    return db.scalar(
+        select(func.count())
+        .select_from(SubmissionEvent)
+        .join(Submission, Submission.submission_id == SubmissionEvent.submission_id)
+        .where(*criteria)
+    )
+
+
+def latest_checkpoint(db: Session, case_id: str) -> LedgerCheckpoint | None:
+    return db.scalar(
+        select(LedgerCheckpoint)
+        .where(LedgerCheckpoint.case_id == case_id)
+        .order_by(LedgerCheckpoint.seq.desc())
+        .limit(1)
+    )
+
+
+def create_checkpoint(db: Session, case_id: str) -> LedgerCheckpoint | None:
+    """Sign the case's current chain head; returns ``None`` if nothing new since the last one."""
+    head = db.get(LedgerChainHead, case_id)
+    if head is None:
+        return None
+    previous = latest_checkpoint(db, case_id)
+    if previous is not None and previous.seq == head.head_seq:
+        return None
+
+    event_count = _case_event_count(db, case_id, head.head_seq)
+    checkpoint = LedgerCheckpoint(
+        case_id=case_id,
+        seq=head.head_seq,
+        event_hash=head.head_hash,
+        event_count=event_count,
+        key_id=ledger_key_id(),
+        signature=sign_checkpoint(case_id, head.head_seq, head.head_hash, event_count),
+    )
+    db.add(checkpoint)
+    db.commit()
+    return checkpoint
+
+
+@dataclass
+class ChainReport:
+    case_id: str
+    full: bool
+    start_seq: int = 0
+    head_seq: int = 0
+    events_checked: int = 0
+    issues: list[dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.issues
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "case_id": self.case_id,
+            "full": self.full,
+            "start_seq": self.start_seq,
+            "head_seq": self.head_seq,
+            "events_checked": self.events_checked,
+            "issues": self.issues,
+            "ok": self.ok,
+        }
+
+
+def _check_checkpoints(db: Session, case_id: str, report: ChainReport) -> LedgerCheckpoint | None:
+    """Validate checkpoints (all of them in full mode) and return the newest trustworthy one."""
+    statement = (
+        select(LedgerCheckpoint)
+        .where(LedgerCheckpoint.case_id == case_id)
+        .order_by(LedgerCheckpoint.seq.desc())
+    )
+    if not report.full:
+        statement = statement.limit(1)
+
+    anchor: LedgerCheckpoint | None = None
+    for checkpoint in db.scalars(statement):
+        issue = {"checkpoint_id": checkpoint.checkpoint_id, "seq": checkpoint.seq}
+        if not checkpoint_signature_valid(checkpoint):
+            report.issues.append({**issue, "check": "checkpoint_signature"})
+            continue
+        anchored_hash = db.scalar(
+            select(SubmissionEvent.event_hash).where(SubmissionEvent.seq == checkpoint.seq)
+        )
+        if anchored_hash != checkpoint.event_hash:
+            report.issues.append({**issue, "check": "checkpoint_anchor"})
+            continue
+        if _case_event_count(db, case_id, checkpoint.seq) != checkpoint.event_count:
+            report.issues.append({**issue, "check": "checkpoint_event_count"})
+            continue
+        if anchor is None:
+            anchor = checkpoint
+    return anchor
+
+
+def verify_case_chain(db: Session, case_id: str, *, full: bool = False) -> ChainReport:
+    """Check a case's hash chain.
+
+    Incremental mode trusts the newest checkpoint whose signature, anchor hash and event count
+    still hold, and re-hashes only the events after it, so the cost is proportional to new
+    events. ``full`` re-hashes the whole chain and validates every checkpoint, which detects
+    edits anywhere in the history.
+    """
+    report = ChainReport(case_id=case_id, full=full)
+    anchor = _check_checkpoints(db, case_id, report)
+    if full or anchor is None:
+        prev_hash, report.start_seq = GENESIS_HASH, 0
+    else:
+        prev_hash, report.start_seq = anchor.event_hash, anchor.seq
+
+    rows = db.execute(
+        select(SubmissionEvent, Submission.case_id)
+        .join(Submission, Submission.submission_id == SubmissionEvent.submission_id)
+        .where(Submission.case_id == case_id, SubmissionEvent.seq > report.start_seq)
+        .order_by(SubmissionEvent.seq)
+        .execution_options(yield_per=1000)
+    )
+    last_seq = report.start_seq
+    for event, event_case_id in rows:
+        report.events_checked += 1
+        issue = {"event_id": event.event_id, "seq": event.seq}
+        if event.prev_hash != prev_hash:
+            report.issues.append({**issue, "check": "prev_hash", "expected": prev_hash})
+        recomputed = ledger_event_hash(
+            case_id=event_case_id,
+            seq=event.seq,
+            event_id=event.event_id,
+            submission_id=event.submission_id,
+            event_type=event.event_type,
+            event_payload_json=event.event_payload_json,
+            actor=event.actor,
+            created_at=event.created_at,
+            prev_hash=event.prev_hash,
+        )
+        if recomputed != event.event_hash:
+            report.issues.append({**issue, "check": "event_hash", "recomputed": recomputed})
+        prev_hash, last_seq = event.event_hash, event.seq
+
+    head = db.get(LedgerChainHead, case_id)
+    report.head_seq = last_seq
+    if last_seq == 0 and head is None:
+        return report
+    if head is None or head.head_seq != last_seq or head.head_hash != prev_hash:
+        report.issues.append(
+            {
+                "check": "chain_head",
+                "head_seq": head.head_seq if head is not None else None,
+                "ledger_seq": last_seq,
+            }
+        )
+    return report
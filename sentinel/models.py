@@ -1,10 +1,28 @@
 from __future__ import annotations
 
+import os
 import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy import (
+    Connection,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    event,
+    func,
+    insert,
+    select,
+    update,
+)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import DeclarativeBase, Mapped, Mapper, Session, mapped_column, relationship
+
+from sentinel.hashing import GENESIS_HASH, ledger_event_hash
 
 
 class Base(DeclarativeBase):
@@ -52,6 +70,10 @@ class Case(Base):
 
 class Submission(Base):
     __tablename__ = "submissions"
+    __table_args__ = (
+        Index("ix_submissions_case_submission", "case_id", "submission_id"),
+        Index("ix_submissions_case_address", "case_id", "chain", "address"),
+    )
 
     submission_id: Mapped[str] = mapped_column(
         String(36),
@@ -83,6 +105,10 @@ class Submission(Base):
 
 class SubmissionEvent(Base):
     __tablename__ = "submission_events"
+    __table_args__ = (
+        Index("ix_submission_events_seq", "seq", unique=True),
+        Index("ix_submission_events_submission_seq", "submission_id", "seq"),
+    )
 
     event_id: Mapped[str] = mapped_column(
         String(36),
@@ -93,6 +119,7 @@ class SubmissionEvent(Base):
         ForeignKey("submissions.submission_id"),
         nullable=False,
     )
+    seq: Mapped[int] = mapped_column(Integer, nullable=False)
     event_type: Mapped[str] = mapped_column(String(64), nullable=False)
     event_payload_json: Mapped[str] = mapped_column(Text, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
@@ -101,5 +128,434 @@ class SubmissionEvent(Base):
         nullable=False,
     )
     actor: Mapped[str] = mapped_column(String(64), nullable=False)
+    prev_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    event_hash: Mapped[str] = mapped_column(String(64), nullable=False)
 
     submission: Mapped[Submission] = relationship(back_populates="events")
+
+
+class LedgerCounter(Base):
+    __tablename__ = "ledger_counters"
+
+    name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    value: Mapped[int] = mapped_column(Integer, nullable=False)
+
+
+EVENT_SEQ_COUNTER = "submission_events.seq"
+
+
+def next_event_seq(connection: Connection) -> int:
+    """Reserve the next global ledger sequence number inside the caller's transaction.
+
+    The counter row is bumped with an UPDATE, so the writer holds the row (or SQLite's database
+    write lock) until commit and concurrent appenders can never observe the same value.
+    """
+    value = connection.execute(
+        update(LedgerCounter)
+        .where(LedgerCounter.name == EVENT_SEQ_COUNTER)
+        .values(value=LedgerCounter.value + 1)
+        .returning(LedgerCounter.value)
+    ).scalar()
+    if value is not None:
+        return value
+
+    value = (connection.scalar(select(func.max(SubmissionEvent.seq))) or 0) + 1
+    connection.execute(insert(LedgerCounter).values(name=EVENT_SEQ_COUNTER, value=value))
+    return value
+
+
+class LedgerChainHead(Base):
+    """Latest link of each case's event hash chain."""
+
+    __tablename__ = "ledger_chain_heads"
+
+    case_id: Mapped[str] = mapped_column(ForeignKey("cases.case_id"), primary_key=True)
+    head_seq: Mapped[int] = mapped_column(Integer, nullable=False)
+    head_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+
+
+def chain_event(connection: Connection, target: SubmissionEvent, case_id: str) -> None:
+    """Link ``target`` to its case's hash chain and advance the chain head.
+
+    Must run after :func:`next_event_seq` in the same transaction: the counter UPDATE already
+    serializes appenders, so reading and moving the head cannot interleave with another writer.
+    The head is updated immediately, so events flushed together chain in ``seq`` order.
+    """
+    prev_hash = connection.scalar(
+        select(LedgerChainHead.head_hash).where(LedgerChainHead.case_id == case_id)
+    )
+    target.prev_hash = prev_hash or GENESIS_HASH
+    target.event_hash = ledger_event_hash(
+        case_id=case_id,
+        seq=target.seq,
+        event_id=target.event_id,
+        submission_id=target.submission_id,
+        event_type=target.event_type,
+        event_payload_json=target.event_payload_json,
+        actor=target.actor,
+        created_at=target.created_at,
+        prev_hash=target.prev_hash,
+    )
+    values = {"head_seq": target.seq, "head_hash": target.event_hash}
+    if prev_hash is None:
+        connection.execute(insert(LedgerChainHead).values(case_id=case_id, **values))
+    else:
+        connection.execute(
+            update(LedgerChainHead).where(LedgerChainHead.case_id == case_id).values(**values)
+        )
+
+
+RELIABILITY_GLOBAL_SCOPE = "global"
+RELIABILITY_HALF_LIFE_HOURS = float(os.getenv("SENTINEL_RELIABILITY_HALF_LIFE_HOURS", "72"))
+REVIEW_OUTCOME_EVENTS = {"APPROVED": True, "REJECTED": False}
+
+
+def to_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
+
+
+def reliability_decay(elapsed_seconds: float) -> float:
+    """Weight left after ``elapsed_seconds`` with the configured half-life."""
+    return 0.5 ** (max(elapsed_seconds, 0.0) / (RELIABILITY_HALF_LIFE_HOURS * 3600.0))
+
+
+class ContractorReliability(Base):
+    """Exponentially decayed review outcomes per contractor, globally and per case.
+
+    ``accepted``/``rejected`` are decayed to ``updated_at``; readers decay them further to
+    the time they read.
+    """
+
+    __tablename__ = "contractor_reliability"
+
+    contractor_id: Mapped[str] = mapped_column(
+        ForeignKey("contractors.contractor_id"),
+        primary_key=True,
+    )
+    scope: Mapped[str] = mapped_column(String(36), primary_key=True)
+    accepted: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    rejected: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+
+def record_review_outcome(
+    connection: Connection,
+    *,
+    contractor_id: str,
+    case_id: str,
+    approved: bool,
+    at: datetime,
+) -> None:
+    """Fold one APPROVED/REJECTED outcome into the global and per-case counters in O(1)."""
+    at = to_utc(at)
+    for scope in (RELIABILITY_GLOBAL_SCOPE, case_id):
+        key = (
+            ContractorReliability.contractor_id == contractor_id,
+            ContractorReliability.scope == scope,
+        )
+        row = connection.execute(
+            select(
+                ContractorReliability.accepted,
+                ContractorReliability.rejected,
+                ContractorReliability.updated_at,
+            ).where(*key)
+        ).first()
+        if row is None:
+            connection.execute(
+                insert(ContractorReliability).values(
+                    contractor_id=contractor_id,
+                    scope=scope,
+                    accepted=1.0 if approved else 0.0,
+                    rejected=0.0 if approved else 1.0,
+                    updated_at=at,
+                )
+            )
+            continue
+
+        accepted, rejected, updated_at = row
+        updated_at = to_utc(updated_at)
+        if at >= updated_at:
+            decay = reliability_decay((at - updated_at).total_seconds())
+            accepted, rejected, weight, updated_at = accepted * decay, rejected * decay, 1.0, at
+        else:  # backdated event: decay the new outcome instead of the running totals
+            weight = reliability_decay((updated_at - at).total_seconds())
+        if approved:
+            accepted += weight
+        else:
+            rejected += weight
+        connection.execute(
+            update(ContractorReliability)
+            .where(*key)
+            .values(accepted=accepted, rejected=rejected, updated_at=updated_at)
+        )
+
+
+@event.listens_for(SubmissionEvent, "before_insert")
+def _append_to_ledger(_mapper: Mapper, connection: Connection, target: SubmissionEvent) -> None:
+    if target.seq is None:
+        target.seq = next_event_seq(connection)
+    if target.event_id is None:
+        target.event_id = str(uuid.uuid4())
+    if target.created_at is None:
+        target.created_at = utcnow()
+    elif target.created_at.tzinfo is not None:
+        target.created_at = target.created_at.astimezone(UTC)
+
+    case_id, contractor_id = connection.execute(
+        select(Submission.case_id, Submission.contractor_id).where(
+            Submission.submission_id == target.submission_id
+        )
+    ).one()
+    chain_event(connection, target, case_id)
+    if target.event_type in REVIEW_OUTCOME_EVENTS:
+        record_review_outcome(
+            connection,
+            contractor_id=contractor_id,
+            case_id=case_id,
+            approved=REVIEW_OUTCOME_EVENTS[target.event_type],
+            at=target.created_at,
+        )
+
+
+class LedgerCheckpoint(Base):
+    """HMAC-signed attestation of a case's chain head at ``seq``."""
+
+    __tablename__ = "ledger_checkpoints"
+    __table_args__ = (Index("ix_ledger_checkpoints_case_seq", "case_id", "seq"),)
+
+    checkpoint_id: Mapped[str] = mapped_column(
+        String(36),
+        primary_key=True,
+        default=lambda: str(uuid.uuid4()),
+    )
+    case_id: Mapped[str] = mapped_column(ForeignKey("cases.case_id"), nullable=False)
+    seq: Mapped[int] = mapped_column(Integer, nullable=False)
+    event_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    event_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    key_id: Mapped[str] = mapped_column(String(16), nullable=False)
+    signature: Mapped[str] = mapped_column(String(64), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=utcnow,
+        nullable=False,
+    )
+
+
+class ExportJob(Base):
+    __tablename__ = "export_jobs"
+
+    job_id: Mapped[str] = mapped_column(
+        String(36),
+        primary_key=True,
+        default=lambda: str(uuid.uuid4()),
+    )
+    case_id: Mapped[str] = mapped_column(ForeignKey("cases.case_id"), nullable=False)
+    format: Mapped[str] = mapped_column(String(8), nullable=False)
+    status: Mapped[str] = mapped_column(String(16), nullable=False, default="PENDING")
+    total_records: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    written_records: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    file_path: Mapped[str | None] = mapped_column(String(1024), nullable=True)
+    byte_size: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    file_sha256: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=utcnow,
+        nullable=False,
+    )
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+
+class SubmissionSnapshot(Base):
+    __tablename__ = "submission_snapshots"
+    __table_args__ = (
+        Index("ix_submission_snapshots_submission_seq", "submission_id", "event_sequence"),
+        Index("ix_submission_snapshots_case", "case_id"),
+    )
+
+    snapshot_id: Mapped[str] = mapped_column(
+        String(36),
+        primary_key=True,
+        default=lambda: str(uuid.uuid4()),
+    )
+    submission_id: Mapped[str] = mapped_column(
+        ForeignKey("submissions.submission_id"),
+        nullable=False,
+    )
+    case_id: Mapped[str] = mapped_column(ForeignKey("cases.case_id"), nullable=False)
+    event_sequence: Mapped[int] = mapped_column(Integer, nullable=False)
+    state_json: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=utcnow,
+        nullable=False,
+    )
+
+
+class EvidenceBlob(Base):
+    """Stripped evidence text stored once on disk, keyed by its SHA-256.
+
+    ``refcount`` is the number of submissions citing it; the file is written with
+    ``compression`` and is removed when the last reference is released.
+    """
+
+    __tablename__ = "evidence_blobs"
+
+    content_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    compression: Mapped[str] = mapped_column(String(16), nullable=False)
+    byte_size: Mapped[int] = mapped_column(Integer, nullable=False)
+    stored_size: Mapped[int] = mapped_column(Integer, nullable=False)
+    refcount: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # Number of evidence_addresses rows; NULL until the page has been indexed.
+    address_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=utcnow,
+        nullable=False,
+    )
+
+
+class EvidenceAddress(Base):
+    """Chain-shaped address found on an evidence page (see ``address_index``)."""
+
+    __tablename__ = "evidence_addresses"
+    __table_args__ = (Index("ix_evidence_addresses_address", "address"),)
+
+    content_hash: Mapped[str] = mapped_column(
+        ForeignKey("evidence_blobs.content_hash"),
+        primary_key=True,
+    )
+    chain: Mapped[str] = mapped_column(String(8), primary_key=True)
+    address: Mapped[str] = mapped_column(String(256), primary_key=True)
+
+
+class SubmissionEvidence(Base):
+    __tablename__ = "submission_evidence"
+    __table_args__ = (Index("ix_submission_evidence_content_hash", "content_hash"),)
+
+    submission_id: Mapped[str] = mapped_column(
+        ForeignKey("submissions.submission_id"),
+        primary_key=True,
+    )
+    content_hash: Mapped[str] = mapped_column(
+        ForeignKey("evidence_blobs.content_hash"),
+        nullable=False,
+    )
+
+
+class EvidenceRuleMemo(Base):
+    """Memoized rule outcome per (content hash, address, scam type, rule version)."""
+
+    __tablename__ = "evidence_rule_memo"
+
+    content_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    address: Mapped[str] = mapped_column(String(256), primary_key=True)
+    scam_type: Mapped[str] = mapped_column(String(64), primary_key=True)
+    rule_version: Mapped[str] = mapped_column(String(16), primary_key=True)
+    match_json: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=utcnow,
+        nullable=False,
+    )
+
+
+class AddressClaim(Base):
+    """One row per (case, chain, address): the serialization point for conflict detection."""
+
+    __tablename__ = "address_claims"
+
+    case_id: Mapped[str] = mapped_column(ForeignKey("cases.case_id"), primary_key=True)
+    chain: Mapped[str] = mapped_column(String(8), primary_key=True)
+    address: Mapped[str] = mapped_column(String(256), primary_key=True)
+    submission_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=utcnow,
+        nullable=False,
+    )
+
+
+def claim_address(session: Session, *, case_id: str, chain: str, address: str) -> int:
+    """Upsert the claim row for a new submission and return the submission count.
+
+    This must be the first write of the submit transaction, before same-address submissions
+    are read: the upsert takes the row lock (SQLite: the database write lock) until commit, so
+    concurrent submissions for the same address are detected one after another and each sees
+    every earlier one.
+    """
+    now = utcnow()
+    return session.execute(
+        sqlite_insert(AddressClaim)
+        .values(case_id=case_id, chain=chain, address=address, submission_count=1, updated_at=now)
+        .on_conflict_do_update(
+            index_elements=["case_id", "chain", "address"],
+            set_={"submission_count": AddressClaim.submission_count + 1, "updated_at": now},
+        )
+        .returning(AddressClaim.submission_count)
+    ).scalar_one()
+
+
+def same_address_submissions(
+    session: Session, *, case_id: str, chain: str, address: str
+) -> list[Submission]:
+    return list(
+        session.scalars(
+            select(Submission).where(
+                Submission.case_id == case_id,
+                Submission.chain == chain,
+                Submission.address == address,
+            )
+        )
+    )
+
+
+class ShardRoute(Base):
+    """Catalog entry placing a case, submission or export job in a shard database.
+
+    Only used in sharded mode (see :mod:`sentinel.sharding`), in the main database.
+    """
+
+    __tablename__ = "shard_routes"
+
+    kind: Mapped[str] = mapped_column(String(16), primary_key=True)
+    key: Mapped[str] = mapped_column(String(36), primary_key=True)
+    shard_id: Mapped[str] = mapped_column(String(64), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=utcnow,
+        nullable=False,
+    )
+
+
+class CaseArchive(Base):
+    """A closed case whose submissions and events were moved to Parquet files.
+
+    ``archive_sha256`` is the hash of the archive manifest, which lists every file's SHA-256
+    (see :mod:`sentinel.archive`).
+    """
+
+    __tablename__ = "case_archives"
+
+    case_id: Mapped[str] = mapped_column(ForeignKey("cases.case_id"), primary_key=True)
+    archive_path: Mapped[str] = mapped_column(String(512), nullable=False)
+    archive_sha256: Mapped[str] = mapped_column(String(64), nullable=False)
+    submission_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    event_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    archived_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=utcnow,
+        nullable=False,
+    )
+
+
+class ArchivedSubmission(Base):
+    """Which archived case a submission id belongs to, so submission URLs keep resolving."""
+
+    __tablename__ = "archived_submissions"
+    __table_args__ = (Index("ix_archived_submissions_case", "case_id"),)
+
+    submission_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    case_id: Mapped[str] = mapped_column(ForeignKey("cases.case_id"), nullable=False)
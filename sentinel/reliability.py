@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from sentinel.models import (
+    RELIABILITY_GLOBAL_SCOPE,
+    ContractorReliability,
+    reliability_decay,
+    to_utc,
+    utcnow,
+)
+
+# Pseudo-count pulling sparse or stale histories back toward the neutral 0.5.
+RELIABILITY_PRIOR_WEIGHT = 1.0
+
+
+def decayed_reliability(
+    accepted: float,
+    rejected: float,
+    elapsed_seconds: float = 0.0,
+    prior_weight: float = RELIABILITY_PRIOR_WEIGHT,
+) -> float:
+    """Reliability from decayed counters, further decayed by ``elapsed_seconds``.
+
+    With no history this is 0.5, like :func:`sentinel.scoring.compute_contractor_reliability`;
+    as outcomes age out the score drifts back to 0.5.
+    """
+    decay = reliability_decay(elapsed_seconds)
+    accepted, rejected = accepted * decay, rejected * decay
+    return (accepted + 0.5 * prior_weight) / (accepted + rejected + prior_weight)
+
+
+def contractor_reliability_map(
+    db: Session,
+    contractor_ids: Iterable[str],
+    scope: str = RELIABILITY_GLOBAL_SCOPE,
+    now: datetime | None = None,
+) -> dict[str, float]:
+    """Decayed reliability per contractor for ``scope`` (``"global"`` or a case id), one query.
+
+    Contractors without recorded outcomes in the scope get 0.5.
+    """
+    contractor_ids = set(contractor_ids)
+    now = to_utc(now or utcnow())
+    reliability = dict.fromkeys(contractor_ids, 0.5)
+    if not contractor_ids:
+        return reliability
+
+    rows = db.execute(
+        select(
+            ContractorReliability.contractor_id,
+            ContractorReliability.accepted,
+            ContractorReliability.rejected,
+            ContractorReliability.updated_at,
+        ).where(
+            ContractorReliability.scope == scope,
+            ContractorReliability.contractor_id.in_(contractor_ids),
+        )
+    )
+    for contractor_id, accepted, rejected, updated_at in rows:
+        elapsed = (now - to_utc(updated_at)).total_seconds()
+        reliability[contractor_id] = decayed_reliability(accepted, rejected, elapsed)
+    return reliability
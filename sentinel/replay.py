@@ -1,10 +1,21 @@
 from __future__ import annotations
 
+import json
+from collections.abc import Iterable, Iterator, Mapping
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any
 
-from sentinel.events import EventType
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from sentinel.events import STATUS_NEUTRAL_EVENT_TYPES, EventType
+from sentinel.models import Submission, SubmissionEvent
+
+REPLAY_BATCH_SIZE = 5000
+
+# Only these event types carry payload fields the fold reads; others skip JSON decoding.
+_PAYLOAD_EVENT_TYPES = {EventType.VALIDATED.value, EventType.CONFLICTED.value}
 
 
 @dataclass(frozen=True)
@@ -12,6 +23,7 @@ class ReplayEvent:
     event_type: str
     created_at: datetime
     event_payload: dict[str, Any] = field(default_factory=dict)
+    seq: int | None = None
 
 
 @dataclass(frozen=True)
@@ -28,6 +40,100 @@ class SubmissionState:
     conflict_with: list[str]
 
 
+class _StateFold:
+    """Mutable accumulator applying events one at a time in ledger order."""
+
+    __slots__ = (
+        "latest_event_type",
+        "validated",
+        "approved",
+        "rejected",
+        "conflicted",
+        "exported",
+        "escalated",
+        "needs_more_evidence",
+        "duplicate_of",
+        "conflict_with",
+        "events_applied",
+        "last_seq",
+    )
+
+    def __init__(self) -> None:
+        self.latest_event_type = ""
+        self.validated = False
+        self.approved = False
+        self.rejected = False
+        self.conflicted = False
+        self.exported = False
+        self.escalated = False
+        self.needs_more_evidence = False
+        self.duplicate_of: list[str] = []
+        self.conflict_with: list[str] = []
+        self.events_applied = 0
+        self.last_seq = 0
+
+    @classmethod
+    def from_state(cls, state: SubmissionState, events_applied: int = 0) -> _StateFold:
+        fold = cls()
+        fold.latest_event_type = state.latest_event_type
+        fold.validated = state.validated
+        fold.approved = state.approved
+        fold.rejected = state.rejected
+        fold.conflicted = state.conflicted
+        fold.exported = state.exported
+        fold.escalated = state.escalated
+        fold.needs_more_evidence = state.needs_more_evidence
+        fold.duplicate_of = list(state.duplicate_of)
+        fold.conflict_with = list(state.conflict_with)
+        fold.events_applied = events_applied
+        return fold
+
+    def apply(self, event_type: str, payload: dict[str, Any]) -> None:
+        if event_type == EventType.VALIDATED.value:
+            self.validated = bool(payload.get("passed", True))
+            self.duplicate_of = list(payload.get("duplicate_of", []))
+            self.conflict_with = list(payload.get("conflict_with", []))
+        elif event_type == EventType.CONFLICTED.value:
+            self.conflicted = True
+            self.conflict_with = list(payload.get("conflict_with", self.conflict_with))
+        elif event_type == EventType.APPROVED.value:
+            self.approved = True
+            self.rejected = False
+        elif event_type == EventType.REJECTED.value:
+            self.rejected = True
+            self.approved = False
+        elif event_type == EventType.EXPORTED.value:
+            self.exported = True
+        elif event_type == EventType.ESCALATED.value:
+            self.escalated = True
+        elif event_type == EventType.REQUEST_MORE_EVIDENCE.value:
+            self.needs_more_evidence = True
+        if event_type not in STATUS_NEUTRAL_EVENT_TYPES:
+            self.latest_event_type = event_type
+        self.events_applied += 1
+
+    def apply_json(self, seq: int, event_type: str, payload_json: str | None) -> None:
+        if event_type in _PAYLOAD_EVENT_TYPES and payload_json:
+            self.apply(event_type, json.loads(payload_json))
+        else:
+            self.apply(event_type, {})
+        self.last_seq = seq
+
+    def to_state(self) -> SubmissionState:
+        return SubmissionState(
+            latest_event_type=self.latest_event_type,
+            validated=self.validated,
+            approved=self.approved,
+            rejected=self.rejected,
+            conflicted=self.conflicted,
+            exported=self.exported,
+            escalated=self.escalated,
+            needs_more_evidence=self.needs_more_evidence,
+            duplicate_of=self.duplicate_of,
+            conflict_with=self.conflict_with,
+        )
+
+
 def _to_datetime(value: datetime | str) -> datetime:
     if isinstance(value, datetime):
         parsed = value
@@ -38,56 +144,134 @@ def _to_datetime(value: datetime | str) -> datetime:
     return parsed.astimezone(UTC)
 
 
-def reconstruct_submission_state(events: list[ReplayEvent]) -> SubmissionState:
-    if not events:
-        raise ValueError("cannot reconstruct state from empty event stream")
+def reconstruct_submission_state(
+    events: list[ReplayEvent],
+    *,
+    presorted: bool = False,
+    snapshot: SubmissionState | None = None,
+) -> SubmissionState:
+    """Fold ``events`` into a state, optionally continuing from a snapshot.
 
-    ordered = sorted(events, key=lambda event: _to_datetime(event.created_at))
+    Events are ordered by ledger ``seq``; ``created_at`` is only used for events that carry no
+    sequence number. When ``snapshot`` is given, ``events`` must contain only the events
+    recorded after the snapshot's covered sequence.
+    """
+    if not events and snapshot is None:
+        raise ValueError("cannot reconstruct state from empty event stream")
 
-    validated = False
-    approved = False
-    rejected = False
-    conflicted = False
-    exported = False
-    escalated = False
-    needs_more_evidence = False
-    duplicate_of: list[str] = []
-    conflict_with: list[str] = []
+    if presorted:
+        ordered = events
+    elif all(event.seq is not None for event in events):
+        ordered = sorted(events, key=lambda event: event.seq)
+    else:
+        ordered = sorted(events, key=lambda event: _to_datetime(event.created_at))
 
+    fold = _StateFold() if snapshot is None else _StateFold.from_state(snapshot)
     for event in ordered:
-        event_type = event.event_type
-        payload = event.event_payload or {}
+        fold.apply(event.event_type, event.event_payload or {})
+    return fold.to_state()
 
-        if event_type == EventType.VALIDATED.value:
-            validated = bool(payload.get("passed", True))
-            duplicate_of = list(payload.get("duplicate_of", []))
-            conflict_with = list(payload.get("conflict_with", []))
-        elif event_type == EventType.CONFLICTED.value:
-            conflicted = True
-            conflict_with = list(payload.get("conflict_with", conflict_with))
-        elif event_type == EventType.APPROVED.value:
-            approved = True
-            rejected = False
-        elif event_type == EventType.REJECTED.value:
-            rejected = True
-            approved = False
-        elif event_type == EventType.EXPORTED.value:
-            exported = True
-        elif event_type == EventType.ESCALATED.value:
-            escalated = True
-        elif event_type == EventType.REQUEST_MORE_EVIDENCE.value:
-            needs_more_evidence = True
-
-    latest_event_type = ordered[-1].event_type
-    return SubmissionState(
-        latest_event_type=latest_event_type,
-        validated=validated,
-        approved=approved,
-        rejected=rejected,
-        conflicted=conflicted,
-        exported=exported,
-        escalated=escalated,
-        needs_more_evidence=needs_more_evidence,
-        duplicate_of=duplicate_of,
-        conflict_with=conflict_with,
+
+LedgerRow = tuple[str, int, str, str | None]
+
+
+def _fold_event_rows(
+    rows: Iterable[LedgerRow],
+    snapshots: Mapping[str, SubmissionState] | None = None,
+) -> Iterator[tuple[str, _StateFold]]:
+    current_id: str | None = None
+    fold = _StateFold()
+    for submission_id, seq, event_type, payload_json in rows:
+        if submission_id != current_id:
+            if current_id is not None:
+                yield current_id, fold
+            current_id = submission_id
+            if snapshots is not None and submission_id in snapshots:
+                fold = _StateFold.from_state(snapshots[submission_id])
+            else:
+                fold = _StateFold()
+        fold.apply_json(seq, event_type, payload_json)
+    if current_id is not None:
+        yield current_id, fold
+
+
+def replay_event_rows(
+    rows: Iterable[LedgerRow],
+    snapshots: Mapping[str, SubmissionState] | None = None,
+) -> Iterator[tuple[str, SubmissionState]]:
+    """Fold ``(submission_id, seq, event_type, payload_json)`` rows grouped by submission.
+
+    Rows must arrive ordered by submission and then ``seq``; each submission's state is
+    yielded as soon as its last row has been consumed, so memory stays bounded by one fold.
+    Submissions found in ``snapshots`` continue from that state, so their rows must start
+    after the snapshot's covered sequence.
+    """
+    for submission_id, fold in _fold_event_rows(rows, snapshots):
+        yield submission_id, fold.to_state()
+
+
+def replay_event_rows_until(
+    rows: Iterable[LedgerRow],
+    limits: Mapping[str, int],
+) -> Iterator[tuple[str, SubmissionState, int]]:
+    """Fold grouped rows, stopping each submission after the event with ``limits[id]`` seq.
+
+    Yields ``(submission_id, state, last_seq)`` only for submissions present in ``limits``;
+    ``last_seq`` differs from the limit when the submission has no event with that seq.
+    """
+    current_id: str | None = None
+    fold: _StateFold | None = None
+    for submission_id, seq, event_type, payload_json in rows:
+        if submission_id != current_id:
+            if fold is not None:
+                yield current_id, fold.to_state(), fold.last_seq
+            current_id = submission_id
+            fold = _StateFold() if submission_id in limits else None
+        if fold is not None and seq <= limits[submission_id]:
+            fold.apply_json(seq, event_type, payload_json)
+    if fold is not None:
+        yield current_id, fold.to_state(), fold.last_seq
+
+
+def case_ledger_rows(
+    db: Session,
+    case_id: str,
+    *,
+    batch_size: int = REPLAY_BATCH_SIZE,
+) -> Iterator[LedgerRow]:
+    """Stream ``(submission_id, seq, event_type, payload_json)`` for a case in replay order."""
+    statement = (
+        select(
+            SubmissionEvent.submission_id,
+            SubmissionEvent.seq,
+            SubmissionEvent.event_type,
+            SubmissionEvent.event_payload_json,
+        )
+        .join(Submission, Submission.submission_id == SubmissionEvent.submission_id)
+        .where(Submission.case_id == case_id)
+        .order_by(Submission.submission_id, SubmissionEvent.seq)
+        .execution_options(yield_per=batch_size)
     )
+    yield from db.execute(statement)
+
+
+def replay_case(
+    db: Session,
+    case_id: str,
+    *,
+    batch_size: int = REPLAY_BATCH_SIZE,
+) -> Iterator[tuple[str, SubmissionState]]:
+    """Replay every submission of a case from a single ordered scan of its event ledger."""
+    yield from replay_event_rows(case_ledger_rows(db, case_id, batch_size=batch_size))
+
+
+def replay_case_with_seq(
+    db: Session,
+    case_id: str,
+    *,
+    batch_size: int = REPLAY_BATCH_SIZE,
+) -> Iterator[tuple[str, SubmissionState, int, int]]:
+    """Like :func:`replay_case`, also yielding ``events_applied`` and the last covered seq."""
+    rows = case_ledger_rows(db, case_id, batch_size=batch_size)
+    for submission_id, fold in _fold_event_rows(rows):
+        yield submission_id, fold.to_state(), fold.events_applied, fold.last_seq
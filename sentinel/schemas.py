@@ -33,6 +33,18 @@ class ScamTypeEnum(StrEnum):
     OTHER = "Other"
 
 
+class ExportFormatEnum(StrEnum):
+    JSON = "json"
+    CSV = "csv"
+
+
+class ExportJobStatusEnum(StrEnum):
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
+
+
 class ManagerActionEnum(StrEnum):
     APPROVE = "approve"
     REJECT = "reject"
@@ -124,6 +136,7 @@ class SubmissionListItem(BaseModel):
 
 class SubmissionEventResponse(BaseModel):
     event_id: UUID
+    seq: int
     event_type: str
     event_payload_json: dict[str, Any]
     created_at: datetime
@@ -135,6 +148,26 @@ class SubmissionDetail(BaseModel):
     events: list[SubmissionEventResponse]
 
 
+class EvidenceAddressItem(BaseModel):
+    chain: str
+    address: str
+
+
+class EvidencePageAddresses(BaseModel):
+    submission_id: UUID
+    content_hash: str
+    addresses: list[EvidenceAddressItem]
+
+
+class CaseEventResponse(SubmissionEventResponse):
+    submission_id: UUID
+
+
+class CaseEventFeed(BaseModel):
+    events: list[CaseEventResponse]
+    next_after_seq: int
+
+
 class ExportRecord(BaseModel):
     case_id: UUID
     submission_id: UUID
@@ -149,6 +182,26 @@ class ExportRecord(BaseModel):
     validation_summary: dict[str, Any]
 
 
+class CreateExportJobRequest(BaseModel):
+    format: ExportFormatEnum = ExportFormatEnum.JSON
+
+
+class ExportJobResponse(BaseModel):
+    job_id: UUID
+    case_id: UUID
+    format: ExportFormatEnum
+    status: ExportJobStatusEnum
+    total_records: int
+    written_records: int
+    progress: float
+    byte_size: int | None
+    file_sha256: str | None
+    download_url: str | None
+    error: str | None
+    created_at: datetime
+    completed_at: datetime | None
+
+
 def derive_case_times(
     start_time: datetime | None,
     deadline_time: datetime | None,
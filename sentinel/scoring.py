@@ -1,5 +1,24 @@
 from __future__ import annotations
 
+from typing import NamedTuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+PRIORITY_DECIMALS = 4
+# x * 10**4 is accurate to ~1e-12 for priorities in [0, 1]; anything closer than this to a .5
+# boundary is re-rounded with Python's correctly rounded round().
+_TIE_TOLERANCE = 1e-9
+
+
+class TriageWeights(NamedTuple):
+    reliability: float = 0.4
+    consensus: float = 0.3
+    confidence: float = 0.3
+
+
+DEFAULT_TRIAGE_WEIGHTS = TriageWeights()
+
 
 def compute_consensus_score(matching_same_label: int, total_for_address: int) -> float:
     if total_for_address <= 0:
@@ -19,8 +38,66 @@ def compute_triage_priority(
     contractor_reliability: float,
     consensus_score: float,
     confidence_score: int,
+    weights: TriageWeights = DEFAULT_TRIAGE_WEIGHTS,
 ) -> float:
     return round(
-        (0.4 * contractor_reliability) + (0.3 * consensus_score) + (0.3 * (confidence_score / 5)),
-        4,
+        (weights.reliability * contractor_reliability)
+        + (weights.consensus * consensus_score)
+        + (weights.confidence * (confidence_score / 5)),
+        PRIORITY_DECIMALS,
+    )
+
+
+def consensus_scores(matching_same_label: ArrayLike, total_for_address: ArrayLike) -> np.ndarray:
+    """Array version of :func:`compute_consensus_score`."""
+    matching = np.asarray(matching_same_label, dtype=np.int64)
+    total = np.asarray(total_for_address, dtype=np.int64)
+    scores = np.zeros(np.broadcast(matching, total).shape, dtype=np.float64)
+    np.divide(matching, total, out=scores, where=total > 0)
+    return scores
+
+
+def contractor_reliabilities(accepted: ArrayLike, rejected: ArrayLike) -> np.ndarray:
+    """Array version of :func:`compute_contractor_reliability`."""
+    accepted = np.asarray(accepted, dtype=np.int64)
+    total = accepted + np.asarray(rejected, dtype=np.int64)
+    scores = np.full(total.shape, 0.5, dtype=np.float64)
+    np.divide(accepted, total, out=scores, where=total > 0)
+    return scores
+
+
+def _round_like_python(values: np.ndarray, decimals: int) -> np.ndarray:
+    rounded = np.round(values, decimals)
+    scaled = values * 10.0**decimals
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < _TIE_TOLERANCE
+    for index in np.flatnonzero(near_tie):
+        rounded[index] = round(float(values[index]), decimals)
+    return rounded
+
+
+def triage_priorities(
+    *,
+    contractor_reliability: ArrayLike,
+    consensus_score: ArrayLike,
+    confidence_score: ArrayLike,
+    weights: TriageWeights = DEFAULT_TRIAGE_WEIGHTS,
+) -> np.ndarray:
+    """Array version of :func:`compute_triage_priority` for a whole case in one call.
+
+    Evaluates the same float64 expression in the same order and rounds exactly like
+    ``round(x, 4)``, so every element equals the scalar result bit for bit.
+    """
+    reliability = np.asarray(contractor_reliability, dtype=np.float64)
+    consensus = np.asarray(consensus_score, dtype=np.float64)
+    confidence = np.asarray(confidence_score, dtype=np.int64)
+    raw = (
+        (weights.reliability * reliability)
+        + (weights.consensus * consensus)
+        + (weights.confidence * (confidence / 5))
     )
+    return _round_like_python(np.atleast_1d(raw), PRIORITY_DECIMALS).reshape(raw.shape)
+
+
+def rank_by_priority(priorities: ArrayLike) -> np.ndarray:
+    """Indices ordering ``priorities`` from highest to lowest; ties keep their input order."""
+    return np.argsort(-np.asarray(priorities, dtype=np.float64), kind="stable")
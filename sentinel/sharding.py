@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session, sessionmaker
+
+from sentinel.db import DB_PATH, make_engine
+from sentinel.models import Base, ShardRoute
+
+# "case" gives every case its own database file, "bucket" hashes cases into
+# SENTINEL_SHARD_BUCKETS files; "off" keeps everything in the main database.
+SHARD_MODE = os.getenv("SENTINEL_SHARD_MODE", "off")
+SHARD_BUCKETS = int(os.getenv("SENTINEL_SHARD_BUCKETS", "16"))
+SHARD_DIR = Path(os.getenv("SENTINEL_SHARD_DIR", str(DB_PATH.parent / "shards")))
+SHARD_MODES = ("off", "case", "bucket")
+MIGRATIONS_DIR = Path(__file__).resolve().parent.parent / "migrations"
+
+# Path parameters that identify a routed row, and the catalog kind they are routed under.
+ROUTE_KINDS = {"case_id": "case", "submission_id": "submission", "job_id": "export_job"}
+
+_session_factories: dict[str, sessionmaker[Session]] = {}
+_session_factories_lock = threading.Lock()
+
+
+def sharding_enabled() -> bool:
+    if SHARD_MODE not in SHARD_MODES:
+        raise ValueError(f"unknown shard mode {SHARD_MODE!r}")
+    return SHARD_MODE != "off"
+
+
+def shard_for_case(case_id: str) -> str:
+    """Shard id for a new case: ``case-<case_id>``, or ``bucket-NNN`` from its hash."""
+    if SHARD_MODE == "bucket":
+        bucket = int(hashlib.sha256(case_id.encode("utf-8")).hexdigest(), 16) % SHARD_BUCKETS
+        return f"bucket-{bucket:03d}"
+    return f"case-{case_id}"
+
+
+def shard_url(shard_id: str) -> str:
+    return f"sqlite:///{SHARD_DIR / f'{shard_id}.db'}"
+
+
+def shard_session_factory(shard_id: str) -> sessionmaker[Session]:
+    """Process-wide session factory for ``shard_id``'s database.
+
+    A missing shard file is created with the current schema and stamped at the migration head,
+    so ``alembic upgrade`` (``make migrate-shards``) picks it up from there.
+    """
+    url = shard_url(shard_id)
+    with _session_factories_lock:
+        factory = _session_factories.get(url)
+        if factory is None:
+            SHARD_DIR.mkdir(parents=True, exist_ok=True)
+            engine = make_engine(url)
+            with engine.begin() as connection:
+                context = MigrationContext.configure(connection)
+                if context.get_current_revision() is None:
+                    Base.metadata.create_all(bind=connection)
+                    context.stamp(ScriptDirectory(str(MIGRATIONS_DIR)), "head")
+            factory = _session_factories[url] = sessionmaker(
+                bind=engine, autoflush=False, autocommit=False, class_=Session
+            )
+        return factory
+
+
+def dispose_shard_engines() -> None:
+    with _session_factories_lock:
+        factories = list(_session_factories.values())
+        _session_factories.clear()
+    for factory in factories:
+        factory.kw["bind"].dispose()
+
+
+def route_for(catalog: Session, kind: str, key: str) -> str | None:
+    return catalog.scalar(
+        select(ShardRoute.shard_id).where(ShardRoute.kind == kind, ShardRoute.key == key)
+    )
+
+
+def add_route(catalog: Session, kind: str, key: str, shard_id: str) -> None:
+    """Record that ``key`` lives in ``shard_id`` (the caller commits)."""
+    catalog.execute(
+        insert(ShardRoute)
+        .values(kind=kind, key=key, shard_id=shard_id)
+        .on_conflict_do_nothing(index_elements=["kind", "key"])
+    )
+
+
+def case_shard_ids(catalog: Session) -> list[str]:
+    """Every shard holding at least one case, for cross-case queries."""
+    return list(
+        catalog.scalars(
+            select(ShardRoute.shard_id)
+            .where(ShardRoute.kind == "case")
+            .distinct()
+            .order_by(ShardRoute.shard_id)
+        )
+    )
+
+
+def ledger_databases(database_url: str) -> list[tuple[str | None, str]]:
+    """``(shard_id, url)`` of every database that can hold cases, for maintenance scripts.
+
+    The main database comes first (shard id ``None``); sharded, it is the catalog and normally
+    holds no cases. It is followed by every shard the catalog routes a case to.
+    """
+    databases: list[tuple[str | None, str]] = [(None, database_url)]
+    if not sharding_enabled():
+        return databases
+    engine = make_engine(database_url)
+    try:
+        with Session(engine) as catalog:
+            shard_ids = case_shard_ids(catalog)
+    finally:
+        engine.dispose()
+    # A route is written just before its shard file is created; skip one that never was.
+    databases += [
+        (shard_id, shard_url(shard_id))
+        for shard_id in shard_ids
+        if (SHARD_DIR / f"{shard_id}.db").exists()
+    ]
+    return databases
+
+
+def ledger_sessions(database_url: str) -> Iterator[tuple[str | None, Session]]:
+    """A session on each of :func:`ledger_databases`, opened and disposed one at a time."""
+    for shard_id, url in ledger_databases(database_url):
+        engine = make_engine(url)
+        try:
+            with Session(engine) as db:
+                yield shard_id, db
+        finally:
+            engine.dispose()
+
+
+def shard_evidence_dir(root: Path, shard_id: str | None) -> Path:
+    """Evidence files are reference-counted per database, so each shard keeps its own."""
+    return Path(root) if shard_id is None else Path(root) / "shards" / shard_id
@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import json
+from dataclasses import asdict
+from typing import Any
+
+from sqlalchemy import and_, func, select
+from sqlalchemy.orm import Session
+
+from sentinel.hashing import canonical_json
+from sentinel.models import Case, CaseArchive, Submission, SubmissionEvent, SubmissionSnapshot
+from sentinel.replay import (
+    ReplayEvent,
+    SubmissionState,
+    case_ledger_rows,
+    reconstruct_submission_state,
+    replay_case_with_seq,
+    replay_event_rows,
+    replay_event_rows_until,
+)
+
+SNAPSHOT_INTERVAL = 50
+
+
+def state_to_json(state: SubmissionState) -> str:
+    return canonical_json(asdict(state))
+
+
+def state_from_json(text: str) -> SubmissionState:
+    return SubmissionState(**json.loads(text))
+
+
+def latest_snapshot(db: Session, submission_id: str) -> SubmissionSnapshot | None:
+    return db.scalar(
+        select(SubmissionSnapshot)
+        .where(SubmissionSnapshot.submission_id == submission_id)
+        .order_by(SubmissionSnapshot.event_sequence.desc())
+        .limit(1)
+    )
+
+
+def _latest_sequences_for_case(db: Session, case_id: str) -> dict[str, int]:
+    rows = db.execute(
+        select(SubmissionSnapshot.submission_id, func.max(SubmissionSnapshot.event_sequence))
+        .where(SubmissionSnapshot.case_id == case_id)
+        .group_by(SubmissionSnapshot.submission_id)
+    ).all()
+    return {submission_id: sequence for submission_id, sequence in rows}
+
+
+def _events_since_snapshot_for_case(db: Session, case_id: str) -> dict[str, int]:
+    latest = (
+        select(
+            SubmissionSnapshot.submission_id,
+            func.max(SubmissionSnapshot.event_sequence).label("covered"),
+        )
+        .where(SubmissionSnapshot.case_id == case_id)
+        .group_by(SubmissionSnapshot.submission_id)
+        .subquery()
+    )
+    rows = db.execute(
+        select(SubmissionEvent.submission_id, func.count())
+        .join(Submission, Submission.submission_id == SubmissionEvent.submission_id)
+        .outerjoin(latest, latest.c.submission_id == SubmissionEvent.submission_id)
+        .where(
+            Submission.case_id == case_id,
+            SubmissionEvent.seq > func.coalesce(latest.c.covered, 0),
+        )
+        .group_by(SubmissionEvent.submission_id)
+    ).all()
+    return {submission_id: count for submission_id, count in rows}
+
+
+def load_submission_state(db: Session, submission_id: str) -> SubmissionState:
+    """Rebuild a submission's state from its latest snapshot plus the events after it."""
+    snapshot = latest_snapshot(db, submission_id)
+    covered = snapshot.event_sequence if snapshot is not None else 0
+    rows = db.execute(
+        select(
+            SubmissionEvent.seq,
+            SubmissionEvent.event_type,
+            SubmissionEvent.created_at,
+            SubmissionEvent.event_payload_json,
+        )
+        .where(
+            and_(
+                SubmissionEvent.submission_id == submission_id,
+                SubmissionEvent.seq > covered,
+            )
+        )
+        .order_by(SubmissionEvent.seq)
+    ).all()
+    events = [
+        ReplayEvent(
+            event_type=event_type,
+            created_at=created_at,
+            event_payload=json.loads(payload),
+            seq=seq,
+        )
+        for seq, event_type, created_at, payload in rows
+    ]
+    base = state_from_json(snapshot.state_json) if snapshot is not None else None
+    return reconstruct_submission_state(events, presorted=True, snapshot=base)
+
+
+def case_states_as_of(db: Session, case_id: str, as_of_seq: int) -> dict[str, SubmissionState]:
+    """Every submission's state after the ledger event with ``seq == as_of_seq``.
+
+    Each submission starts from its newest snapshot at or before ``as_of_seq`` and replays only
+    the events between that snapshot and ``as_of_seq``, so a historical view costs about as
+    much as a current one. Submissions with no event at or before ``as_of_seq`` are omitted.
+    """
+    covered = (
+        select(
+            SubmissionSnapshot.submission_id,
+            func.max(SubmissionSnapshot.event_sequence).label("covered"),
+        )
+        .where(
+            SubmissionSnapshot.case_id == case_id,
+            SubmissionSnapshot.event_sequence <= as_of_seq,
+        )
+        .group_by(SubmissionSnapshot.submission_id)
+        .subquery()
+    )
+    base = {
+        submission_id: state_from_json(state_json)
+        for submission_id, state_json in db.execute(
+            select(SubmissionSnapshot.submission_id, SubmissionSnapshot.state_json).join(
+                covered,
+                and_(
+                    covered.c.submission_id == SubmissionSnapshot.submission_id,
+                    covered.c.covered == SubmissionSnapshot.event_sequence,
+                ),
+            )
+        )
+    }
+    rows = db.execute(
+        select(
+            SubmissionEvent.submission_id,
+            SubmissionEvent.seq,
+            SubmissionEvent.event_type,
+            SubmissionEvent.event_payload_json,
+        )
+        .join(Submission, Submission.submission_id == SubmissionEvent.submission_id)
+        .outerjoin(covered, covered.c.submission_id == SubmissionEvent.submission_id)
+        .where(
+            Submission.case_id == case_id,
+            SubmissionEvent.seq <= as_of_seq,
+            SubmissionEvent.seq > func.coalesce(covered.c.covered, 0),
+        )
+        .order_by(Submission.submission_id, SubmissionEvent.seq)
+    )
+    states = dict(base)
+    states.update(replay_event_rows(rows, base))
+    return states
+
+
+def create_snapshots(db: Session, case_id: str, *, interval: int = SNAPSHOT_INTERVAL) -> int:
+    """Snapshot every submission with at least ``interval`` events since its last snapshot.
+
+    ``event_sequence`` records the ledger ``seq`` of the last event folded into the snapshot.
+    """
+    pending = _events_since_snapshot_for_case(db, case_id)
+    created = 0
+    for submission_id, state, _, last_seq in replay_case_with_seq(db, case_id):
+        if pending.get(submission_id, 0) < interval:
+            continue
+        db.add(
+            SubmissionSnapshot(
+                submission_id=submission_id,
+                case_id=case_id,
+                event_sequence=last_seq,
+                state_json=state_to_json(state),
+            )
+        )
+        created += 1
+    db.commit()
+    return created
+
+
+def verify_snapshots(db: Session, case_id: str) -> list[dict[str, Any]]:
+    """Compare each submission's latest snapshot with a full replay up to the same sequence."""
+    latest = _latest_sequences_for_case(db, case_id)
+    snapshots = {
+        row.submission_id: row
+        for row in db.scalars(
+            select(SubmissionSnapshot).where(SubmissionSnapshot.case_id == case_id)
+        )
+        if row.event_sequence == latest[row.submission_id]
+    }
+    limits = {submission_id: row.event_sequence for submission_id, row in snapshots.items()}
+
+    discrepancies: list[dict[str, Any]] = []
+    replayed_ids: set[str] = set()
+    rows = case_ledger_rows(db, case_id)
+    for submission_id, replayed, last_seq in replay_event_rows_until(rows, limits):
+        replayed_ids.add(submission_id)
+        snapshot = snapshots[submission_id]
+        if last_seq != snapshot.event_sequence:
+            reason = "snapshot_beyond_ledger"
+        elif replayed != state_from_json(snapshot.state_json):
+            reason = "state_mismatch"
+        else:
+            continue
+        discrepancies.append(
+            {
+                "submission_id": submission_id,
+                "snapshot_id": snapshot.snapshot_id,
+                "event_sequence": snapshot.event_sequence,
+                "reason": reason,
+                "snapshot_state": json.loads(snapshot.state_json),
+                "replayed_state": asdict(replayed),
+            }
+        )
+
+    for submission_id in sorted(set(snapshots) - replayed_ids):
+        snapshot = snapshots[submission_id]
+        discrepancies.append(
+            {
+                "submission_id": submission_id,
+                "snapshot_id": snapshot.snapshot_id,
+                "event_sequence": snapshot.event_sequence,
+                "reason": "snapshot_beyond_ledger",
+            }
+        )
+    return discrepancies
+
+
+def all_case_ids(db: Session) -> list[str]:
+    """Cases whose ledger is in the hot tables (archived cases are verified from their files)."""
+    return list(
+        db.scalars(
+            select(Case.case_id)
+            .where(Case.case_id.not_in(select(CaseArchive.case_id)))
+            .order_by(Case.case_id)
+        )
+    )
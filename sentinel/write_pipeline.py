@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import os
+import queue
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future
+from typing import Any, TypeVar
+
+from sqlalchemy import Engine, event, make_url
+from sqlalchemy.orm import Session, sessionmaker
+
+from sentinel.db import make_engine, retry_on_lock
+
+# "1" routes ingest and manager-action writes through one writer thread per database.
+WRITE_PIPELINE_ENABLED = os.getenv("SENTINEL_WRITE_PIPELINE", "0") == "1"
+WRITE_BATCH_SIZE = int(os.getenv("SENTINEL_WRITE_BATCH_SIZE", "64"))
+WRITE_BATCH_WAIT_SECONDS = float(os.getenv("SENTINEL_WRITE_BATCH_WAIT_MS", "2")) / 1000
+STATS_WINDOW = 1024
+
+T = TypeVar("T")
+WriteWork = Callable[[Session], T]
+
+_pipelines: dict[str, WritePipeline] = {}
+_pipelines_lock = threading.Lock()
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class PipelineStats:
+    """Batch sizes and commit latencies of a :class:`WritePipeline` (recent window)."""
+
+    def __init__(self, window: int = STATS_WINDOW) -> None:
+        self.batches = 0
+        self.jobs = 0
+        self.failed_jobs = 0
+        self.max_batch_size = 0
+        self.batch_sizes: deque[int] = deque(maxlen=window)
+        self.commit_ms: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, batch_size: int, commit_ms: float, failed: int) -> None:
+        with self._lock:
+            self.batches += 1
+            self.jobs += batch_size
+            self.failed_jobs += failed
+            self.max_batch_size = max(self.max_batch_size, batch_size)
+            self.batch_sizes.append(batch_size)
+            self.commit_ms.append(commit_ms)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            sizes = list(self.batch_sizes)
+            latencies = list(self.commit_ms)
+            totals = {
+                "batches": self.batches,
+                "jobs": self.jobs,
+                "failed_jobs": self.failed_jobs,
+                "max_batch_size": self.max_batch_size,
+            }
+        return {
+            **totals,
+            "mean_batch_size": round(sum(sizes) / len(sizes), 3) if sizes else 0.0,
+            "commit_ms": {
+                "mean": round(sum(latencies) / len(latencies), 3) if latencies else 0.0,
+                "p50": round(_percentile(latencies, 0.5), 3),
+                "p95": round(_percentile(latencies, 0.95), 3),
+                "max": round(max(latencies, default=0.0), 3),
+            },
+        }
+
+
+def writer_engine(url: str) -> Engine:
+    """Engine for the writer thread (with the configured SQLite profile): explicit
+    ``BEGIN IMMEDIATE`` so the batch takes SQLite's write lock up front, and working SAVEPOINTs
+    for per-job isolation."""
+    engine = make_engine(url)
+
+    @event.listens_for(engine, "connect")
+    def _disable_implicit_begin(dbapi_connection, _record) -> None:
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _begin_immediate(connection) -> None:
+        connection.exec_driver_sql("BEGIN IMMEDIATE")
+
+    return engine
+
+
+class _Job:
+    __slots__ = ("work", "future")
+
+    def __init__(self, work: WriteWork, future: Future) -> None:
+        self.work = work
+        self.future = future
+
+
+class WritePipeline:
+    """Dedicated writer thread that group-commits queued work.
+
+    Each job is a function of the writer's :class:`Session`; it must not commit. Up to
+    ``max_batch`` jobs that arrive within ``max_wait`` seconds of the first run in one
+    transaction, each inside its own SAVEPOINT, so a failing job is rolled back and reported to
+    its caller without affecting the rest of the batch. Results are delivered only after the
+    batch has committed. Job results must be plain values, not ORM objects.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        *,
+        max_batch: int = WRITE_BATCH_SIZE,
+        max_wait: float = WRITE_BATCH_WAIT_SECONDS,
+    ) -> None:
+        self.session_factory = session_factory
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.stats = PipelineStats()
+        self._queue: queue.Queue[_Job | None] = queue.Queue()
+        self._closing = False
+        self._thread = threading.Thread(target=self._run, name="sentinel-writer", daemon=True)
+        self._thread.start()
+
+    def enqueue(self, work: WriteWork[T]) -> Future[T]:
+        """Queue ``work``; the future resolves once its batch has committed."""
+        future: Future[T] = Future()
+        self._queue.put(_Job(work, future))
+        return future
+
+    def submit(self, work: WriteWork[T]) -> T:
+        """Queue ``work`` and block until its batch has committed."""
+        return self.enqueue(work).result()
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+
+    def _next_batch(self) -> list[_Job]:
+        first = self._queue.get()
+        if first is None:
+            self._closing = True
+            return []
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch:
+            try:
+                job = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                break
+            if job is None:
+                self._closing = True
+                break
+            batch.append(job)
+        return batch
+
+    def _run(self) -> None:
+        while not self._closing:
+            batch = self._next_batch()
+            if batch:
+                self._commit_batch(batch)
+
+    def _commit_batch(self, batch: list[_Job]) -> None:
+        with self.session_factory() as session:
+
+            def run_batch() -> tuple[list[tuple[_Job, bool, Any]], float]:
+                outcomes: list[tuple[_Job, bool, Any]] = []
+                for job in batch:
+                    try:
+                        with session.begin_nested():
+                            outcomes.append((job, True, job.work(session)))
+                    except Exception as exc:
+                        outcomes.append((job, False, exc))
+                start = time.perf_counter()
+                session.commit()
+                return outcomes, (time.perf_counter() - start) * 1000
+
+            try:
+                outcomes, commit_ms = retry_on_lock(session, run_batch)
+            except Exception as exc:
+                for job in batch:
+                    job.future.set_exception(exc)
+                return
+
+        failed = sum(1 for _job, ok, _value in outcomes if not ok)
+        self.stats.record(len(batch), commit_ms, failed)
+        for job, ok, value in outcomes:
+            if ok:
+                job.future.set_result(value)
+            else:
+                job.future.set_exception(value)
+
+
+def pipeline_enabled() -> bool:
+    return WRITE_PIPELINE_ENABLED
+
+
+def pipeline_for(bind: Engine) -> WritePipeline:
+    """The process-wide pipeline writing to ``bind``'s database (started on first use)."""
+    url = bind.url.render_as_string(hide_password=False)
+    with _pipelines_lock:
+        pipeline = _pipelines.get(url)
+        if pipeline is None:
+            session_factory = sessionmaker(
+                bind=writer_engine(url), autoflush=False, autocommit=False, class_=Session
+            )
+            pipeline = _pipelines[url] = WritePipeline(session_factory)
+        return pipeline
+
+
+def pipeline_stats() -> dict[str, dict[str, Any]]:
+    with _pipelines_lock:
+        pipelines = dict(_pipelines)
+    return {
+        make_url(url).render_as_string(hide_password=True): pipeline.stats.snapshot()
+        for url, pipeline in pipelines.items()
+    }
+
+
+def shutdown_write_pipelines() -> None:
+    with _pipelines_lock:
+        pipelines = list(_pipelines.values())
+        _pipelines.clear()
+    for pipeline in pipelines:
+        pipeline.close()
+
+
+def run_write(db: Session, work: WriteWork[T]) -> T:
+    """Run ``work`` in a committed transaction.
+
+    With ``SENTINEL_WRITE_PIPELINE=1`` it is queued to the writer thread for ``db``'s database
+    and ``db`` is only used to locate it; otherwise it runs on ``db`` and commits, retrying
+    when SQLite reports the database as locked.
+    """
+    if pipeline_enabled():
+        return pipeline_for(db.get_bind()).submit(work)
+
+    def transaction() -> T:
+        result = work(db)
+        db.commit()
+        return result
+
+    return retry_on_lock(db, transaction)
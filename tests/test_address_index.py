@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import uuid
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, sessionmaker
+
+import app.main as api_main
+import sentinel.intelligence.evidence_analyzer as evidence_analyzer
+from app.main import app
+from sentinel.db import get_db_session
+from sentinel.intelligence.address_index import extract_addresses
+from sentinel.intelligence.rules import evaluate_rules
+from sentinel.models import Base, Contractor, EvidenceBlob
+
+ETH_A = "0x" + "a" * 40
+ETH_B = "0x" + "B" * 40
+BTC = "bc1qar0srrr7xfkvy5l643lydnw9re59gtzzwf5mdq"
+SOL = "7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU"
+BASE58 = "1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa"  # valid for BTC and SOL
+PAGE = (
+    f"<p>Drainer wallets: {ETH_A}, {ETH_B} and {BTC}.</p>"
+    f"<p>Swept to {SOL} and {BASE58} via https://explorer.example/tx/{'f' * 64}</p>"
+    f"<p>Glued tokens are ignored: x{ETH_A[2:]}0x{'c' * 41}</p>"
+)
+
+
+async def _fetch_page_async(*_):
+    return PAGE, True, ["Source reachable"]
+
+
+def test_extract_addresses_scans_all_chains_once():
+    assert extract_addresses(PAGE) == [
+        ("BTC", BASE58),
+        ("BTC", BTC),
+        ("ETH", ETH_B),
+        ("ETH", ETH_A),
+        ("SOL", BASE58),
+        ("SOL", SOL),
+    ]
+    assert extract_addresses("no addresses here") == []
+
+
+def test_known_addresses_agree_with_the_substring_rule():
+    known = frozenset(address.lower() for _chain, address in extract_addresses(PAGE))
+    for address in (ETH_A, ETH_B.lower(), BTC, SOL, BASE58, "0x" + "d" * 40, ETH_A[:30]):
+        assert evaluate_rules(address, "Phishing", PAGE, known) == evaluate_rules(
+            address, "Phishing", PAGE
+        )
+
+
+def _setup_client(tmp_path: Path):
+    db_file = tmp_path / "address_index.db"
+    engine = create_engine(f"sqlite:///{db_file}", future=True)
+    session_factory = sessionmaker(bind=engine, autoflush=False, autocommit=False, class_=Session)
+    Base.metadata.create_all(bind=engine)
+
+    def override_get_db_session():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db_session] = override_get_db_session
+    return TestClient(app), session_factory
+
+
+def test_evidence_addresses_endpoint_lists_other_addresses_on_the_page(monkeypatch, tmp_path):
+    client, session_factory = _setup_client(tmp_path)
+    monkeypatch.setattr(api_main, "EVIDENCE_DIR", tmp_path / "evidence")
+    monkeypatch.setattr(
+        evidence_analyzer,
+        "fetch_evidence_html",
+        lambda *_: (PAGE, True, ["Source reachable"]),
+    )
+    monkeypatch.setattr(evidence_analyzer, "fetch_evidence_html_async", _fetch_page_async)
+
+    with client:
+        case_id = client.post("/cases", json={"title": "Drainers", "priority": "HIGH"}).json()[
+            "case_id"
+        ]
+        contractor_id = str(uuid.uuid4())
+        with session_factory() as db:
+            db.add(Contractor(contractor_id=contractor_id, handle="ct_addresses"))
+            db.commit()
+
+        submission_ids = []
+        for address in (ETH_A, ETH_B):
+            response = client.post(
+                f"/cases/{case_id}/submit",
+                json={
+                    "contractor_id": contractor_id,
+                    "blockchain": "ETH",
+                    "address": address,
+                    "scam_type": "Phishing",
+                    "source_url": "https://example.com/report",
+                    "confidence_score": 4,
+                },
+            )
+            submission_ids.append(response.json()["submission_id"])
+
+        response = client.get(f"/submissions/{submission_ids[0]}/evidence/addresses")
+        assert response.status_code == 200
+        body = response.json()
+        assert [(item["chain"], item["address"]) for item in body["addresses"]] == [
+            ("BTC", BASE58),
+            ("BTC", BTC),
+            ("ETH", ETH_B),
+            ("SOL", BASE58),
+            ("SOL", SOL),
+        ]
+        second = client.get(f"/submissions/{submission_ids[1]}/evidence/addresses").json()
+        assert second["content_hash"] == body["content_hash"]
+        assert ("ETH", ETH_A) in [(item["chain"], item["address"]) for item in second["addresses"]]
+
+        detail = client.get(f"/submissions/{submission_ids[1]}").json()
+        [analysis] = [
+            event["event_payload_json"]
+            for event in detail["events"]
+            if event["event_type"] == "EVIDENCE_ANALYZED"
+        ]
+        assert analysis["address_found"] is True
+
+        missing = client.get(f"/submissions/{uuid.uuid4()}/evidence/addresses")
+        assert missing.json()["detail"] == "submission_not_found"
+
+    with session_factory() as db:
+        assert db.scalar(select(EvidenceBlob.address_count)) == 6
+
+    app.dependency_overrides.clear()
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import uuid
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.main import app
+from sentinel.db import get_db_session
+from sentinel.models import Base, Contractor, SubmissionEvent
+from sentinel.snapshots import create_snapshots
+
+
+def _setup_client(tmp_path: Path):
+    db_file = tmp_path / "as_of.db"
+    engine = create_engine(f"sqlite:///{db_file}", future=True)
+    session_factory = sessionmaker(bind=engine, autoflush=False, autocommit=False, class_=Session)
+    Base.metadata.create_all(bind=engine)
+
+    def override_get_db_session():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db_session] = override_get_db_session
+    return TestClient(app), session_factory
+
+
+def _current_seq(session_factory) -> int:
+    with session_factory() as db:
+        return db.scalar(select(func.max(SubmissionEvent.seq))) or 0
+
+
+def test_as_of_views_match_the_ledger_at_that_seq(tmp_path: Path) -> None:
+    client, session_factory = _setup_client(tmp_path)
+
+    with client:
+        case_id = client.post("/cases", json={"title": "As Of", "priority": "HIGH"}).json()[
+            "case_id"
+        ]
+        contractor_id = str(uuid.uuid4())
+        with session_factory() as db:
+            db.add(Contractor(contractor_id=contractor_id, handle="ct_as_of"))
+            db.commit()
+
+        submission_ids = []
+        for index in range(2):
+            response = client.post(
+                f"/cases/{case_id}/submit",
+                json={
+                    "contractor_id": contractor_id,
+                    "blockchain": "ETH",
+                    "address": f"0x{index + 1:040x}",
+                    "scam_type": "Phishing",
+                    "source_url": "https://example.com/evidence",
+                    "confidence_score": 4,
+                },
+            )
+            submission_ids.append(response.json()["submission_id"])
+            if index == 0:
+                after_first = _current_seq(session_factory)
+        before_review = _current_seq(session_factory)
+
+        client.post(
+            f"/submissions/{submission_ids[0]}/actions",
+            json={"action": "approve", "actor": "manager", "notes": ""},
+        )
+        client.post(
+            f"/submissions/{submission_ids[1]}/actions",
+            json={"action": "reject", "actor": "manager", "notes": ""},
+        )
+        with session_factory() as db:
+            create_snapshots(db, case_id, interval=1)
+        after_review = _current_seq(session_factory)
+
+        historical = client.get(f"/cases/{case_id}/submissions?as_of={before_review}").json()
+        assert {item["latest_event_type"] for item in historical} == {"EVIDENCE_ANALYZED"}
+        assert {item["submission_id"] for item in historical} == set(submission_ids)
+
+        only_first = client.get(f"/cases/{case_id}/submissions?as_of={after_first}").json()
+        assert [item["submission_id"] for item in only_first] == [submission_ids[0]]
+
+        current = client.get(f"/cases/{case_id}/submissions").json()
+        as_of_now = client.get(f"/cases/{case_id}/submissions?as_of={after_review}").json()
+        assert as_of_now == current
+
+        assert client.get(f"/cases/{case_id}/export?as_of={before_review}").json() == []
+        exported = client.get(f"/cases/{case_id}/export?as_of={after_review}").json()
+        assert [record["submission_id"] for record in exported] == [submission_ids[0]]
+        assert _current_seq(session_factory) == after_review
+
+        past = client.get(f"/cases/{case_id}/submissions?as_of=2000-01-01T00:00:00Z")
+        assert past.status_code == 200
+        assert past.json() == []
+        invalid = client.get(f"/cases/{case_id}/submissions?as_of=yesterday")
+        assert invalid.status_code == 400
+        assert invalid.json()["detail"] == "invalid_as_of"
+
+    app.dependency_overrides.clear()
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import asyncio
+import time
+import uuid
+from pathlib import Path
+
+import anyio
+import httpx
+import pytest
+from sqlalchemy import create_engine, make_url, select
+from sqlalchemy.orm import Session, sessionmaker
+
+import app.main as api_main
+import sentinel.async_db as async_db
+from app.main import app
+from sentinel.async_db import async_url
+from sentinel.db import get_db_session
+from sentinel.intelligence import evidence_analyzer
+from sentinel.models import Base, Contractor, Submission
+
+pytest.importorskip("aiosqlite")
+pytest.importorskip("greenlet")
+
+PAGE = "<p>Phishing kit drained wallet funds</p>"
+FETCH_SECONDS = 0.5
+
+
+def test_async_url_swaps_in_the_async_driver():
+    assert str(async_url(make_url("sqlite:///data/x.db"))) == "sqlite+aiosqlite:///data/x.db"
+    assert str(async_url(make_url("sqlite+aiosqlite:///x.db"))) == "sqlite+aiosqlite:///x.db"
+    with pytest.raises(ValueError, match="no async driver"):
+        async_url(make_url("mysql://db/sentinel"))
+
+
+def test_concurrent_submits_are_not_bounded_by_the_threadpool(monkeypatch, tmp_path: Path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'async.db'}", future=True)
+    session_factory = sessionmaker(bind=engine, autoflush=False, autocommit=False, class_=Session)
+    Base.metadata.create_all(bind=engine)
+
+    def override_get_db_session():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def slow_page(*_):
+        await asyncio.sleep(FETCH_SECONDS)
+        return PAGE, True, ["Source reachable"]
+
+    app.dependency_overrides[get_db_session] = override_get_db_session
+    monkeypatch.setattr(async_db, "ASYNC_DB_ENABLED", True)
+    monkeypatch.setattr(evidence_analyzer, "fetch_evidence_html_async", slow_page)
+    monkeypatch.setattr(api_main, "EVIDENCE_DIR", tmp_path / "evidence")
+    contractor_id = str(uuid.uuid4())
+    with session_factory() as db:
+        db.add(Contractor(contractor_id=contractor_id, handle="ct_async"))
+        db.commit()
+
+    async def burst(n: int) -> float:
+        anyio.to_thread.current_default_thread_limiter().total_tokens = 2
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            case = await client.post("/cases", json={"title": "Async", "priority": "HIGH"})
+            case_id = case.json()["case_id"]
+            start = time.perf_counter()
+            responses = await asyncio.gather(
+                *(
+                    client.post(
+                        f"/cases/{case_id}/submit",
+                        json={
+                            "contractor_id": contractor_id,
+                            "blockchain": "ETH",
+                            "address": "0x" + f"{index + 1:040x}",
+                            "scam_type": "Phishing",
+                            "source_url": "https://example.com/report",
+                            "confidence_score": 4,
+                        },
+                    )
+                    for index in range(n)
+                )
+            )
+        assert [response.status_code for response in responses] == [200] * n
+        await async_db.dispose_async_engines()
+        return time.perf_counter() - start
+
+    n = 16
+    elapsed = asyncio.run(burst(n))
+    app.dependency_overrides.clear()
+
+    # Two threadpool threads would need n / 2 sequential fetches; the async path overlaps them.
+    assert elapsed < n / 2 * FETCH_SECONDS
+    with session_factory() as db:
+        assert len(db.scalars(select(Submission)).all()) == n
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import json
+import uuid
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select, update
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.main import app
+from scripts.rehash_submissions import rehash_submissions
+from sentinel.db import get_db_session
+from sentinel.hashing import submission_hash, submission_hashes
+from sentinel.models import Base, Contractor, Submission
+
+
+def _parse(raw: str) -> dict:
+    return json.loads(raw)
+
+
+@pytest.mark.parametrize("executor", ["serial", "thread", "process"])
+def test_submission_hashes_match_single_row_hashing_in_order(executor: str) -> None:
+    payloads = [{"index": i, "note": "é" * (i % 7), "tags": [i, None]} for i in range(2503)]
+    expected = [submission_hash(payload) for payload in payloads]
+
+    streamed = submission_hashes(iter(payloads), executor=executor, workers=2, chunk_size=400)
+    assert list(streamed) == expected
+
+    raw = (json.dumps(payload) for payload in payloads)
+    prepared = submission_hashes(raw, prepare=_parse, executor=executor, workers=2, chunk_size=97)
+    assert list(prepared) == expected
+
+
+def test_submission_hashes_rejects_bad_arguments() -> None:
+    with pytest.raises(ValueError):
+        list(submission_hashes([{}], executor="gpu"))
+    with pytest.raises(ValueError):
+        list(submission_hashes([{}], chunk_size=0))
+
+
+def test_rehash_submissions_reports_tampered_payloads(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'rehash.db'}", future=True)
+    session_factory = sessionmaker(bind=engine, autoflush=False, autocommit=False, class_=Session)
+    Base.metadata.create_all(bind=engine)
+
+    def override_get_db_session():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db_session] = override_get_db_session
+    with TestClient(app) as client:
+        case_id = client.post("/cases", json={"title": "Rehash"}).json()["case_id"]
+        contractor_id = str(uuid.uuid4())
+        with session_factory() as db:
+            db.add(Contractor(contractor_id=contractor_id, handle="ct_rehash"))
+            db.commit()
+        for index in range(6):
+            client.post(
+                f"/cases/{case_id}/submit",
+                json={
+                    "contractor_id": contractor_id,
+                    "blockchain": "ETH",
+                    "address": f"0x{index + 1:040x}",
+                    "scam_type": "Phishing",
+                    "source_url": "https://example.com/evidence",
+                    "confidence_score": 3,
+                },
+            )
+    app.dependency_overrides.clear()
+
+    with session_factory() as db:
+        report = rehash_submissions(db, workers=2, chunk_size=2)
+        assert report["ok"] and report["submissions"] == 6
+
+        tampered = db.scalars(select(Submission.submission_id).limit(1)).one()
+        db.execute(
+            update(Submission)
+            .where(Submission.submission_id == tampered)
+            .values(raw_payload_json='{"confidence_score":5}')
+        )
+        db.commit()
+
+        report = rehash_submissions(db, executor="thread", workers=2, chunk_size=4)
+        assert [item["submission_id"] for item in report["mismatches"]] == [tampered]
+
+        # An undecodable payload is reported and the run goes on to the rows after it.
+        db.execute(
+            update(Submission)
+            .where(Submission.submission_id == tampered)
+            .values(raw_payload_json="{not json")
+        )
+        db.commit()
+        report = rehash_submissions(db, executor="process", workers=2, chunk_size=2)
+        assert report["submissions"] == 6 and not report["ok"]
+        [mismatch] = report["mismatches"]
+        assert mismatch["submission_id"] == tampered
+        assert mismatch["error"].startswith("JSONDecodeError")
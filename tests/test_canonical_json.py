@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+from unittest import mock
+
+import pytest
+from hypothesis import example, given, settings
+from hypothesis import strategies as st
+
+from sentinel import hashing
+from sentinel.hashing import canonical_json
+
+
+def _reference(data: Any) -> str:
+    return json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+
+
+_scalars = (
+    st.none()
+    | st.booleans()
+    | st.integers()
+    | st.integers(min_value=-(2**70), max_value=2**70)
+    | st.floats(allow_nan=True, allow_infinity=True)
+    | st.floats(min_value=-1e17, max_value=1e17)
+    | st.text()
+    | st.text(alphabet=st.characters(min_codepoint=0, max_codepoint=0x2FF))
+)
+_values = st.recursive(
+    _scalars,
+    lambda children: st.lists(children, max_size=5)
+    | st.lists(children, max_size=3).map(tuple)
+    | st.dictionaries(st.text(), children, max_size=5),
+    max_leaves=30,
+)
+_payloads = st.dictionaries(st.text(), _values, max_size=8)
+
+
+@settings(max_examples=300, deadline=None)
+@given(_payloads)
+@example({"emoji": "\U0001f600", "del": "\x7f", "ctrl": "\x00\x1f\b\f\n\r\t", "sep": " "})
+@example({"small": 1e-05, "edge": 1e-4, "big": 1e16, "below": 9999999999999998.0, "neg": -0.0})
+@example({"nan": float("nan"), "inf": float("inf"), "huge": 2**64, "min": -(2**63) - 1})
+@example({"lone": "\ud800", "nested": [[[{"b": 1, "a": [None, True, 0.5]}]]]})
+def test_canonical_json_matches_stdlib_bytes(payload: dict[str, Any]) -> None:
+    assert canonical_json(payload) == _reference(payload)
+
+
+@settings(max_examples=100, deadline=None)
+@given(_payloads)
+def test_canonical_json_without_accelerator_matches_stdlib(payload: dict[str, Any]) -> None:
+    with mock.patch.object(hashing, "orjson", None):
+        assert canonical_json(payload) == _reference(payload)
+
+
+def test_canonical_json_keeps_stdlib_behaviour_outside_the_fast_subset() -> None:
+    from sentinel.events import EventType
+
+    deep: dict[str, Any] = {"leaf": 1}
+    for _ in range(100):
+        deep = {"child": deep}
+    for payload in (
+        {2: "int key", 1: "sorted before conversion"},
+        {"event": EventType.APPROVED},
+        {"deep": deep},
+    ):
+        assert canonical_json(payload) == _reference(payload)
+
+    with pytest.raises(TypeError):
+        canonical_json({"when": object()})
+    circular: dict[str, Any] = {}
+    circular["self"] = circular
+    with pytest.raises(ValueError):
+        canonical_json(circular)
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from sqlalchemy import func, select
+
+import app.main as api_main
+import scripts.archive_cases as archive_cases
+from app.main import app
+from scripts.simulate_failure import _create_case, _seed_contractors, _setup_test_client
+from sentinel.archive import (
+    ArchiveIntegrityError,
+    archive_case,
+    archived_evidence_text,
+    clear_archive_views,
+    close_case,
+    verify_case_archive,
+)
+from sentinel.intelligence import evidence_analyzer
+from sentinel.intelligence.evidence_store import EvidenceStore
+from sentinel.ledger import create_checkpoint
+from sentinel.models import (
+    ArchivedSubmission,
+    CaseArchive,
+    EvidenceBlob,
+    Submission,
+    SubmissionEvent,
+    SubmissionEvidence,
+)
+from sentinel.snapshots import all_case_ids
+
+pytest.importorskip("pyarrow")
+
+ADDRESS = "0x" + "cd" * 20
+OTHER_ADDRESS = "0x" + "ef" * 20
+
+
+def _page(*_):
+    return f"<html><body>Drainer {ADDRESS} and {OTHER_ADDRESS}</body></html>", True, []
+
+
+async def _page_async(*args):
+    return _page(*args)
+
+
+@pytest.fixture
+def archive_client(monkeypatch, tmp_path: Path):
+    monkeypatch.setattr(api_main, "EVIDENCE_DIR", tmp_path / "evidence")
+    monkeypatch.setattr(evidence_analyzer, "fetch_evidence_html", _page)
+    monkeypatch.setattr(evidence_analyzer, "fetch_evidence_html_async", _page_async)
+    client, session_factory = _setup_test_client(tmp_path / "hot.db")
+    with client:
+        yield client, session_factory
+    app.dependency_overrides.clear()
+    clear_archive_views()
+
+
+def _submit(client, case_id: str, contractor_id: str, scam_type: str = "Phishing"):
+    return client.post(
+        f"/cases/{case_id}/submit",
+        json={
+            "contractor_id": contractor_id,
+            "blockchain": "ETH",
+            "address": ADDRESS,
+            "scam_type": scam_type,
+            "source_url": "https://example.com/evidence",
+            "confidence_score": 4,
+        },
+    )
+
+
+def _read_views(client, case_id: str, submission_id: str, as_of: int) -> dict:
+    return {
+        "submissions": client.get(f"/cases/{case_id}/submissions").json(),
+        "as_of": client.get(f"/cases/{case_id}/submissions", params={"as_of": as_of}).json(),
+        "case_reliability": client.get(
+            f"/cases/{case_id}/submissions", params={"reliability": "case"}
+        ).json(),
+        "events": client.get(f"/cases/{case_id}/events").json(),
+        "detail": client.get(f"/submissions/{submission_id}").json(),
+        "addresses": client.get(f"/submissions/{submission_id}/evidence/addresses").json(),
+        "export": client.get(f"/cases/{case_id}/export", params={"as_of": as_of}).json(),
+    }
+
+
+def test_archived_case_is_served_from_its_parquet_files(archive_client, tmp_path: Path):
+    client, session_factory = archive_client
+    contractors = _seed_contractors(session_factory, 2)
+    case_id = _create_case(client, title="Closed investigation")
+    submission_ids = [
+        _submit(client, case_id, contractors[0]).json()["submission_id"],
+        _submit(client, case_id, contractors[1], "Rugpull").json()["submission_id"],
+    ]
+    approve = client.post(
+        f"/submissions/{submission_ids[0]}/actions", json={"action": "approve", "actor": "mgr"}
+    )
+    assert approve.status_code == 200
+    with session_factory() as db:
+        create_checkpoint(db, case_id)
+        last_seq = db.scalar(select(func.max(SubmissionEvent.seq)))
+        [(text_hash, compression)] = db.execute(
+            select(EvidenceBlob.content_hash, EvidenceBlob.compression)
+        ).all()
+    text = EvidenceStore(tmp_path / "evidence").read(text_hash, compression)
+    assert ADDRESS in text
+    before = _read_views(client, case_id, submission_ids[0], last_seq)
+    assert before["export"] and before["addresses"]["addresses"]
+
+    url = f"sqlite:///{tmp_path / 'hot.db'}"
+    assert archive_cases.main(["--database-url", url, "close", case_id]) == 0
+    assert _submit(client, case_id, contractors[0]).json()["detail"] == "case_closed"
+    archive_args = ["--archive-dir", str(tmp_path / "archive")]
+    archive_args += ["--evidence-dir", str(tmp_path / "evidence")]
+    assert archive_cases.main(["--database-url", url, "archive", *archive_args]) == 0
+    assert archive_cases.main(["--database-url", url, "verify"]) == 0
+
+    with session_factory() as db:
+        assert db.scalar(select(func.count()).select_from(Submission)) == 0
+        assert db.scalar(select(func.count()).select_from(SubmissionEvent)) == 0
+        assert db.scalar(select(func.count()).select_from(EvidenceBlob)) == 0
+        assert set(db.scalars(select(ArchivedSubmission.submission_id))) == set(submission_ids)
+        assert all_case_ids(db) == []
+        # The evidence file is released, but its text lives on in the archive.
+        assert archived_evidence_text(db.get(CaseArchive, case_id), text_hash) == text
+    assert not list((tmp_path / "evidence").rglob("*.txt*"))
+    assert sorted(path.name for path in (tmp_path / "archive" / case_id).iterdir()) == [
+        "evidence_addresses.parquet",
+        "evidence_texts.parquet",
+        "manifest.json",
+        "submission_events.parquet",
+        "submission_evidence.parquet",
+        "submissions.parquet",
+    ]
+
+    assert _read_views(client, case_id, submission_ids[0], last_seq) == before
+    assert [case["status"] for case in client.get("/cases").json()] == ["CLOSED"]
+    for response in (
+        _submit(client, case_id, contractors[0]),
+        client.post(
+            f"/submissions/{submission_ids[1]}/actions", json={"action": "reject", "actor": "mgr"}
+        ),
+        client.post(f"/cases/{case_id}/exports", json={"format": "json"}),
+        client.get(f"/cases/{case_id}/export"),
+    ):
+        assert response.status_code == 409
+        assert response.json()["detail"] == "case_archived"
+
+
+def test_tampered_archive_fails_verification(archive_client, tmp_path: Path):
+    client, session_factory = archive_client
+    [contractor_id] = _seed_contractors(session_factory, 1)
+    case_id = _create_case(client, title="Tampered")
+    _submit(client, case_id, contractor_id)
+
+    with session_factory() as db:
+        with pytest.raises(ValueError, match="not closed"):
+            archive_case(db, case_id, EvidenceStore(tmp_path / "evidence"), tmp_path / "archive")
+        close_case(db, case_id)
+        archive = archive_case(
+            db, case_id, EvidenceStore(tmp_path / "evidence"), tmp_path / "archive"
+        )
+        assert verify_case_archive(db, case_id).ok
+
+        events_file = Path(archive.archive_path) / "submission_events.parquet"
+        events_file.write_bytes(events_file.read_bytes()[:-16] + b"\0" * 16)
+        report = verify_case_archive(db, case_id)
+    assert report.issues == [
+        {"check": "file", "path": str(events_file), "error": "sha256_mismatch"}
+    ]
+    clear_archive_views()
+    resp = client.get(f"/cases/{case_id}/submissions")
+    assert resp.status_code == 500
+    assert resp.json()["detail"] == "case_archive_corrupt"
+
+
+def test_archive_is_refused_when_an_evidence_text_cannot_be_kept(archive_client, tmp_path: Path):
+    client, session_factory = archive_client
+    [contractor_id] = _seed_contractors(session_factory, 1)
+    case_id = _create_case(client, title="Lost evidence")
+    _submit(client, case_id, contractor_id)
+    store = EvidenceStore(tmp_path / "evidence")
+
+    with session_factory() as db:
+        text_hash, compression = db.execute(
+            select(EvidenceBlob.content_hash, EvidenceBlob.compression)
+        ).one()
+        store.remove(text_hash, compression)
+        close_case(db, case_id)
+        with pytest.raises(ArchiveIntegrityError):
+            archive_case(db, case_id, store, tmp_path / "archive")
+        assert db.get(CaseArchive, case_id) is None
+        assert db.scalar(select(func.count()).select_from(SubmissionEvidence)) == 1
+    assert not (tmp_path / "archive" / case_id).exists()
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from itertools import product
+
+from sentinel.compact_state import (
+    CompactSubmissionState,
+    StateColumns,
+    StateFlag,
+    pack_flags,
+)
+from sentinel.events import EventType
+from sentinel.replay import SubmissionState, replay_event_rows
+
+
+def _state(latest: str = "INGESTED", **overrides) -> SubmissionState:
+    fields = {
+        "latest_event_type": latest,
+        "validated": False,
+        "approved": False,
+        "rejected": False,
+        "conflicted": False,
+        "exported": False,
+        "escalated": False,
+        "needs_more_evidence": False,
+        "duplicate_of": [],
+        "conflict_with": [],
+    }
+    fields.update(overrides)
+    return SubmissionState(**fields)
+
+
+def test_compact_state_round_trips_every_flag_combination() -> None:
+    names = [
+        "validated",
+        "approved",
+        "rejected",
+        "conflicted",
+        "exported",
+        "escalated",
+        "needs_more_evidence",
+    ]
+    for bits in product([False, True], repeat=len(names)):
+        for latest in ["", *(event.value for event in EventType)]:
+            state = _state(latest, **dict(zip(names, bits, strict=True)), duplicate_of=["x"])
+            compact = CompactSubmissionState.from_state(state)
+
+            assert compact.to_state() == state
+            assert compact.latest_event_type == latest
+            assert compact.has(StateFlag.APPROVED) is state.approved
+            assert pack_flags(state) < 1 << 7
+
+
+def test_state_columns_store_replayed_states_and_answer_flag_queries() -> None:
+    rows = []
+    for index in range(3000):
+        submission_id = f"s{index:05d}"
+        rows.append((submission_id, 4 * index + 1, "INGESTED", "{}"))
+        rows.append(
+            (
+                submission_id,
+                4 * index + 2,
+                "VALIDATED",
+                (
+                    '{"passed":true,"duplicate_of":[],"conflict_with":["s00000"]}'
+                    if index % 10 == 0
+                    else '{"passed":true,"duplicate_of":[],"conflict_with":[]}'
+                ),
+            )
+        )
+        if index % 3 == 0:
+            rows.append((submission_id, 4 * index + 3, "APPROVED", "{}"))
+    states = dict(replay_event_rows(rows))
+
+    columns = StateColumns.from_states(states.items())
+
+    assert len(columns) == 3000
+    assert dict(columns.items()) == states
+    assert columns.count(StateFlag.APPROVED) == 1000
+    assert columns.count(StateFlag.VALIDATED | StateFlag.APPROVED) == 1000
+    assert columns.select(StateFlag.APPROVED)[:2] == ["s00000", "s00003"]
+    assert columns.latest_type_counts() == {"VALIDATED": 2000, "APPROVED": 1000}
+    assert int(columns.conflict_counts.sum()) == 300
+    assert columns.nbytes() < 3000 * 16
+
+    columns.put("s00000", _state("REJECTED", validated=True, rejected=True))
+    assert len(columns) == 3000
+    assert columns.get("s00000").rejected is True
+    assert columns.get("s00000").conflict_with == []
+    assert columns.count(StateFlag.APPROVED) == 999
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from app.main import app
+from scripts.simulate_failure import (
+    _create_case,
+    _seed_contractors,
+    _setup_test_client,
+    scenario_parallel_conflicts,
+)
+
+
+def test_parallel_submissions_for_one_address_miss_no_conflicts(tmp_path: Path):
+    client, session_factory = _setup_test_client(tmp_path / "races.db")
+    with client:
+        contractors = _seed_contractors(session_factory, 8)
+        case_id = _create_case(client, title="Race")
+        metrics = scenario_parallel_conflicts(
+            client, session_factory, case_id, contractors, n=40, threads=8
+        )
+    app.dependency_overrides.clear()
+
+    assert metrics.success_rate == 1.0
+    assert metrics.details["pairs"] == 40 * 39 // 2
+    assert metrics.details["missed_duplicates"] == 0
+    assert metrics.details["missed_conflicts"] == 0
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.main import app
+from sentinel.db import get_db_session
+from sentinel.models import (
+    RELIABILITY_GLOBAL_SCOPE,
+    RELIABILITY_HALF_LIFE_HOURS,
+    Base,
+    Contractor,
+    ContractorReliability,
+    SubmissionEvent,
+    record_review_outcome,
+)
+from sentinel.reliability import contractor_reliability_map, decayed_reliability
+
+
+def _setup_client(tmp_path: Path):
+    db_file = tmp_path / "reliability.db"
+    engine = create_engine(f"sqlite:///{db_file}", future=True)
+    session_factory = sessionmaker(bind=engine, autoflush=False, autocommit=False, class_=Session)
+    Base.metadata.create_all(bind=engine)
+
+    def override_get_db_session():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db_session] = override_get_db_session
+    return TestClient(app), session_factory
+
+
+def _submit(client: TestClient, case_id: str, contractor_id: str, index: int) -> str:
+    response = client.post(
+        f"/cases/{case_id}/submit",
+        json={
+            "contractor_id": contractor_id,
+            "blockchain": "ETH",
+            "address": f"0x{index + 1:040x}",
+            "scam_type": "Phishing",
+            "source_url": "https://example.com/evidence",
+            "confidence_score": 3,
+        },
+    )
+    return response.json()["submission_id"]
+
+
+def test_decayed_reliability_drifts_back_to_neutral() -> None:
+    half_life = RELIABILITY_HALF_LIFE_HOURS * 3600
+    assert decayed_reliability(0.0, 0.0) == 0.5
+    assert decayed_reliability(9.0, 0.0) == pytest.approx(0.95)
+    assert decayed_reliability(9.0, 0.0, half_life) == pytest.approx(5.0 / 5.5)
+    assert decayed_reliability(9.0, 0.0, 100 * half_life) == pytest.approx(0.5)
+
+
+def test_review_events_update_global_and_case_counters(tmp_path: Path) -> None:
+    client, session_factory = _setup_client(tmp_path)
+
+    with client:
+        contractor_id = str(uuid.uuid4())
+        with session_factory() as db:
+            db.add(Contractor(contractor_id=contractor_id, handle="ct_reliability"))
+            db.commit()
+        case_ids = [
+            client.post("/cases", json={"title": f"Case {n}", "priority": "LOW"}).json()["case_id"]
+            for n in range(2)
+        ]
+        # Case 0: two approvals; case 1: one rejection.
+        for index, (case_id, action) in enumerate(
+            [(case_ids[0], "approve"), (case_ids[0], "approve"), (case_ids[1], "reject")]
+        ):
+            submission_id = _submit(client, case_id, contractor_id, index)
+            client.post(
+                f"/submissions/{submission_id}/actions",
+                json={"action": action, "actor": "manager", "notes": ""},
+            )
+
+        with session_factory() as db:
+            counters = {
+                row.scope: (row.accepted, row.rejected)
+                for row in db.scalars(select(ContractorReliability))
+            }
+            assert counters[RELIABILITY_GLOBAL_SCOPE] == (pytest.approx(2.0), pytest.approx(1.0))
+            assert counters[case_ids[0]] == (pytest.approx(2.0), 0.0)
+            assert counters[case_ids[1]] == (0.0, 1.0)
+
+            reviewed_at = db.scalar(
+                select(SubmissionEvent.created_at).order_by(SubmissionEvent.seq.desc()).limit(1)
+            )
+            later = reviewed_at + timedelta(hours=RELIABILITY_HALF_LIFE_HOURS)
+            decayed = contractor_reliability_map(db, [contractor_id], case_ids[0], now=later)
+            assert decayed[contractor_id] == pytest.approx(
+                decayed_reliability(2.0, 0.0, RELIABILITY_HALF_LIFE_HOURS * 3600), rel=1e-3
+            )
+
+        lifetime = client.get(f"/cases/{case_ids[1]}/submissions").json()
+        scoped = client.get(f"/cases/{case_ids[1]}/submissions?reliability=case").json()
+        global_scope = client.get(f"/cases/{case_ids[1]}/submissions?reliability=global").json()
+        # Lifetime 2/3 reliability; case scope sees only the rejection.
+        assert scoped[0]["triage_priority"] < lifetime[0]["triage_priority"]
+        assert global_scope[0]["triage_priority"] < lifetime[0]["triage_priority"]
+
+        assert client.get(f"/cases/{case_ids[1]}/submissions?reliability=weekly").status_code == 422
+        response = client.get(f"/cases/{case_ids[1]}/submissions?reliability=case&as_of=1")
+        assert response.status_code == 400
+        assert response.json()["detail"] == "reliability_as_of_unsupported"
+
+    app.dependency_overrides.clear()
+
+
+def test_backdated_outcome_is_decayed_not_the_running_totals(tmp_path: Path) -> None:
+    _client, session_factory = _setup_client(tmp_path)
+    contractor_id, case_id = str(uuid.uuid4()), str(uuid.uuid4())
+    now = datetime(2026, 1, 1, tzinfo=UTC)
+    earlier = now - timedelta(hours=RELIABILITY_HALF_LIFE_HOURS)
+
+    with session_factory() as db:
+        db.add(Contractor(contractor_id=contractor_id, handle="ct_backdated"))
+        db.flush()
+        connection = db.connection()
+        record_review_outcome(
+            connection, contractor_id=contractor_id, case_id=case_id, approved=True, at=now
+        )
+        record_review_outcome(
+            connection, contractor_id=contractor_id, case_id=case_id, approved=False, at=earlier
+        )
+        row = db.get(ContractorReliability, (contractor_id, RELIABILITY_GLOBAL_SCOPE))
+        assert (row.accepted, row.rejected) == (1.0, pytest.approx(0.5))
+        assert row.updated_at.replace(tzinfo=UTC) == now
+
+    app.dependency_overrides.clear()
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import uuid
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, sessionmaker
+
+import app.main as api_main
+from app.main import app
+from sentinel.db import get_db_session
+from sentinel.intelligence.enrichment import (
+    CircuitBreaker,
+    Enricher,
+    FileProvider,
+    local_providers,
+    shared_enricher,
+)
+from sentinel.models import Base, Contractor, SubmissionEvent
+
+ADDRESS = "0x" + "ab" * 20
+OTHER = "0x" + "cd" * 20
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class ScriptedProvider:
+    def __init__(self, name: str, outcomes: list, timeout: float = 0.05, cache_ttl=60.0):
+        self.name = name
+        self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        self.outcomes = outcomes
+        self.calls = 0
+
+    async def lookup(self, chain: str, address: str):
+        outcome = self.outcomes[min(self.calls, len(self.outcomes) - 1)]
+        self.calls += 1
+        if outcome == "slow":
+            await asyncio.sleep(1)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def _write_enrichment_files(root: Path) -> None:
+    root.mkdir(parents=True)
+    (root / "labels.json").write_text(
+        json.dumps(
+            {ADDRESS.upper().replace("0X", "0x"): {"label": "Drainer kit", "source": "ops"}}
+        ),
+        encoding="utf-8",
+    )
+    (root / "sanctions.txt").write_text(f"# test list\n{ADDRESS}\n\n", encoding="utf-8")
+    (root / "clusters.csv").write_text(
+        f"address,cluster_id\n{ADDRESS},c-1\n{OTHER},c-1\n", encoding="utf-8"
+    )
+
+
+def test_local_providers_work_offline_and_pick_up_edits(tmp_path: Path):
+    root = tmp_path / "enrichment"
+    _write_enrichment_files(root)
+    enricher = Enricher(local_providers(root))
+
+    results = {result.provider: result for result in enricher.enrich_sync("ETH", ADDRESS)}
+    assert {name: result.status for name, result in results.items()} == {
+        "labels": "hit",
+        "sanctions": "hit",
+        "clusters": "hit",
+    }
+    assert results["labels"].data == {"label": "Drainer kit", "source": "ops"}
+    assert results["sanctions"].data == {"sanctioned": True, "list": "sanctions.txt"}
+    assert results["clusters"].data == {"cluster_id": "c-1", "cluster_size": 2}
+
+    statuses = [result.status for result in enricher.enrich_sync("ETH", OTHER)]
+    assert statuses == ["miss", "miss", "hit"]
+    cached = enricher.enrich_sync("ETH", OTHER)
+    assert all(result.cached for result in cached)
+
+    sanctions = root / "sanctions.txt"
+    sanctions.write_text(f"{OTHER}\n", encoding="utf-8")
+    os.utime(sanctions, ns=(sanctions.stat().st_atime_ns, sanctions.stat().st_mtime_ns + 10**9))
+    fresh = Enricher(enricher.providers)
+    assert [result.status for result in fresh.enrich_sync("ETH", OTHER)][1] == "hit"
+
+    # The base class has no file format of its own.
+    with pytest.raises(TypeError, match="abstract"):
+        FileProvider(root / "labels.json")
+
+
+def test_slow_and_failing_providers_are_isolated_and_tripped():
+    clock = FakeClock()
+    slow = ScriptedProvider("slow", ["slow"])
+    flaky = ScriptedProvider("flaky", [RuntimeError("down")] * 2 + [{"label": "ok"}])
+    steady = ScriptedProvider("steady", [{"label": "steady"}], cache_ttl=0)
+    enricher = Enricher([slow, flaky, steady], failure_threshold=2, reset_after=10, clock=clock)
+
+    first = enricher.enrich_sync("ETH", ADDRESS)
+    assert [(result.provider, result.status) for result in first] == [
+        ("slow", "timeout"),
+        ("flaky", "error"),
+        ("steady", "hit"),
+    ]
+    assert first[1].data == {"error": "RuntimeError"}
+
+    enricher.enrich_sync("ETH", ADDRESS)
+    assert [result.status for result in enricher.enrich_sync("ETH", ADDRESS)] == [
+        "circuit_open",
+        "circuit_open",
+        "hit",
+    ]
+    assert (slow.calls, flaky.calls, steady.calls) == (2, 2, 3)
+
+    clock.now = 10
+    assert enricher.breakers["flaky"].state == "half_open"
+    trial = enricher.enrich_sync("ETH", ADDRESS)
+    assert [result.status for result in trial] == ["timeout", "hit", "hit"]
+    assert enricher.breakers["flaky"].state == "closed"
+    assert enricher.breakers["slow"].state == "open"
+
+
+def test_half_open_breaker_allows_a_single_trial():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_after=5, clock=clock)
+    breaker.record_failure()
+    assert not breaker.allow()
+    clock.now = 5
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+
+def _setup_client(tmp_path: Path):
+    db_file = tmp_path / "enrichment.db"
+    engine = create_engine(f"sqlite:///{db_file}", future=True)
+    session_factory = sessionmaker(bind=engine, autoflush=False, autocommit=False, class_=Session)
+    Base.metadata.create_all(bind=engine)
+
+    def override_get_db_session():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db_session] = override_get_db_session
+    return TestClient(app), session_factory
+
+
+def test_submit_records_enriched_event_before_evidence_analysis(monkeypatch, tmp_path: Path):
+    client, session_factory = _setup_client(tmp_path)
+    root = tmp_path / "enrichment"
+    _write_enrichment_files(root)
+    monkeypatch.setattr(api_main, "ENRICHMENT_DIR", root)
+    monkeypatch.setattr(api_main, "EVIDENCE_DIR", tmp_path / "evidence")
+    assert shared_enricher(tmp_path / "not-configured") is None
+
+    with client:
+        case_id = client.post("/cases", json={"title": "Enrich", "priority": "HIGH"}).json()[
+            "case_id"
+        ]
+        contractor_id = str(uuid.uuid4())
+        with session_factory() as db:
+            db.add(Contractor(contractor_id=contractor_id, handle="ct_enrich"))
+            db.commit()
+        submission_id = client.post(
+            f"/cases/{case_id}/submit",
+            json={
+                "contractor_id": contractor_id,
+                "blockchain": "ETH",
+                "address": ADDRESS,
+                "scam_type": "Phishing",
+                "source_url": "https://invalid.local/report",
+                "confidence_score": 4,
+            },
+        ).json()["submission_id"]
+
+    with session_factory() as db:
+        events = db.execute(
+            select(SubmissionEvent.event_type, SubmissionEvent.event_payload_json)
+            .where(SubmissionEvent.submission_id == submission_id)
+            .order_by(SubmissionEvent.seq)
+        ).all()
+    assert [event_type for event_type, _payload in events] == [
+        "INGESTED",
+        "VALIDATED",
+        "ENRICHED",
+        "EVIDENCE_ANALYZED",
+    ]
+    payload = json.loads(events[2][1])
+    assert [(item["provider"], item["status"]) for item in payload["providers"]] == [
+        ("labels", "hit"),
+        ("sanctions", "hit"),
+        ("clusters", "hit"),
+    ]
+
+    app.dependency_overrides.clear()
@@ -10,7 +10,12 @@ from sqlalchemy.orm import Session, sessionmaker
 from app.main import app
 from sentinel.db import get_db_session
 from sentinel.models import Base, Contractor
-from sentinel.replay import ReplayEvent, reconstruct_submission_state
+from sentinel.replay import (
+    ReplayEvent,
+    reconstruct_submission_state,
+    replay_case,
+    replay_event_rows,
+)
 
 
 def _setup_client(tmp_path: Path):
@@ -114,3 +119,94 @@ def test_replay_reconstructs_submission_state_from_event_history(tmp_path: Path)
         assert reconstructed.exported is True
 
     app.dependency_overrides.clear()
+
+
+def test_replay_case_folds_every_submission_in_one_scan(tmp_path: Path) -> None:
+    client, session_factory = _setup_client(tmp_path)
+
+    with client:
+        case_id = client.post("/cases", json={"title": "Bulk Replay"}).json()["case_id"]
+        contractor_id = str(uuid.uuid4())
+        with session_factory() as db:
+            db.add(Contractor(contractor_id=contractor_id, handle="ct_bulk"))
+            db.commit()
+
+        submission_ids = []
+        for i, scam_type in enumerate(["Phishing", "Rugpull", "Phishing", "Exchange"]):
+            submit = client.post(
+                f"/cases/{case_id}/submit",
+                json={
+                    "contractor_id": contractor_id,
+                    "blockchain": "ETH",
+                    "address": "0x" + f"{i % 2 + 1:040x}",
+                    "scam_type": scam_type,
+                    "source_url": "https://example.com/evidence",
+                    "confidence_score": 3,
+                },
+            )
+            submission_ids.append(submit.json()["submission_id"])
+        client.post(f"/submissions/{submission_ids[0]}/actions", json={"action": "approve"})
+        client.post(f"/submissions/{submission_ids[1]}/actions", json={"action": "reject"})
+        client.post(f"/submissions/{submission_ids[2]}/actions", json={"action": "escalate"})
+
+        expected = {}
+        for submission_id in submission_ids:
+            events = client.get(f"/submissions/{submission_id}").json()["events"]
+            expected[submission_id] = reconstruct_submission_state(
+                [
+                    ReplayEvent(
+                        event_type=event["event_type"],
+                        created_at=event["created_at"],
+                        event_payload=event["event_payload_json"],
+                    )
+                    for event in events
+                ]
+            )
+
+        with session_factory() as db:
+            replayed = dict(replay_case(db, case_id, batch_size=2))
+
+        assert replayed == expected
+        assert replayed[submission_ids[1]].rejected is True
+        assert replayed[submission_ids[3]].conflicted is True
+
+    app.dependency_overrides.clear()
+
+
+def test_replay_event_rows_yields_one_state_per_submission() -> None:
+    rows = [
+        ("a", 1, "INGESTED", "{}"),
+        ("a", 2, "VALIDATED", '{"passed":true,"duplicate_of":[],"conflict_with":[]}'),
+        ("a", 7, "APPROVED", '{"notes":""}'),
+        ("b", 3, "INGESTED", "{}"),
+        ("b", 4, "VALIDATED", '{"passed":true,"duplicate_of":["a"],"conflict_with":["a"]}'),
+        ("b", 5, "CONFLICTED", '{"conflict_with":["a"]}'),
+    ]
+
+    states = list(replay_event_rows(rows))
+
+    assert [submission_id for submission_id, _ in states] == ["a", "b"]
+    assert states[0][1].approved is True
+    assert states[0][1].latest_event_type == "APPROVED"
+    assert states[1][1].conflict_with == ["a"]
+    assert states[1][1].latest_event_type == "CONFLICTED"
+
+
+def test_reconstruct_orders_by_seq_when_timestamps_tie() -> None:
+    tied = "2026-01-01T00:00:00+00:00"
+    events = [
+        ReplayEvent(event_type="APPROVED", created_at=tied, seq=3),
+        ReplayEvent(event_type="INGESTED", created_at=tied, seq=1),
+        ReplayEvent(
+            event_type="VALIDATED",
+            created_at=tied,
+            event_payload={"passed": True, "duplicate_of": [], "conflict_with": []},
+            seq=2,
+        ),
+    ]
+
+    state = reconstruct_submission_state(events)
+
+    assert state.latest_event_type == "APPROVED"
+    assert state.approved is True
+    assert state.validated is True
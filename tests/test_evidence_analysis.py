@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import requests
@@ -9,9 +10,14 @@ from sqlalchemy import create_engine, select
 from sqlalchemy.orm import Session, sessionmaker
 
 import app.main as api_main
+import sentinel.intelligence.evidence_analyzer as evidence_analyzer
 from app.main import app
 from sentinel.db import get_db_session
-from sentinel.intelligence.evidence_analyzer import run_evidence_analysis
+from sentinel.intelligence.evidence_analyzer import (
+    EvidenceRequest,
+    run_evidence_analyses,
+    run_evidence_analysis,
+)
 from sentinel.models import Base, Contractor, SubmissionEvent
 
 
@@ -56,6 +62,66 @@ def test_missing_unreachable_url_handled_safely() -> None:
         raise AssertionError(f"Analyzer should fail safely, got exception: {exc}") from exc
 
 
+def _page_fetcher(url: str):
+    if url.endswith("down"):
+        raise requests.ConnectionError("down")
+    index = url.rsplit("/", 1)[-1]
+    return f"rug pull report {index}: 0x{index:0>40} liquidity removed", True, ["Source reachable"]
+
+
+def test_staged_analysis_reports_timings_outside_equality_and_payload(monkeypatch) -> None:
+    address = "0x4444444444444444444444444444444444444444"
+    html = f"<html><body><p>Phishing &amp; impersonation by {address}</p></body></html>"
+    monkeypatch.setattr(
+        evidence_analyzer,
+        "fetch_evidence_html",
+        lambda *_: (html, True, ["Source reachable"]),
+    )
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        staged = run_evidence_analysis(
+            address=address,
+            scam_type="Phishing",
+            source_url="https://example.com/report",
+            pool=pool,
+        )
+    inline = run_evidence_analysis(
+        address=address,
+        scam_type="Phishing",
+        source_url="https://example.com/report",
+        fetcher=lambda _url: (
+            evidence_analyzer._strip_html(html),
+            True,
+            ["Source reachable"],
+        ),
+    )
+
+    assert set(staged.timings) == {"fetch_ms", "analyze_ms", "total_ms"}
+    assert staged == inline
+    assert staged.address_found and staged.classification_supported
+    assert "timings" not in staged.to_payload()
+
+
+def test_batch_analysis_on_process_pool_matches_serial_in_order() -> None:
+    batch = [
+        EvidenceRequest(f"0x{index:0>40}", "Rugpull", f"https://example.com/{index}")
+        for index in range(25)
+    ]
+    batch.append(EvidenceRequest("0x" + "5" * 40, "Rugpull", "https://example.com/down"))
+
+    expected = [
+        run_evidence_analysis(**request._asdict(), fetcher=_page_fetcher) for request in batch
+    ]
+    for executor in ("serial", "thread", "process"):
+        results = list(
+            run_evidence_analyses(
+                iter(batch), fetcher=_page_fetcher, executor=executor, workers=2, fetch_workers=2
+            )
+        )
+        assert results == expected
+    assert expected[-1].source_reachable is False
+
+
 def _setup_client(tmp_path: Path):
     db_file = tmp_path / "evidence.db"
     engine = create_engine(f"sqlite:///{db_file}", future=True)
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import uuid
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session, sessionmaker
+
+import sentinel.intelligence.evidence_analyzer as evidence_analyzer
+from sentinel.intelligence.evidence_analyzer import run_evidence_analysis
+from sentinel.intelligence.evidence_store import (
+    EVIDENCE_CODECS,
+    DbRuleMemo,
+    EvidenceStore,
+    attach_evidence,
+    load_evidence_texts,
+    release_evidence,
+    remove_unreferenced,
+)
+from sentinel.models import (
+    Base,
+    Case,
+    Contractor,
+    EvidenceBlob,
+    EvidenceRuleMemo,
+    Submission,
+    utcnow,
+)
+
+PAGE_TEXT = "Rug pull and exit scam: liquidity removed from pool 0x" + "c" * 40 + " – ünïcode kept"
+
+
+def _session_factory(tmp_path: Path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'evidence_store.db'}", future=True)
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine, autoflush=False, autocommit=False, class_=Session)
+
+
+def _submissions(db: Session, count: int) -> list[str]:
+    now = utcnow()
+    case = Case(title="Store", priority="LOW", start_time=now, deadline_time=now, status="OPEN")
+    contractor = Contractor(contractor_id=str(uuid.uuid4()), handle="ct_store")
+    db.add_all([case, contractor])
+    db.flush()
+    submissions = [
+        Submission(
+            case_id=case.case_id,
+            contractor_id=contractor.contractor_id,
+            chain="ETH",
+            address=f"0x{index:040x}",
+            scam_type="Rugpull",
+            source_url="https://example.com/report",
+            confidence_score=3,
+            raw_payload_json="{}",
+            submission_hash="0" * 64,
+        )
+        for index in range(count)
+    ]
+    db.add_all(submissions)
+    db.flush()
+    return [submission.submission_id for submission in submissions]
+
+
+@pytest.mark.parametrize("compression", sorted(EVIDENCE_CODECS))
+def test_store_round_trips_and_verifies_content(tmp_path: Path, compression: str) -> None:
+    store = EvidenceStore(tmp_path / "evidence", compression)
+    text_hash = evidence_analyzer.normalize_evidence(PAGE_TEXT)[1]
+
+    store.write(text_hash, PAGE_TEXT)
+    assert store.read(text_hash, compression) == PAGE_TEXT
+
+    store.path_for(text_hash, compression).write_bytes(
+        EVIDENCE_CODECS[compression].compress(b"tampered")
+    )
+    with pytest.raises(ValueError, match="does not match"):
+        store.read(text_hash, compression)
+
+
+def test_refcounts_dedupe_pages_and_release_the_last_copy(tmp_path: Path) -> None:
+    session_factory = _session_factory(tmp_path)
+    store = EvidenceStore(tmp_path / "evidence")
+
+    with session_factory() as db:
+        first, second = _submissions(db, 2)
+        text_hash = attach_evidence(db, store, first, PAGE_TEXT)
+        assert attach_evidence(db, store, second, PAGE_TEXT) == text_hash
+        db.commit()
+
+        blob = db.get(EvidenceBlob, text_hash)
+        assert (blob.refcount, blob.compression) == (2, "gzip")
+        assert blob.byte_size == len(PAGE_TEXT.encode("utf-8"))
+        assert load_evidence_texts(db, store, [text_hash]) == {text_hash: PAGE_TEXT}
+
+        assert release_evidence(db, first) is None
+        orphan = release_evidence(db, second)
+        db.commit()
+        assert orphan == (text_hash, "gzip")
+        assert db.get(EvidenceBlob, text_hash) is None
+
+        # A page cited again before the unlink finds its file still there and keeps it.
+        [third] = _submissions(db, 1)
+        attach_evidence(db, store, third, PAGE_TEXT)
+        db.commit()
+        assert remove_unreferenced(db, store, [orphan]) == 0
+        assert load_evidence_texts(db, store, [text_hash]) == {text_hash: PAGE_TEXT}
+
+        assert release_evidence(db, third) == orphan
+        db.commit()
+        assert remove_unreferenced(db, store, [orphan]) == 1
+        assert not store.path_for(text_hash, "gzip").exists()
+
+
+def test_rule_memo_evaluates_identical_pages_once(monkeypatch, tmp_path: Path) -> None:
+    session_factory = _session_factory(tmp_path)
+    evaluated = []
+    original = evidence_analyzer.evaluate_rules
+
+    def counting_rules(*args):
+        evaluated.append(args[:2])
+        return original(*args)
+
+    monkeypatch.setattr(evidence_analyzer, "evaluate_rules", counting_rules)
+    html = f"<p>{PAGE_TEXT}</p>"
+    monkeypatch.setattr(
+        evidence_analyzer,
+        "fetch_evidence_html",
+        lambda *_: (html, True, ["Source reachable"]),
+    )
+    address = "0x" + "c" * 40
+
+    with session_factory() as db:
+        memo = DbRuleMemo(db)
+        results = [
+            run_evidence_analysis(
+                address=address,
+                scam_type="Rugpull",
+                source_url=f"https://mirror{index}.example.com/report",
+                memo=memo,
+            )
+            for index in range(3)
+        ]
+        unmemoized = run_evidence_analysis(
+            address=address, scam_type="Rugpull", source_url="https://example.com/report"
+        )
+
+        assert evaluated == [(address, "Rugpull"), (address, "Rugpull")]
+        assert results == [unmemoized] * 3
+        assert results[0].evidence_score == 1.0
+        assert db.scalar(select(func.count()).select_from(EvidenceRuleMemo)) == 1
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import csv
+import gzip
+import io
+import json
+import uuid
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.main import app
+from sentinel.db import get_db_session
+from sentinel.exports import negotiate_compression
+from sentinel.models import Base, Contractor
+
+
+def _setup_client(tmp_path: Path):
+    db_file = tmp_path / "compression.db"
+    engine = create_engine(f"sqlite:///{db_file}", future=True)
+    session_factory = sessionmaker(bind=engine, autoflush=False, autocommit=False, class_=Session)
+    Base.metadata.create_all(bind=engine)
+
+    def override_get_db_session():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db_session] = override_get_db_session
+    return TestClient(app), session_factory
+
+
+def _approved_case(client: TestClient, session_factory, count: int = 5) -> str:
+    case_id = client.post("/cases", json={"title": "Compression Case"}).json()["case_id"]
+    contractor_id = str(uuid.uuid4())
+    with session_factory() as db:
+        db.add(Contractor(contractor_id=contractor_id, handle="ct_gzip"))
+        db.commit()
+    for i in range(count):
+        submission_id = client.post(
+            f"/cases/{case_id}/submit",
+            json={
+                "contractor_id": contractor_id,
+                "blockchain": "ETH",
+                "address": "0x" + f"{i + 10:040x}",
+                "scam_type": "Rugpull",
+                "source_url": "https://example.com/evidence",
+                "confidence_score": 3,
+            },
+        ).json()["submission_id"]
+        client.post(f"/submissions/{submission_id}/actions", json={"action": "approve"})
+    return case_id
+
+
+def _raw_body(client: TestClient, url: str, headers: dict[str, str]):
+    with client.stream("GET", url, headers=headers) as response:
+        return response, b"".join(response.iter_raw())
+
+
+def test_export_gzip_negotiated_and_explicit(tmp_path) -> None:
+    client, session_factory = _setup_client(tmp_path)
+
+    with client:
+        case_id = _approved_case(client, session_factory)
+
+        response, raw = _raw_body(
+            client, f"/cases/{case_id}/export?format=csv", {"Accept-Encoding": "gzip"}
+        )
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["content-type"].startswith("text/csv")
+        assert ".csv" in response.headers["content-disposition"]
+        rows = list(csv.DictReader(io.StringIO(gzip.decompress(raw).decode("utf-8"))))
+        assert len(rows) == 5
+
+        response, raw = _raw_body(
+            client,
+            f"/cases/{case_id}/export?format=json&compression=gzip&compression_level=9",
+            {"Accept-Encoding": "identity"},
+        )
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["content-type"].startswith("application/json")
+        assert len(json.loads(gzip.decompress(raw))) == 5
+
+        plain = client.get(
+            f"/cases/{case_id}/export?format=json&compression=none",
+            headers={"Accept-Encoding": "gzip"},
+        )
+        assert "content-encoding" not in plain.headers
+        assert len(plain.json()) == 5
+
+        for level in (0, 15):
+            bad_level = client.get(
+                f"/cases/{case_id}/export?compression=gzip&compression_level={level}"
+            )
+            assert bad_level.status_code == 400
+            assert bad_level.json()["detail"] == "invalid_compression_level"
+
+    app.dependency_overrides.clear()
+
+
+def test_export_zstd_round_trip(tmp_path) -> None:
+    zstandard = pytest.importorskip("zstandard")
+    client, session_factory = _setup_client(tmp_path)
+
+    with client:
+        case_id = _approved_case(client, session_factory, count=2)
+        response, raw = _raw_body(
+            client, f"/cases/{case_id}/export?format=json", {"Accept-Encoding": "gzip, zstd"}
+        )
+        assert response.headers["content-encoding"] == "zstd"
+        decoded = zstandard.ZstdDecompressor().decompressobj().decompress(raw)
+        assert len(json.loads(decoded)) == 2
+
+    app.dependency_overrides.clear()
+
+
+def test_negotiate_compression_honours_q_values() -> None:
+    assert negotiate_compression(None) is None
+    assert negotiate_compression("identity") is None
+    assert negotiate_compression("gzip;q=0, deflate") is None
+    assert negotiate_compression("deflate, gzip;q=0.5") == "gzip"
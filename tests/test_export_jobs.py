@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+import uuid
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session, sessionmaker
+
+import app.main as api_main
+from app.main import app
+from sentinel.db import get_db_session
+from sentinel.exports import parse_byte_range
+from sentinel.models import Base, Contractor, ExportJob, SubmissionEvent
+
+
+def _setup_client(tmp_path: Path, monkeypatch):
+    db_file = tmp_path / "export_jobs.db"
+    engine = create_engine(f"sqlite:///{db_file}", future=True)
+    session_factory = sessionmaker(bind=engine, autoflush=False, autocommit=False, class_=Session)
+    Base.metadata.create_all(bind=engine)
+    monkeypatch.setattr(api_main, "EXPORT_DIR", tmp_path / "exports")
+
+    def override_get_db_session():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db_session] = override_get_db_session
+    return TestClient(app), session_factory
+
+
+def _seed_approved(client: TestClient, session_factory, count: int) -> str:
+    case_id = client.post("/cases", json={"title": "Export Job Case"}).json()["case_id"]
+    contractor_id = str(uuid.uuid4())
+    with session_factory() as db:
+        db.add(Contractor(contractor_id=contractor_id, handle="ct_jobs"))
+        db.commit()
+
+    for i in range(count):
+        submit = client.post(
+            f"/cases/{case_id}/submit",
+            json={
+                "contractor_id": contractor_id,
+                "blockchain": "ETH",
+                "address": "0x" + f"{i + 1:040x}",
+                "scam_type": "Phishing",
+                "source_url": "https://example.com/evidence",
+                "confidence_score": 4,
+            },
+        )
+        assert submit.status_code == 200
+        client.post(
+            f"/submissions/{submit.json()['submission_id']}/actions",
+            json={"action": "approve", "actor": "manager"},
+        )
+    return case_id
+
+
+def test_export_job_completes_and_supports_resumable_download(tmp_path, monkeypatch) -> None:
+    client, session_factory = _setup_client(tmp_path, monkeypatch)
+
+    with client:
+        case_id = _seed_approved(client, session_factory, 3)
+
+        created = client.post(f"/cases/{case_id}/exports", json={"format": "csv"})
+        assert created.status_code == 202
+        job_id = created.json()["job_id"]
+
+        status = client.get(f"/exports/{job_id}")
+        assert status.status_code == 200
+        body = status.json()
+        assert body["status"] == "COMPLETED"
+        assert body["written_records"] == body["total_records"] == 3
+        assert body["progress"] == 1.0
+
+        full = client.get(body["download_url"])
+        assert full.status_code == 200
+        assert full.headers["accept-ranges"] == "bytes"
+        assert int(full.headers["content-length"]) == body["byte_size"]
+        assert len(list(csv.DictReader(io.StringIO(full.text)))) == 3
+        with session_factory() as db:
+            assert Path(db.get(ExportJob, job_id).file_path).is_absolute()
+
+        head = client.get(body["download_url"], headers={"Range": "bytes=0-99"})
+        assert head.status_code == 206
+        assert head.headers["content-range"] == f"bytes 0-99/{body['byte_size']}"
+        tail = client.get(
+            body["download_url"],
+            headers={"Range": "bytes=100-", "If-Range": full.headers["etag"]},
+        )
+        assert tail.status_code == 206
+        assert head.content + tail.content == full.content
+
+        beyond = client.get(body["download_url"], headers={"Range": f"bytes={body['byte_size']}-"})
+        assert beyond.status_code == 416
+
+        with session_factory() as db:
+            exported = db.scalar(
+                select(func.count())
+                .select_from(SubmissionEvent)
+                .where(SubmissionEvent.event_type == "EXPORTED")
+            )
+        assert exported == 3
+
+    app.dependency_overrides.clear()
+
+
+def test_export_job_json_matches_sync_export_records(tmp_path, monkeypatch) -> None:
+    client, session_factory = _setup_client(tmp_path, monkeypatch)
+
+    with client:
+        case_id = _seed_approved(client, session_factory, 2)
+        job_id = client.post(f"/cases/{case_id}/exports", json={}).json()["job_id"]
+        downloaded = json.loads(client.get(f"/exports/{job_id}/download").content)
+        synchronous = client.get(f"/cases/{case_id}/export?format=json").json()
+
+        assert sorted(r["submission_id"] for r in downloaded) == sorted(
+            r["submission_id"] for r in synchronous
+        )
+        assert client.get(f"/exports/{uuid.uuid4()}").status_code == 404
+
+    app.dependency_overrides.clear()
+
+
+def test_sync_export_streams_in_batches_and_records_events_after(tmp_path, monkeypatch) -> None:
+    client, session_factory = _setup_client(tmp_path, monkeypatch)
+    monkeypatch.setattr(api_main, "EXPORT_PROGRESS_INTERVAL", 2)
+
+    def exported_count() -> int:
+        with session_factory() as db:
+            return db.scalar(
+                select(func.count())
+                .select_from(SubmissionEvent)
+                .where(SubmissionEvent.event_type == "EXPORTED")
+            )
+
+    with client:
+        case_id = _seed_approved(client, session_factory, 5)
+        load_records = api_main._iter_export_records
+        batches: list[int] = []
+
+        def failing_third_batch(db, case_id, approved_ids, as_of_seq=None):
+            batches.append(len(approved_ids))
+            if len(batches) == 3:
+                raise RuntimeError("connection lost mid-stream")
+            return load_records(db, case_id, approved_ids, as_of_seq)
+
+        monkeypatch.setattr(api_main, "_iter_export_records", failing_third_batch)
+        with pytest.raises(RuntimeError):
+            client.get(f"/cases/{case_id}/export?format=json")
+        assert batches == [2, 2, 1]
+        assert exported_count() == 0
+
+        monkeypatch.setattr(api_main, "_iter_export_records", load_records)
+        body = client.get(f"/cases/{case_id}/export?format=csv")
+        assert len(list(csv.DictReader(io.StringIO(body.text)))) == 5
+        assert exported_count() == 5
+
+    app.dependency_overrides.clear()
+
+
+def test_export_job_failing_before_the_write_is_marked_failed(tmp_path, monkeypatch) -> None:
+    client, session_factory = _setup_client(tmp_path, monkeypatch)
+
+    def broken_query(*_):
+        raise RuntimeError("database went away")
+
+    with client:
+        case_id = _seed_approved(client, session_factory, 1)
+        monkeypatch.setattr(api_main, "_approved_submission_ids", broken_query)
+        job_id = client.post(f"/cases/{case_id}/exports", json={}).json()["job_id"]
+        body = client.get(f"/exports/{job_id}").json()
+        assert body["status"] == "FAILED"
+        assert body["error"] == "export_failed: RuntimeError"
+
+    app.dependency_overrides.clear()
+
+
+def test_parse_byte_range_forms() -> None:
+    assert parse_byte_range("bytes=0-9", 100) == (0, 9)
+    assert parse_byte_range("bytes=90-", 100) == (90, 99)
+    assert parse_byte_range("bytes=-10", 100) == (90, 99)
+    assert parse_byte_range("bytes=50-500", 100) == (50, 99)
+    assert parse_byte_range("bytes=0-1,5-6", 100) is None
+    with pytest.raises(ValueError):
+        parse_byte_range("bytes=100-", 100)
+    with pytest.raises(ValueError):
+        parse_byte_range("bytes=abc", 100)
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+import requests
+
+import sentinel.intelligence.evidence_analyzer as evidence_analyzer
+from sentinel.intelligence.evidence_analyzer import fetch_evidence_html, run_evidence_analysis
+from sentinel.intelligence.host_health import HostHealth, HostHealthRegistry
+
+URL = "https://dead.example.com/report"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeResponse:
+    text = "<p>ok</p>"
+
+    def raise_for_status(self) -> None:
+        return None
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(evidence_analyzer, "HOST_HEALTH", HostHealthRegistry(clock=clock))
+    return clock
+
+
+def test_dead_host_fails_fast_once_its_failure_rate_trips(monkeypatch, clock: FakeClock):
+    calls = []
+
+    def down(url, timeout):
+        calls.append(timeout)
+        raise requests.ConnectionError("refused")
+
+    monkeypatch.setattr(evidence_analyzer.requests, "get", down)
+    for _ in range(5):
+        assert fetch_evidence_html(URL)[2] == ["Source unreachable: ConnectionError"]
+    assert fetch_evidence_html(URL) == ("", False, ["Source host circuit open: dead.example.com"])
+    assert len(calls) == 5
+    # Other hosts are unaffected.
+    fetch_evidence_html("https://other.example.com/report")
+    assert len(calls) == 6
+
+    monkeypatch.setattr(
+        evidence_analyzer.requests,
+        "get",
+        lambda url, timeout: calls.append(timeout) or FakeResponse(),
+    )
+    clock.now = 30
+    assert evidence_analyzer.HOST_HEALTH.get("dead.example.com").state == "half_open"
+    assert fetch_evidence_html(URL) == ("<p>ok</p>", True, ["Source reachable"])
+    assert calls[-1] == 8.0  # the probe gets the full timeout
+    assert evidence_analyzer.HOST_HEALTH.get("dead.example.com").state == "closed"
+
+
+def test_failed_half_open_probe_reopens_the_circuit():
+    clock = FakeClock()
+    health = HostHealth(min_calls=2, failure_rate=0.5, open_seconds=10, clock=clock)
+    health.record_success(0.2)
+    health.record_failure()
+    assert health.state == "open" and not health.allow()
+
+    clock.now = 10
+    assert health.allow()
+    assert not health.allow()  # one probe at a time
+    health.record_failure()
+    assert health.state == "open"
+
+
+def test_timeout_adapts_to_observed_latency():
+    health = HostHealth(min_timeout=1.0, max_timeout=8.0)
+    assert health.timeout() == 8.0
+    for _ in range(20):
+        health.record_success(0.05)
+    assert health.timeout() == 1.0
+    for _ in range(20):
+        health.record_success(1.5)
+    assert 1.5 < health.timeout() < 8.0
+    slow = health.timeout()
+    health.record_failure(timed_out=True)
+    assert health.timeout() > slow
+
+
+def test_analysis_deadline_caps_the_fetch_timeout(monkeypatch, clock: FakeClock):
+    timeouts = []
+
+    def slow_host(url, timeout):
+        timeouts.append(timeout)
+        raise requests.Timeout("read timed out")
+
+    monkeypatch.setattr(evidence_analyzer.requests, "get", slow_host)
+    start = time.perf_counter()
+    result = run_evidence_analysis(
+        address="0x" + "1" * 40, scam_type="Phishing", source_url=URL, deadline=0.5
+    )
+
+    assert timeouts == [0.5]
+    assert result.notes[0] == "Source unreachable: Timeout"
+    assert time.perf_counter() - start < 5
+
+
+def test_probe_ending_in_an_unexpected_exception_does_not_block_the_host(
+    monkeypatch, clock: FakeClock
+):
+    health = evidence_analyzer.HOST_HEALTH.get("dead.example.com")
+    for _ in range(5):
+        health.record_failure()
+    clock.now = 30
+
+    def broken(url, timeout):
+        raise RuntimeError("not a requests error")
+
+    monkeypatch.setattr(evidence_analyzer.requests, "get", broken)
+    assert fetch_evidence_html(URL) == ("", False, ["Source unreachable: RuntimeError"])
+    assert health.state == "open"  # the failed probe re-opened the circuit
+    clock.now = 60
+    assert health.allow()
+    health.release_probe()
+
+    class CancelledClient:
+        def __init__(self, **_):
+            pass
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *_):
+            return None
+
+        async def get(self, url):
+            raise asyncio.CancelledError
+
+    monkeypatch.setattr(evidence_analyzer.httpx, "AsyncClient", CancelledClient)
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(evidence_analyzer.fetch_evidence_html_async(URL))
+    assert health.state == "half_open"
+    assert health.allow()  # the cancelled probe was released
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import uuid
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, delete, select, update
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.main import app
+from sentinel.db import get_db_session
+from sentinel.hashing import GENESIS_HASH
+from sentinel.ledger import create_checkpoint, verify_case_chain
+from sentinel.models import Base, Contractor, Submission, SubmissionEvent
+
+
+def _setup_client(tmp_path: Path):
+    db_file = tmp_path / "ledger_chain.db"
+    engine = create_engine(f"sqlite:///{db_file}", future=True)
+    session_factory = sessionmaker(bind=engine, autoflush=False, autocommit=False, class_=Session)
+    Base.metadata.create_all(bind=engine)
+
+    def override_get_db_session():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db_session] = override_get_db_session
+    return TestClient(app), session_factory
+
+
+def _submit(client: TestClient, case_id: str, contractor_id: str, index: int) -> str:
+    response = client.post(
+        f"/cases/{case_id}/submit",
+        json={
+            "contractor_id": contractor_id,
+            "blockchain": "ETH",
+            "address": f"0x{index:040x}",
+            "scam_type": "Phishing",
+            "source_url": "https://example.com/evidence",
+            "confidence_score": 4,
+        },
+    )
+    assert response.status_code == 200
+    return response.json()["submission_id"]
+
+
+@pytest.fixture()
+def ledger(tmp_path: Path):
+    client, session_factory = _setup_client(tmp_path)
+    with client:
+        case_ids = [
+            client.post("/cases", json={"title": f"Chain {i}", "priority": "HIGH"}).json()[
+                "case_id"
+            ]
+            for i in range(2)
+        ]
+        contractor_id = str(uuid.uuid4())
+        with session_factory() as db:
+            db.add(Contractor(contractor_id=contractor_id, handle="ct_chain"))
+            db.commit()
+        for index in range(4):
+            _submit(client, case_ids[index % 2], contractor_id, index)
+        yield client, session_factory, case_ids, contractor_id
+    app.dependency_overrides.clear()
+
+
+def _case_events(db: Session, case_id: str) -> list[SubmissionEvent]:
+    return list(
+        db.scalars(
+            select(SubmissionEvent)
+            .join(Submission, Submission.submission_id == SubmissionEvent.submission_id)
+            .where(Submission.case_id == case_id)
+            .order_by(SubmissionEvent.seq)
+        )
+    )
+
+
+def test_events_are_chained_per_case_and_verify_incrementally(ledger) -> None:
+    client, session_factory, case_ids, contractor_id = ledger
+
+    with session_factory() as db:
+        events = _case_events(db, case_ids[0])
+        assert events[0].prev_hash == GENESIS_HASH
+        assert all(b.prev_hash == a.event_hash for a, b in zip(events, events[1:], strict=False))
+        assert verify_case_chain(db, case_ids[0], full=True).ok
+
+        checkpoint = create_checkpoint(db, case_ids[0])
+        assert checkpoint is not None and checkpoint.seq == events[-1].seq
+        assert create_checkpoint(db, case_ids[0]) is None
+
+    _submit(client, case_ids[0], contractor_id, 10)
+
+    with session_factory() as db:
+        report = verify_case_chain(db, case_ids[0])
+        assert report.ok
+        assert report.start_seq == checkpoint.seq
+        assert report.events_checked == len(_case_events(db, case_ids[0])) - len(events)
+        assert verify_case_chain(db, case_ids[1]).ok
+
+
+def test_tampering_is_detected_before_and_after_checkpoints(ledger) -> None:
+    _, session_factory, case_ids, _ = ledger
+
+    with session_factory() as db:
+        events = _case_events(db, case_ids[0])
+        create_checkpoint(db, case_ids[0])
+        early = events[1].event_id
+        db.execute(
+            update(SubmissionEvent)
+            .where(SubmissionEvent.event_id == early)
+            .values(event_payload_json='{"passed":false}')
+        )
+        db.commit()
+
+        assert verify_case_chain(db, case_ids[0]).ok
+        full = verify_case_chain(db, case_ids[0], full=True)
+        assert [issue["check"] for issue in full.issues] == ["event_hash"]
+        assert full.issues[0]["event_id"] == early
+
+        db.execute(delete(SubmissionEvent).where(SubmissionEvent.event_id == events[-1].event_id))
+        db.commit()
+        incremental = verify_case_chain(db, case_ids[0])
+        checks = {issue["check"] for issue in incremental.issues}
+        assert {"checkpoint_anchor", "chain_head"} <= checks
+
+
+def test_checkpoint_signed_with_another_key_is_not_trusted(ledger, monkeypatch) -> None:
+    _, session_factory, case_ids, _ = ledger
+
+    with session_factory() as db:
+        monkeypatch.setenv("SENTINEL_LEDGER_KEY", "other-key")
+        create_checkpoint(db, case_ids[1])
+        monkeypatch.setenv("SENTINEL_LEDGER_KEY", "production-key")
+
+        report = verify_case_chain(db, case_ids[1])
+        assert [issue["check"] for issue in report.issues] == ["checkpoint_signature"]
+        assert report.start_seq == 0
+        assert report.events_checked == len(_case_events(db, case_ids[1]))
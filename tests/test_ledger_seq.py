@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import uuid
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.main import app
+from sentinel.db import get_db_session
+from sentinel.models import Base, Contractor, LedgerCounter, SubmissionEvent
+
+
+def _setup_client(tmp_path: Path):
+    db_file = tmp_path / "ledger_seq.db"
+    engine = create_engine(f"sqlite:///{db_file}", future=True)
+    session_factory = sessionmaker(bind=engine, autoflush=False, autocommit=False, class_=Session)
+    Base.metadata.create_all(bind=engine)
+
+    def override_get_db_session():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db_session] = override_get_db_session
+    return TestClient(app), session_factory
+
+
+def _submit(client: TestClient, case_id: str, contractor_id: str, index: int) -> str:
+    response = client.post(
+        f"/cases/{case_id}/submit",
+        json={
+            "contractor_id": contractor_id,
+            "blockchain": "ETH",
+            "address": f"0x{index:040x}",
+            "scam_type": "Phishing",
+            "source_url": "https://example.com/evidence",
+            "confidence_score": 4,
+        },
+    )
+    assert response.status_code == 200
+    return response.json()["submission_id"]
+
+
+def test_events_get_strictly_increasing_seq_and_feed_pages_by_seq(tmp_path: Path) -> None:
+    client, session_factory = _setup_client(tmp_path)
+
+    with client:
+        case_id = client.post("/cases", json={"title": "Seq Case", "priority": "HIGH"}).json()[
+            "case_id"
+        ]
+        other_case_id = client.post("/cases", json={"title": "Other", "priority": "LOW"}).json()[
+            "case_id"
+        ]
+        contractor_id = str(uuid.uuid4())
+        with session_factory() as db:
+            db.add(Contractor(contractor_id=contractor_id, handle="ct_seq"))
+            db.commit()
+
+        first = _submit(client, case_id, contractor_id, 1)
+        other = _submit(client, other_case_id, contractor_id, 2)
+        _submit(client, case_id, contractor_id, 3)
+        client.post(
+            f"/submissions/{first}/actions",
+            json={"action": "approve", "actor": "manager", "notes": ""},
+        )
+
+        with session_factory() as db:
+            seqs = db.scalars(select(SubmissionEvent.seq).order_by(SubmissionEvent.seq)).all()
+            counter = db.get(LedgerCounter, "submission_events.seq")
+        assert seqs == list(range(1, len(seqs) + 1))
+        assert counter is not None and counter.value == seqs[-1]
+
+        detail = client.get(f"/submissions/{first}").json()
+        detail_seqs = [event["seq"] for event in detail["events"]]
+        assert detail_seqs == sorted(detail_seqs)
+        assert detail["events"][-1]["event_type"] == "APPROVED"
+
+        collected = []
+        after_seq = 0
+        while True:
+            page = client.get(f"/cases/{case_id}/events?after_seq={after_seq}&limit=2")
+            assert page.status_code == 200
+            body = page.json()
+            if not body["events"]:
+                assert body["next_after_seq"] == after_seq
+                break
+            collected.extend(body["events"])
+            after_seq = body["next_after_seq"]
+
+        feed_seqs = [event["seq"] for event in collected]
+        assert feed_seqs == sorted(set(feed_seqs))
+        assert other not in {event["submission_id"] for event in collected}
+        with session_factory() as db:
+            other_events = db.scalars(
+                select(SubmissionEvent).where(SubmissionEvent.submission_id == other)
+            ).all()
+        assert len(collected) == len(seqs) - len(other_events)
+
+        missing = client.get(f"/cases/{uuid.uuid4()}/events")
+        assert missing.status_code == 404
+
+    app.dependency_overrides.clear()
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import json
+import uuid
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, sessionmaker
+
+import app.main as api_main
+import sentinel.intelligence.evidence_analyzer as evidence_analyzer
+import sentinel.intelligence.rules as rules
+from app.main import app
+from scripts.reanalyze import reanalyze
+from sentinel.db import get_db_session
+from sentinel.intelligence.evidence_store import EvidenceStore
+from sentinel.models import Base, Contractor, EvidenceBlob, SubmissionEvent
+from sentinel.replay import replay_case
+
+PAGE = (
+    "<html><body><h1>Incident report</h1><p>Fake website and credential harvesting by "
+    "0x{0}{0} and 0x{1}{1}</p></body></html>".format("a" * 20, "b" * 20)
+)
+
+
+async def _fetch_page_async(*_):
+    return PAGE, True, ["Source reachable"]
+
+
+def _setup_client(tmp_path: Path):
+    db_file = tmp_path / "reanalysis.db"
+    engine = create_engine(f"sqlite:///{db_file}", future=True)
+    session_factory = sessionmaker(bind=engine, autoflush=False, autocommit=False, class_=Session)
+    Base.metadata.create_all(bind=engine)
+
+    def override_get_db_session():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db_session] = override_get_db_session
+    return TestClient(app), session_factory
+
+
+def _analysis_payloads(
+    db: Session, submission_id: str, event_type: str = "EVIDENCE_ANALYZED"
+) -> list[dict]:
+    return [
+        json.loads(payload)
+        for payload in db.scalars(
+            select(SubmissionEvent.event_payload_json)
+            .where(
+                SubmissionEvent.submission_id == submission_id,
+                SubmissionEvent.event_type == event_type,
+            )
+            .order_by(SubmissionEvent.seq)
+        )
+    ]
+
+
+def test_reanalyze_reruns_stale_rule_versions_from_cached_text(monkeypatch, tmp_path: Path):
+    client, session_factory = _setup_client(tmp_path)
+    monkeypatch.setattr(api_main, "EVIDENCE_DIR", tmp_path / "evidence")
+    store = EvidenceStore(tmp_path / "evidence")
+    monkeypatch.setattr(
+        evidence_analyzer,
+        "fetch_evidence_html",
+        lambda *_: (PAGE, True, ["Source reachable"]),
+    )
+    monkeypatch.setattr(evidence_analyzer, "fetch_evidence_html_async", _fetch_page_async)
+
+    with client:
+        case_id = client.post("/cases", json={"title": "Rules", "priority": "HIGH"}).json()[
+            "case_id"
+        ]
+        contractor_id = str(uuid.uuid4())
+        with session_factory() as db:
+            db.add(Contractor(contractor_id=contractor_id, handle="ct_rules"))
+            db.commit()
+
+        submission_ids = []
+        for fill in ("a", "b"):
+            response = client.post(
+                f"/cases/{case_id}/submit",
+                json={
+                    "contractor_id": contractor_id,
+                    "blockchain": "ETH",
+                    "address": "0x" + fill * 40,
+                    "scam_type": "Phishing",
+                    "source_url": "https://example.com/report",
+                    "confidence_score": 4,
+                },
+            )
+            submission_ids.append(response.json()["submission_id"])
+        client.post(
+            f"/submissions/{submission_ids[1]}/actions",
+            json={"action": "approve", "actor": "manager", "notes": ""},
+        )
+
+    def no_fetch(_url: str, _timeout=None):
+        raise AssertionError("re-analysis must use cached text")
+
+    monkeypatch.setattr(evidence_analyzer, "fetch_evidence_html", no_fetch)
+    with session_factory() as db:
+        # Same page for both submissions: stored once, referenced twice.
+        [blob] = db.scalars(select(EvidenceBlob)).all()
+        assert blob.refcount == 2
+        [initial] = _analysis_payloads(db, submission_ids[0])
+        assert initial["rule_version"] == rules.rule_set_version()
+        assert reanalyze(db, store=store, executor="serial")["stale"] == 0
+
+        monkeypatch.setitem(
+            rules.CLASSIFICATION_KEYWORDS,
+            "Phishing",
+            [*rules.CLASSIFICATION_KEYWORDS["Phishing"], "credential harvesting"],
+        )
+        assert reanalyze(db, store=store, executor="serial", dry_run=True)["reanalyzed"] == 0
+        report = reanalyze(db, store=store, executor="serial", batch_size=1)
+
+        assert report["rule_version"] == rules.rule_set_version() != initial["rule_version"]
+        # The approved submission is re-scored too, without leaving its review state.
+        assert (report["stale"], report["reanalyzed"], report["score_changes"]) == (2, 2, 2)
+        assert report["rules_evaluated"] == 2
+        for submission_id in submission_ids:
+            [rerun] = _analysis_payloads(db, submission_id, "EVIDENCE_REANALYZED")
+            assert rerun["rule_version"] == report["rule_version"]
+            assert rerun["evidence_text_hash"] == initial["evidence_text_hash"]
+            assert "Keyword matched: credential harvesting" in rerun["notes"]
+            assert rerun["evidence_score"] > initial["evidence_score"]
+        assert len(_analysis_payloads(db, submission_ids[1])) == 1
+        replayed = {sid: state.latest_event_type for sid, state in replay_case(db, case_id)}
+        assert replayed == {submission_ids[0]: "EVIDENCE_ANALYZED", submission_ids[1]: "APPROVED"}
+
+        assert reanalyze(db, store=store, executor="serial")["stale"] == 0
+
+    with client:
+        listed = client.get(f"/cases/{case_id}/submissions").json()
+        detail = client.get(f"/submissions/{submission_ids[1]}").json()
+    assert {item["submission_id"]: item["latest_event_type"] for item in listed} == replayed
+    assert detail["item"]["latest_event_type"] == "APPROVED"
+    assert detail["events"][-1]["event_type"] == "EVIDENCE_REANALYZED"
+
+    app.dependency_overrides.clear()
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import uuid
+from pathlib import Path
+
+from sqlalchemy import create_engine, func, update
+from sqlalchemy.orm import Session, sessionmaker
+
+from sentinel.hashing import canonical_json
+from sentinel.models import Base, Case, Contractor, Submission, SubmissionEvent, SubmissionSnapshot
+from sentinel.replay import replay_case
+from sentinel.schemas import derive_case_times
+from sentinel.snapshots import create_snapshots, load_submission_state, verify_snapshots
+
+
+def _session_factory(tmp_path: Path) -> sessionmaker[Session]:
+    engine = create_engine(f"sqlite:///{tmp_path / 'snapshots.db'}", future=True)
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine, autoflush=False, autocommit=False, class_=Session)
+
+
+def _seed_long_lived_submission(db: Session, actions: int) -> tuple[str, str]:
+    start, deadline = derive_case_times(None, None)
+    case = Case(title="Snapshots", priority="HIGH", start_time=start, deadline_time=deadline)
+    contractor = Contractor(contractor_id=str(uuid.uuid4()), handle="ct_snap")
+    db.add_all([case, contractor])
+    db.flush()
+    submission = Submission(
+        case_id=case.case_id,
+        contractor_id=contractor.contractor_id,
+        chain="ETH",
+        address="0x" + "ab" * 20,
+        scam_type="Phishing",
+        source_url="https://example.com/evidence",
+        confidence_score=4,
+        raw_payload_json=canonical_json({"seed": True}),
+        submission_hash="snapshot-hash",
+    )
+    db.add(submission)
+    db.flush()
+
+    event_types = ["INGESTED", "VALIDATED"] + [
+        ["APPROVED", "EXPORTED", "REJECTED", "ESCALATED"][i % 4] for i in range(actions)
+    ]
+    for event_type in event_types:
+        payload = {"passed": True, "duplicate_of": [], "conflict_with": []}
+        db.add(
+            SubmissionEvent(
+                submission_id=submission.submission_id,
+                event_type=event_type,
+                event_payload_json=canonical_json(payload if event_type == "VALIDATED" else {}),
+                actor="system",
+            )
+        )
+        db.flush()
+    db.commit()
+    return case.case_id, submission.submission_id
+
+
+def test_snapshot_resume_matches_full_replay(tmp_path: Path) -> None:
+    session_factory = _session_factory(tmp_path)
+
+    with session_factory() as db:
+        case_id, submission_id = _seed_long_lived_submission(db, actions=25)
+        assert create_snapshots(db, case_id, interval=10) == 1
+        assert create_snapshots(db, case_id, interval=10) == 0
+
+        db.add(
+            SubmissionEvent(
+                submission_id=submission_id,
+                event_type="REQUEST_MORE_EVIDENCE",
+                event_payload_json=canonical_json({}),
+                actor="manager",
+            )
+        )
+        db.commit()
+
+        resumed = load_submission_state(db, submission_id)
+        full = dict(replay_case(db, case_id))[submission_id]
+        assert resumed == full
+        assert resumed.needs_more_evidence is True
+        assert verify_snapshots(db, case_id) == []
+
+
+def test_verify_detects_tampered_snapshot(tmp_path: Path) -> None:
+    session_factory = _session_factory(tmp_path)
+
+    with session_factory() as db:
+        case_id, submission_id = _seed_long_lived_submission(db, actions=3)
+        create_snapshots(db, case_id, interval=1)
+        db.execute(
+            update(SubmissionSnapshot)
+            .where(SubmissionSnapshot.submission_id == submission_id)
+            .values(
+                state_json=func.replace(
+                    SubmissionSnapshot.state_json, '"approved":false', '"approved":true'
+                )
+            )
+        )
+        db.commit()
+
+        discrepancies = verify_snapshots(db, case_id)
+
+    assert [item["reason"] for item in discrepancies] == ["state_mismatch"]
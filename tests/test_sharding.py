@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from pathlib import Path
+
+import pytest
+from sqlalchemy import func, select
+
+import app.main as api_main
+import sentinel.sharding as sharding
+from app.main import app
+from scripts import rehash_submissions, replay_snapshots, verify_chain, verify_ledger
+from scripts.simulate_failure import _create_case, _seed_contractors, _setup_test_client
+from sentinel.intelligence import evidence_analyzer
+from sentinel.ledger import verify_case_chain
+from sentinel.models import Case, ShardRoute, Submission
+from sentinel.sharding import shard_for_case, shard_session_factory
+
+ADDRESS = "0x" + "ab" * 20
+
+
+def _page(*_):
+    return f"<html><body>Scam wallet {ADDRESS}</body></html>", True, []
+
+
+async def _page_async(*args):
+    return _page(*args)
+
+
+@pytest.fixture
+def sharded_client(monkeypatch, tmp_path: Path):
+    monkeypatch.setattr(sharding, "SHARD_MODE", "case")
+    monkeypatch.setattr(sharding, "SHARD_DIR", tmp_path / "shards")
+    monkeypatch.setattr(api_main, "EVIDENCE_DIR", tmp_path / "evidence")
+    monkeypatch.setattr(api_main, "EXPORT_DIR", tmp_path / "exports")
+    monkeypatch.setattr(evidence_analyzer, "fetch_evidence_html", _page)
+    monkeypatch.setattr(evidence_analyzer, "fetch_evidence_html_async", _page_async)
+    client, session_factory = _setup_test_client(tmp_path / "catalog.db")
+    with client:
+        yield client, session_factory
+    app.dependency_overrides.clear()
+    sharding.dispose_shard_engines()
+
+
+def _submit(client, case_id: str, contractor_id: str) -> str:
+    resp = client.post(
+        f"/cases/{case_id}/submit",
+        json={
+            "contractor_id": contractor_id,
+            "blockchain": "ETH",
+            "address": ADDRESS,
+            "scam_type": "Phishing",
+            "source_url": "https://example.com/evidence",
+            "confidence_score": 4,
+        },
+    )
+    assert resp.status_code == 200, resp.text
+    return resp.json()["submission_id"]
+
+
+def test_bucket_mode_hashes_cases_into_a_fixed_number_of_shards(monkeypatch):
+    monkeypatch.setattr(sharding, "SHARD_MODE", "bucket")
+    monkeypatch.setattr(sharding, "SHARD_BUCKETS", 4)
+    case_ids = [f"00000000-0000-0000-0000-{n:012d}" for n in range(64)]
+    shard_ids = {shard_for_case(case_id) for case_id in case_ids}
+    assert shard_ids == {"bucket-000", "bucket-001", "bucket-002", "bucket-003"}
+    assert shard_for_case(case_ids[0]) == shard_for_case(case_ids[0])
+
+    monkeypatch.setattr(sharding, "SHARD_MODE", "case")
+    assert shard_for_case(case_ids[0]) == f"case-{case_ids[0]}"
+
+
+def test_cases_live_in_their_own_shards_and_requests_are_routed(sharded_client, tmp_path: Path):
+    client, catalog_factory = sharded_client
+    [contractor_id] = _seed_contractors(catalog_factory, 1)
+    case_a = _create_case(client, title="Alpha")
+    case_b = _create_case(client, title="Bravo")
+    submission_a = _submit(client, case_a, contractor_id)
+    submission_b = _submit(client, case_b, contractor_id)
+
+    with catalog_factory() as catalog:
+        assert catalog.scalar(select(func.count()).select_from(Case)) == 0
+        routes = {(row.kind, row.key): row.shard_id for row in catalog.scalars(select(ShardRoute))}
+    assert routes[("case", case_a)] == routes[("submission", submission_a)] == f"case-{case_a}"
+    assert routes[("case", case_b)] == routes[("submission", submission_b)] == f"case-{case_b}"
+    for case_id, submission_id in ((case_a, submission_a), (case_b, submission_b)):
+        with shard_session_factory(f"case-{case_id}")() as shard:
+            assert list(shard.scalars(select(Submission.submission_id))) == [submission_id]
+            assert verify_case_chain(shard, case_id, full=True).ok
+    assert (tmp_path / "evidence" / "shards" / f"case-{case_a}").is_dir()
+
+    listed = client.get("/cases").json()
+    assert {case["case_id"] for case in listed} == {case_a, case_b}
+    [item] = client.get(f"/cases/{case_a}/submissions").json()
+    assert item["submission_id"] == submission_a
+    assert client.get(f"/submissions/{submission_b}").json()["item"]["case_id"] == case_b
+    addresses = client.get(f"/submissions/{submission_b}/evidence/addresses")
+    assert addresses.status_code == 200
+
+    action = client.post(
+        f"/submissions/{submission_a}/actions", json={"action": "approve", "actor": "mgr"}
+    )
+    assert action.status_code == 200
+    [record] = client.get(f"/cases/{case_a}/export").json()
+    assert record["submission_id"] == submission_a
+    job = client.post(f"/cases/{case_a}/exports", json={"format": "json"}).json()
+    assert client.get(f"/exports/{job['job_id']}").json()["status"] == "COMPLETED"
+    assert client.get(f"/exports/{job['job_id']}/download").status_code == 200
+    assert (tmp_path / "exports" / f"{job['job_id']}.json").is_file()
+
+    missing = "00000000-0000-0000-0000-000000000000"
+    assert client.get(f"/cases/{missing}/submissions").status_code == 404
+    assert client.get(f"/submissions/{missing}").status_code == 404
+
+
+def test_ingest_into_one_case_does_not_wait_for_another_case(sharded_client, tmp_path: Path):
+    client, catalog_factory = sharded_client
+    [contractor_id] = _seed_contractors(catalog_factory, 1)
+    busy_case = _create_case(client, title="Busy")
+    quiet_case = _create_case(client, title="Quiet")
+
+    # Hold the busy case's write lock for the whole submit to the other case.
+    holder = sqlite3.connect(tmp_path / "shards" / f"case-{busy_case}.db", isolation_level=None)
+    holder.execute("BEGIN IMMEDIATE")
+    try:
+        _submit(client, quiet_case, contractor_id)
+    finally:
+        holder.execute("ROLLBACK")
+        holder.close()
+    _submit(client, busy_case, contractor_id)
+
+
+def test_maintenance_scripts_cover_every_shard(sharded_client, tmp_path: Path, capsys):
+    client, catalog_factory = sharded_client
+    [contractor_id] = _seed_contractors(catalog_factory, 1)
+    case_ids = [_create_case(client, title=title) for title in ("Alpha", "Bravo")]
+    for case_id in case_ids:
+        _submit(client, case_id, contractor_id)
+    catalog_url = f"sqlite:///{tmp_path / 'catalog.db'}"
+
+    assert verify_chain.main(["--database-url", catalog_url, "verify", "--full"]) == 0
+    assert json.loads(capsys.readouterr().out)["cases"] == 2
+    assert replay_snapshots.main(["--database-url", catalog_url, "create"]) == 0
+    assert set(json.loads(capsys.readouterr().out)["created"]) == set(case_ids)
+    assert rehash_submissions.main(["--database-url", catalog_url, "--executor", "serial"]) == 0
+    assert json.loads(capsys.readouterr().out)["submissions"] == 2
+
+    report = verify_ledger.run_verification(catalog_url, workers=1)
+    assert (report["submissions"], report["ok"]) == (2, True)
+    assert {item["case_id"] for item in report["partition_reports"]} == set(case_ids)
+
+    resp = client.get(f"/cases/{case_ids[0]}/submissions", params={"reliability": "global"})
+    assert resp.status_code == 400
+    assert resp.json()["detail"] == "reliability_global_unsupported"
+    params = {"reliability": "case"}
+    assert client.get(f"/cases/{case_ids[0]}/submissions", params=params).status_code == 200
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+
+import app.main as api_main
+from app.main import app
+from scripts.simulate_failure import (
+    _create_case,
+    _seed_contractors,
+    _setup_test_client,
+    scenario_submission_burst,
+)
+from sentinel.db import make_engine
+from sentinel.intelligence import evidence_analyzer
+
+
+async def _unreachable_async(*_):
+    return "", False, ["Source unreachable"]
+
+
+def _pragmas(engine) -> dict[str, object]:
+    with engine.connect() as connection:
+        return {
+            name: connection.execute(text(f"PRAGMA {name}")).scalar()
+            for name in ("journal_mode", "synchronous", "cache_size", "temp_store", "busy_timeout")
+        }
+
+
+def test_profiles_are_applied_on_connect(tmp_path: Path):
+    wal = make_engine(f"sqlite:///{tmp_path / 'wal.db'}", "wal")
+    assert _pragmas(wal) == {
+        "journal_mode": "wal",
+        "synchronous": 1,
+        "cache_size": -65536,
+        "temp_store": 2,
+        "busy_timeout": 5000,
+    }
+    assert wal.pool.size() == 8
+
+    default = make_engine(f"sqlite:///{tmp_path / 'default.db'}", "default")
+    assert _pragmas(default)["journal_mode"] == "delete"
+    assert _pragmas(make_engine("sqlite://", "wal"))["journal_mode"] == "memory"
+
+    with pytest.raises(ValueError, match="unknown SQLite profile"):
+        make_engine(f"sqlite:///{tmp_path / 'x.db'}", "turbo")
+
+
+def test_submission_burst_runs_on_the_wal_profile(monkeypatch, tmp_path: Path):
+    monkeypatch.setattr(
+        evidence_analyzer, "fetch_evidence_html", lambda *_: ("", False, ["Source unreachable"])
+    )
+    monkeypatch.setattr(evidence_analyzer, "fetch_evidence_html_async", _unreachable_async)
+    monkeypatch.setattr(api_main, "EVIDENCE_DIR", tmp_path / "evidence")
+    client, session_factory = _setup_test_client(tmp_path / "burst.db", "wal")
+    with client:
+        contractors = _seed_contractors(session_factory, 5)
+        case_id = _create_case(client, title="WAL burst")
+        burst = scenario_submission_burst(client, case_id, contractors, 20)
+    app.dependency_overrides.clear()
+
+    assert burst.success_rate == 1.0
+    assert (tmp_path / "burst.db-wal").exists()
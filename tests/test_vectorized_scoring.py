@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import numpy as np
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from sentinel.scoring import (
+    TriageWeights,
+    compute_consensus_score,
+    compute_contractor_reliability,
+    compute_triage_priority,
+    consensus_scores,
+    contractor_reliabilities,
+    rank_by_priority,
+    triage_priorities,
+)
+
+_rows = st.lists(
+    st.tuples(
+        st.integers(0, 500),  # accepted
+        st.integers(0, 500),  # rejected
+        st.integers(0, 200),  # matching_same_label
+        st.integers(0, 200),  # extra submissions for the address
+        st.integers(1, 5),  # confidence_score
+    ),
+    min_size=1,
+    max_size=200,
+)
+_weights = st.tuples(
+    st.floats(0, 1, allow_nan=False),
+    st.floats(0, 1, allow_nan=False),
+    st.floats(0, 1, allow_nan=False),
+).map(lambda values: TriageWeights(*values))
+
+
+@settings(max_examples=200, deadline=None)
+@given(_rows, st.one_of(st.just(TriageWeights()), _weights))
+def test_vectorized_scores_equal_scalar_scores(rows, weights) -> None:
+    columns = (np.array(column) for column in zip(*rows, strict=True))
+    accepted, rejected, matching, extra, confidence = columns
+    total = matching + extra
+
+    reliability = contractor_reliabilities(accepted, rejected)
+    consensus = consensus_scores(matching, total)
+    priorities = triage_priorities(
+        contractor_reliability=reliability,
+        consensus_score=consensus,
+        confidence_score=confidence,
+        weights=weights,
+    )
+
+    for index, (a, r, m, e, c) in enumerate(rows):
+        expected_reliability = compute_contractor_reliability(a, r)
+        expected_consensus = compute_consensus_score(m, m + e)
+        assert reliability[index] == expected_reliability
+        assert consensus[index] == expected_consensus
+        assert priorities[index] == compute_triage_priority(
+            contractor_reliability=expected_reliability,
+            consensus_score=expected_consensus,
+            confidence_score=c,
+            weights=weights,
+        )
+
+
+def test_priority_rounding_matches_python_round_at_ties() -> None:
+    # Half-way values where np.round(x, 4) and round(x, 4) disagree (e.g. 0.12345).
+    ties = (2 * np.arange(20000) + 1) / 20000
+    priorities = triage_priorities(
+        contractor_reliability=ties / 0.4,
+        consensus_score=np.zeros_like(ties),
+        confidence_score=np.zeros(ties.shape, dtype=int),
+        weights=TriageWeights(reliability=0.4, consensus=0.0, confidence=0.0),
+    )
+    expected = [round(0.4 * (value / 0.4) + 0.0 + 0.0, 4) for value in ties.tolist()]
+    assert priorities.tolist() == expected
+    assert np.round(ties, 4).tolist() != [round(value, 4) for value in ties.tolist()]
+
+
+def test_rank_by_priority_is_descending_and_stable() -> None:
+    order = rank_by_priority([0.2, 0.9, 0.2, 0.5])
+    assert order.tolist() == [1, 3, 0, 2]
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import json
+import uuid
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, desc, select, update
+from sqlalchemy.orm import Session, sessionmaker
+
+import scripts.verify_ledger as verify_ledger
+from app.main import app
+from sentinel.db import get_db_session
+from sentinel.models import Base, Contractor, Submission, SubmissionEvent, SubmissionSnapshot
+from sentinel.snapshots import create_snapshots
+
+
+def _populate(db_file: Path) -> tuple[sessionmaker[Session], list[str]]:
+    engine = create_engine(f"sqlite:///{db_file}", future=True)
+    session_factory = sessionmaker(bind=engine, autoflush=False, autocommit=False, class_=Session)
+    Base.metadata.create_all(bind=engine)
+
+    def override_get_db_session():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db_session] = override_get_db_session
+    case_ids = []
+    with TestClient(app) as client:
+        contractor_id = str(uuid.uuid4())
+        with session_factory() as db:
+            db.add(Contractor(contractor_id=contractor_id, handle="ct_verify"))
+            db.commit()
+        for case_index in range(2):
+            case_id = client.post("/cases", json={"title": f"Verify {case_index}"}).json()[
+                "case_id"
+            ]
+            case_ids.append(case_id)
+            for i in range(5):
+                submission_id = client.post(
+                    f"/cases/{case_id}/submit",
+                    json={
+                        "contractor_id": contractor_id,
+                        "blockchain": "ETH",
+                        "address": "0x" + f"{i % 3 + 1:040x}",
+                        "scam_type": ["Phishing", "Rugpull"][i % 2],
+                        "source_url": "https://example.com/evidence",
+                        "confidence_score": 2,
+                    },
+                ).json()["submission_id"]
+                if i % 2 == 0:
+                    client.post(f"/submissions/{submission_id}/actions", json={"action": "approve"})
+    app.dependency_overrides.clear()
+    return session_factory, case_ids
+
+
+def test_verify_ledger_clean_database_across_partitions(tmp_path: Path) -> None:
+    db_file = tmp_path / "ledger.db"
+    session_factory, case_ids = _populate(db_file)
+    with session_factory() as db:
+        create_snapshots(db, case_ids[0], interval=1)
+
+    report = verify_ledger.run_verification(f"sqlite:///{db_file}", workers=2, partition_size=2)
+
+    assert report["ok"] is True, report["discrepancies"]
+    assert report["submissions"] == 10
+    assert report["partitions"] == 6
+    assert report["events"] >= 30
+
+
+def test_verify_ledger_reports_hash_tampering(tmp_path: Path) -> None:
+    db_file = tmp_path / "ledger.db"
+    session_factory, _ = _populate(db_file)
+    with session_factory() as db:
+        tampered_id = db.scalar(
+            select(Submission.submission_id).order_by(Submission.submission_id).limit(1)
+        )
+        db.execute(
+            update(Submission)
+            .where(Submission.submission_id == tampered_id)
+            .values(raw_payload_json='{"tampered":true}')
+        )
+        db.commit()
+
+    report = verify_ledger.run_verification(f"sqlite:///{db_file}", workers=2)
+
+    assert report["ok"] is False
+    assert [(item["submission_id"], item["check"]) for item in report["discrepancies"]] == [
+        (tampered_id, "submission_hash")
+    ]
+
+
+def test_verify_ledger_reports_a_snapshot_that_disagrees_with_replay(tmp_path: Path) -> None:
+    db_file = tmp_path / "ledger.db"
+    session_factory, case_ids = _populate(db_file)
+    with session_factory() as db:
+        create_snapshots(db, case_ids[0], interval=1)
+        snapshot = db.scalars(
+            select(SubmissionSnapshot).order_by(desc(SubmissionSnapshot.event_sequence))
+        ).first()
+        state = json.loads(snapshot.state_json)
+        snapshot.state_json = json.dumps({**state, "approved": not state["approved"]})
+        tampered_id = snapshot.submission_id
+        db.commit()
+
+    report = verify_ledger.run_verification(f"sqlite:///{db_file}", workers=2)
+
+    assert [(item["submission_id"], item["check"]) for item in report["discrepancies"]] == [
+        (tampered_id, "snapshot")
+    ]
+
+
+def test_verify_ledger_reports_undecodable_rows_and_finishes(tmp_path: Path) -> None:
+    db_file = tmp_path / "ledger.db"
+    session_factory, _ = _populate(db_file)
+    with session_factory() as db:
+        broken_payload, broken_event = db.scalars(
+            select(Submission.submission_id).order_by(Submission.submission_id).limit(2)
+        ).all()
+        db.execute(
+            update(Submission)
+            .where(Submission.submission_id == broken_payload)
+            .values(raw_payload_json="{not json")
+        )
+        db.execute(
+            update(SubmissionEvent)
+            .where(
+                SubmissionEvent.submission_id == broken_event,
+                SubmissionEvent.event_type == "VALIDATED",
+            )
+            .values(event_payload_json="[truncated")
+        )
+        db.commit()
+
+    report = verify_ledger.run_verification(f"sqlite:///{db_file}", workers=2)
+
+    assert report["submissions"] == 10
+    issues = {(item["submission_id"], item["check"]): item for item in report["discrepancies"]}
+    assert set(issues) == {(broken_payload, "submission_hash"), (broken_event, "replay")}
+    assert issues[(broken_payload, "submission_hash")]["error"].startswith("JSONDecodeError")
+    assert issues[(broken_event, "replay")]["error"].startswith("JSONDecodeError")
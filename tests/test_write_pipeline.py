@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, sessionmaker
+
+import sentinel.write_pipeline as write_pipeline
+from app.main import app
+from scripts.simulate_failure import (
+    _create_case,
+    _seed_contractors,
+    _setup_test_client,
+    scenario_parallel_conflicts,
+)
+from sentinel.ledger import verify_case_chain
+from sentinel.models import Base, Contractor
+from sentinel.write_pipeline import WritePipeline, writer_engine
+
+
+@pytest.fixture
+def pipeline(tmp_path: Path):
+    engine = writer_engine(f"sqlite:///{tmp_path / 'writer.db'}")
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine, autoflush=False, autocommit=False, class_=Session)
+    pipeline = WritePipeline(session_factory, max_batch=32, max_wait=0.05)
+    yield pipeline, session_factory
+    pipeline.close()
+
+
+def _add_contractor(handle: str, fail: bool = False):
+    def work(session: Session) -> str:
+        contractor_id = str(uuid.uuid4())
+        session.add(Contractor(contractor_id=contractor_id, handle=handle))
+        session.flush()
+        if fail:
+            raise ValueError(handle)
+        return contractor_id
+
+    return work
+
+
+def test_concurrent_jobs_are_group_committed(pipeline):
+    pipeline, session_factory = pipeline
+    start = threading.Barrier(16)
+
+    def submit(index: int) -> str:
+        start.wait()
+        return pipeline.submit(_add_contractor(f"ct_{index}"))
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        contractor_ids = list(executor.map(submit, range(16)))
+
+    assert len(set(contractor_ids)) == 16
+    with session_factory() as db:
+        assert db.scalar(select(func.count()).select_from(Contractor)) == 16
+    stats = pipeline.stats.snapshot()
+    assert stats["jobs"] == 16
+    assert stats["batches"] < 16
+    assert stats["max_batch_size"] > 1
+
+
+def test_failing_job_is_rolled_back_without_affecting_its_batch(pipeline):
+    pipeline, session_factory = pipeline
+    start = threading.Barrier(3)
+    jobs = [_add_contractor("ct_a"), _add_contractor("ct_bad", fail=True), _add_contractor("ct_b")]
+
+    def submit(work):
+        start.wait()
+        try:
+            return pipeline.submit(work)
+        except ValueError as exc:
+            return exc
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        outcomes = list(executor.map(submit, jobs))
+
+    assert isinstance(outcomes[1], ValueError)
+    with session_factory() as db:
+        handles = set(db.scalars(select(Contractor.handle)))
+    assert handles == {"ct_a", "ct_b"}
+    assert pipeline.stats.snapshot()["failed_jobs"] == 1
+
+
+def test_api_writes_through_the_pipeline_keep_ledger_and_conflicts_intact(
+    monkeypatch, tmp_path: Path
+):
+    monkeypatch.setattr(write_pipeline, "WRITE_PIPELINE_ENABLED", True)
+    client, session_factory = _setup_test_client(tmp_path / "pipeline.db")
+    with client:
+        contractors = _seed_contractors(session_factory, 4)
+        case_id = _create_case(client, title="Pipeline")
+        metrics = scenario_parallel_conflicts(
+            client, session_factory, case_id, contractors, n=12, threads=4
+        )
+        body = client.get("/metrics/write-pipeline").json()
+    app.dependency_overrides.clear()
+
+    assert metrics.details["missed_duplicates"] == 0
+    assert metrics.details["missed_conflicts"] == 0
+    assert body["enabled"] is True
+    [stats] = body["pipelines"].values()
+    assert stats["jobs"] >= 12 and stats["failed_jobs"] == 0
+    with session_factory() as db:
+        assert verify_case_chain(db, case_id, full=True).ok